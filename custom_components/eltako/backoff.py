@@ -0,0 +1,25 @@
+"""Exponential back-off for reconnecting gateways."""
+
+
+class ExponentialBackoff:
+    """Returns increasing delays for consecutive attempts until it is reset.
+
+    The delay starts with the initial value and is multiplied by the factor for
+    every attempt until it reaches the maximum.
+    """
+
+    def __init__(self, initial: float, maximum: float, factor: float = 2.0):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.attempts: int = 0
+
+    def next_delay(self) -> float:
+        """Return the delay in seconds before the next attempt."""
+        delay = min(self.initial * self.factor ** self.attempts, self.maximum)
+        self.attempts += 1
+        return delay
+
+    def reset(self) -> None:
+        """Start again with the initial delay, e.g. after a successful connection."""
+        self.attempts = 0
@@ -19,6 +19,7 @@ from .schema import CONF_EEP_SUPPORTED_BINARY_SENSOR
 from . import config_helpers, get_gateway_from_hass, get_device_config_for_gateway
 
 import json
+import logging
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,60 +28,59 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Binary Sensor platform for Eltako."""
     gateway: EnOceanGateway = get_gateway_from_hass(hass, config_entry)
-    config: ConfigType = get_device_config_for_gateway(hass, config_entry, gateway)
     
     entities: list[EltakoEntity] = []
     
     platform = Platform.BINARY_SENSOR
 
     for platform_id in [Platform.BINARY_SENSOR, Platform.SENSOR]:
-        if platform_id in config:
-            for entity_config in config[platform_id]:
-                try:
-                    dev_conf = config_helpers.DeviceConf(entity_config, [CONF_DEVICE_CLASS, CONF_INVERT_SIGNAL])
-                    if dev_conf.eep.eep_string in CONF_EEP_SUPPORTED_BINARY_SENSOR:
-                        if dev_conf.eep == A5_30_03:
-                            name = "Digital Input 0"
-                            entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
-                                                                dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
-                                                                EntityDescription(key="0", name=name) ))
-                            name = "Digital Input 1"
-                            entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
-                                                                dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
-                                                                EntityDescription(key="1", name=name) ))
-                            name = "Digital Input 2"
-                            entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
-                                                                dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
-                                                                EntityDescription(key="2", name=name) ))
-                            name = "Digital Input 3"
-                            entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
-                                                                dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
-                                                                EntityDescription(key="3", name=name) ))
-                            name = "Status of Wake"
-                            entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
-                                                                dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
-                                                                EntityDescription(key="wake", name=name) ))
-                        elif dev_conf.eep == A5_30_01:
-                            name = "Digital Input"
-                            entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
-                                                                dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
-                                                                EntityDescription(key="0", name=name) ))
-                            name = "Low Battery"
-                            entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
-                                                                dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
-                                                                EntityDescription(key="low_battery", name=name) ))
-                        else:
-                            entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, 
-                                                                dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL)))
-
-                except Exception as e:
-                    LOGGER.warning("[%s] Could not load configuration for platform_id %s", platform, platform_id)
-                    LOGGER.critical(e, exc_info=True)
+        for device in gateway.device_index.get_platform_entries(platform_id):
+            try:
+                dev_conf = device.config
+                if dev_conf.eep.eep_string in CONF_EEP_SUPPORTED_BINARY_SENSOR:
+                    if dev_conf.eep == A5_30_03:
+                        name = "Digital Input 0"
+                        entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
+                                                            dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
+                                                            EntityDescription(key="0", name=name) ))
+                        name = "Digital Input 1"
+                        entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
+                                                            dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
+                                                            EntityDescription(key="1", name=name) ))
+                        name = "Digital Input 2"
+                        entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
+                                                            dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
+                                                            EntityDescription(key="2", name=name) ))
+                        name = "Digital Input 3"
+                        entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
+                                                            dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
+                                                            EntityDescription(key="3", name=name) ))
+                        name = "Status of Wake"
+                        entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
+                                                            dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
+                                                            EntityDescription(key="wake", name=name) ))
+                    elif dev_conf.eep == A5_30_01:
+                        name = "Digital Input"
+                        entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
+                                                            dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
+                                                            EntityDescription(key="0", name=name) ))
+                        name = "Low Battery"
+                        entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, name, dev_conf.eep, 
+                                                            dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL),
+                                                            EntityDescription(key="low_battery", name=name) ))
+                    else:
+                        entities.append(EltakoBinarySensor(platform_id, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, 
+                                                            dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_INVERT_SIGNAL)))
+
+            except Exception as e:
+                LOGGER.warning("[%s] Could not load configuration for platform_id %s", platform, platform_id)
+                LOGGER.critical(e, exc_info=True)
 
     # is connection active sensor for gateway (serial connection)
     entities.append(GatewayConnectionState(platform, gateway))
 
     # dev_id validation not possible because there can be bus sensors as well as decentralized sensors.
+    restore_last_states(hass, entities, platform)
     log_entities_to_be_added(entities, platform)
     async_add_entities(entities)
 
@@ -129,6 +129,10 @@ class EltakoBinarySensor(AbstractBinarySensor):
 
         super().__init__(platform, gateway, dev_id, dev_name, dev_eep, self._channel)
         self.invert_signal = invert_signal
+
+        # formatted address and event types per sender address, computed once instead of for every telegram
+        self._event_types: dict[bytes, tuple[str, str, str]] = {}
+        self._get_event_types(self.dev_id[0])
         self._attr_device_class = device_class
 
         if device_class is None or device_class == '':
@@ -141,6 +145,17 @@ class EltakoBinarySensor(AbstractBinarySensor):
                 self._attr_device_class = BinarySensorDeviceClass.WINDOW
             
 
+    def _get_event_types(self, address: bytes) -> tuple[str, str, str]:
+        """Return formatted sender address and event types for pressed buttons and closed contacts."""
+        event_types = self._event_types.get(address)
+        if event_types is None:
+            sender_id = AddressExpression((address, None))
+            event_types = (config_helpers.format_address(sender_id),
+                           config_helpers.get_bus_event_type(self.gateway.dev_id, EVENT_BUTTON_PRESSED, sender_id),
+                           config_helpers.get_bus_event_type(self.gateway.base_id, EVENT_CONTACT_CLOSED, sender_id))
+            self._event_types[address] = event_types
+        return event_types
+
     def value_changed(self, msg: ESP2Message):
         """Fire an event with the data that have changed.
 
@@ -155,8 +170,9 @@ class EltakoBinarySensor(AbstractBinarySensor):
         """
         
         try:
-            decoded = self.dev_eep.decode_message(msg)
-            LOGGER.debug("decoded : %s", json.dumps(decoded.__dict__))
+            decoded = self.decode_message(msg)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("decoded : %s", json.dumps(decoded.__dict__))
             # LOGGER.debug("msg : %s, data: %s", type(msg), msg.data)
         except Exception as e:
             LOGGER.warning("[%s %s] Could not decode message for eep %s does not fit to message type %s (org %s)", 
@@ -197,8 +213,7 @@ class EltakoBinarySensor(AbstractBinarySensor):
                 pass
 
             # fire first event for the entire switch
-            switch_address = config_helpers.format_address((msg.address, None))
-            event_id = config_helpers.get_bus_event_type(self.gateway.dev_id, EVENT_BUTTON_PRESSED, AddressExpression((msg.address, None)))
+            switch_address, event_id, _ = self._get_event_types(msg.address)
             event_data = {
                     "id": event_id,
                     "data": int.from_bytes(msg.data, "big"),
@@ -210,11 +225,11 @@ class EltakoBinarySensor(AbstractBinarySensor):
                     "rocker_second_action": decoded.rocker_second_action,
                 }
             
-            LOGGER.debug("[%s %s] Send event: %s, pressed_buttons: '%s'", Platform.BINARY_SENSOR, str(self.dev_id), event_id, json.dumps(pressed_buttons))
+            LOGGER.debug("[%s %s] Send event: %s, pressed_buttons: '%s'", Platform.BINARY_SENSOR, self.dev_id, event_id, pressed_buttons)
             self.hass.bus.fire(event_id, event_data)
 
             # fire second event for a specific buttons pushed on the swtich
-            event_id = config_helpers.get_bus_event_type(self.gateway.dev_id, EVENT_BUTTON_PRESSED, AddressExpression((msg.address, None)), '-'.join(pressed_buttons))
+            event_id = config_helpers.add_bus_event_data(event_id, '-'.join(pressed_buttons))
             event_data = {
                     "id": event_id,
                     "data": int.from_bytes(msg.data, "big"),
@@ -225,7 +240,7 @@ class EltakoBinarySensor(AbstractBinarySensor):
                     "rocker_first_action": decoded.rocker_first_action,
                     "rocker_second_action": decoded.rocker_second_action,
                 }
-            LOGGER.debug("[%s %s] Send event: %s, pressed_buttons: '%s'", Platform.BINARY_SENSOR, str(self.dev_id), event_id, json.dumps(pressed_buttons))
+            LOGGER.debug("[%s %s] Send event: %s, pressed_buttons: '%s'", Platform.BINARY_SENSOR, self.dev_id, event_id, pressed_buttons)
             self.hass.bus.fire(event_id, event_data)
 
             # Show status change in HA. It will only for the moment when the button is pushed down.
@@ -240,15 +255,14 @@ class EltakoBinarySensor(AbstractBinarySensor):
         elif self.dev_eep in [F6_01_01]:
 
             # fire event
-            switch_address = config_helpers.format_address((msg.address, None))
-            event_id = config_helpers.get_bus_event_type(self.gateway.dev_id, EVENT_BUTTON_PRESSED, AddressExpression((msg.address, None)))
+            switch_address, event_id, _ = self._get_event_types(msg.address)
             event_data = {
                     "id": event_id,
                     "data": int.from_bytes(msg.data, "big"),
                     "switch_address": switch_address,
                     "pressed": decoded.button_pushed,
                 }
-            LOGGER.debug("[%s %s] Send event: %s, pushed down: %s", Platform.BINARY_SENSOR, str(self.dev_id), event_id, str(decoded.button_pushed))
+            LOGGER.debug("[%s %s] Send event: %s, pushed down: %s", Platform.BINARY_SENSOR, self.dev_id, event_id, decoded.button_pushed)
             self.hass.bus.fire(event_id, event_data)
             
             # Show status change in HA. It will only for the moment when the button is pushed down.
@@ -336,8 +350,7 @@ class EltakoBinarySensor(AbstractBinarySensor):
 
         if self.is_on:
             LOGGER.debug("Fire event for binary sensor.")
-            switch_address = config_helpers.format_address((msg.address, None))
-            event_id = config_helpers.get_bus_event_type(self.gateway.base_id, EVENT_CONTACT_CLOSED, AddressExpression((msg.address, None)))
+            switch_address, _, event_id = self._get_event_types(msg.address)
             self.hass.bus.fire(
                 event_id,
                 {
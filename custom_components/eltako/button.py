@@ -39,7 +39,6 @@ async def async_setup_entry(
 ) -> None:
     """Set up an Eltako buttons."""
     gateway: EnOceanGateway = get_gateway_from_hass(hass, config_entry)
-    config: ConfigType = get_device_config_for_gateway(hass, config_entry, gateway)
 
     entities: list[EltakoEntity] = []
     
@@ -51,19 +50,17 @@ async def async_setup_entry(
     
     else:
         # check for temperature controller defined in config as temperature sensor or climate controller
-        for platform_id in PLATFORMS:
-            if platform_id in config: 
-                for entity_config in config[platform_id]:
-                    if CONF_SENDER in entity_config:
-                        try:
-                            dev_config = config_helpers.DeviceConf(entity_config)
-                            sender_config = config_helpers.get_device_conf(entity_config, CONF_SENDER)
-
-                            if sender_config.eep in EEP_WITH_TEACH_IN_BUTTONS.keys():
-                                entities.append(TeachInButton(platform, gateway, dev_config.id, dev_config.name, dev_config.eep, sender_config.id, sender_config.eep))
-                        except Exception as e:
-                            LOGGER.warning("[%s] Could not load configuration", platform)
-                            LOGGER.critical(e, exc_info=True)
+        for device in gateway.device_index.get_all_entries():
+            if device.sender is not None:
+                try:
+                    dev_config = device.config
+                    sender_config = device.sender
+
+                    if sender_config.eep in EEP_WITH_TEACH_IN_BUTTONS.keys():
+                        entities.append(TeachInButton(platform, gateway, dev_config.id, dev_config.name, dev_config.eep, sender_config.id, sender_config.eep))
+                except Exception as e:
+                    LOGGER.warning("[%s] Could not load configuration", platform)
+                    LOGGER.critical(e, exc_info=True)
 
     # add reconnect button for gateway
     entities.append(GatewayReconnectButton(platform, gateway))
@@ -105,7 +102,7 @@ class TeachInButton(AbstractButton):
 
         controller_address, _ = self.sender_id
         msg = Regular4BSMessage(address=controller_address, data=EEP_WITH_TEACH_IN_BUTTONS[self.sender_eep], outgoing=True, status=0x80)
-        self.send_message(msg)
+        self.send_message(msg, SendPriority.TEACH_IN)
 
 class GatewayReconnectButton(AbstractButton):
     """Button for reconnecting serial bus"""
@@ -133,4 +130,4 @@ class GatewayReconnectButton(AbstractButton):
 
     async def async_press(self) -> None:
         """Reconnect serial bus"""
-        self.gateway.reconnect()
+        await self.gateway.async_reconnect()
@@ -1,7 +1,6 @@
 """Support for Eltako Temperature Control sources."""
 from __future__ import annotations
 
-import asyncio
 import time
 
 from eltakobus.util import AddressExpression
@@ -33,49 +32,50 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Eltako Temperature Control platform."""
     gateway: EnOceanGateway = get_gateway_from_hass(hass, config_entry)
-    config: ConfigType = get_device_config_for_gateway(hass, config_entry, gateway)
+    config: ConfigType = gateway.device_index.device_config
 
     entities: list[EltakoEntity] = []
     
     platform = Platform.CLIMATE
-    if platform in config:
-        for entity_config in config[platform]:
+    for device in gateway.device_index.get_platform_entries(platform):
+        entity_config = device.raw
             
-            try:
-                dev_conf = DeviceConf(entity_config, [CONF_TEMPERATURE_UNIT, CONF_MAX_TARGET_TEMPERATURE, CONF_MIN_TARGET_TEMPERATURE])
-                sender = config_helpers.get_device_conf(entity_config, CONF_SENDER)
-                thermostat = config_helpers.get_device_conf(entity_config, CONF_ROOM_THERMOSTAT)
-
-                cooling_switch = None
-                cooling_sender = None
-                if CONF_COOLING_MODE in config.keys():
-                    LOGGER.debug("[Climate] Read cooling switch config")
-                    cooling_switch = config_helpers.get_device_conf(entity_config.get(CONF_COOLING_MODE), CONF_SENSOR [CONF_SWITCH_BUTTON])
-                    LOGGER.debug("[Climate] Read cooling sender config")
-                    cooling_sender = config_helpers.get_device_conf(entity_config.get(CONF_COOLING_MODE), CONF_SENDER)
-
-                if dev_conf.eep in [A5_10_06]:
-                    ###### This way it is decouple from the order how devices will be loaded.
-                    climate_entity = ClimateController(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, 
-                                                       sender.id, sender.eep, 
-                                                       dev_conf.get(CONF_TEMPERATURE_UNIT), 
-                                                       dev_conf.get(CONF_MIN_TARGET_TEMPERATURE), dev_conf.get(CONF_MAX_TARGET_TEMPERATURE), 
-                                                       thermostat, cooling_switch, cooling_sender)
-                    entities.append(climate_entity)
-
-                    # subscribe for cooling switch events
-                    if cooling_switch is not None:
-                        event_id = config_helpers.get_bus_event_type(gateway.base_id, EVENT_BUTTON_PRESSED, cooling_switch.id, 
-                                                                     config_helpers.convert_button_pos_from_hex_to_str(cooling_switch.get(CONF_SWITCH_BUTTON)))
-                        LOGGER.debug(f"Subscribe for listening to cooling switch events: {event_id}")
-                        hass.bus.async_listen(event_id, climate_entity.async_handle_event)
-
-            except Exception as e:
-                LOGGER.warning("[%s] Could not load configuration", platform)
-                LOGGER.critical(e, exc_info=True)
-                continue
+        try:
+            dev_conf = device.config
+            sender = device.sender
+            thermostat = config_helpers.get_device_conf(entity_config, CONF_ROOM_THERMOSTAT)
+
+            cooling_switch = None
+            cooling_sender = None
+            if CONF_COOLING_MODE in config.keys():
+                LOGGER.debug("[Climate] Read cooling switch config")
+                cooling_switch = config_helpers.get_device_conf(entity_config.get(CONF_COOLING_MODE), CONF_SENSOR [CONF_SWITCH_BUTTON])
+                LOGGER.debug("[Climate] Read cooling sender config")
+                cooling_sender = config_helpers.get_device_conf(entity_config.get(CONF_COOLING_MODE), CONF_SENDER)
+
+            if dev_conf.eep in [A5_10_06]:
+                ###### This way it is decouple from the order how devices will be loaded.
+                climate_entity = ClimateController(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, 
+                                                   sender.id, sender.eep, 
+                                                   dev_conf.get(CONF_TEMPERATURE_UNIT), 
+                                                   dev_conf.get(CONF_MIN_TARGET_TEMPERATURE), dev_conf.get(CONF_MAX_TARGET_TEMPERATURE), 
+                                                   thermostat, cooling_switch, cooling_sender)
+                entities.append(climate_entity)
+
+                # subscribe for cooling switch events
+                if cooling_switch is not None:
+                    event_id = config_helpers.get_bus_event_type(gateway.base_id, EVENT_BUTTON_PRESSED, cooling_switch.id, 
+                                                                 config_helpers.convert_button_pos_from_hex_to_str(cooling_switch.get(CONF_SWITCH_BUTTON)))
+                    LOGGER.debug(f"Subscribe for listening to cooling switch events: {event_id}")
+                    hass.bus.async_listen(event_id, climate_entity.async_handle_event)
+
+        except Exception as e:
+            LOGGER.warning("[%s] Could not load configuration", platform)
+            LOGGER.critical(e, exc_info=True)
+            continue
 
     validate_actuators_dev_and_sender_id(entities)
+    restore_last_states(hass, entities, platform)
     log_entities_to_be_added(entities, platform)
     async_add_entities(entities)
 
@@ -139,8 +139,16 @@ class ClimateController(EltakoEntity, ClimateEntity, RestoreEntity):
         self._attr_max_temp = max_temp
         self._attr_min_temp = min_temp
 
-        self._loop = asyncio.get_event_loop()
-        self._update_task = asyncio.ensure_future(self._wrapped_update(), loop=self._loop)
+
+    async def async_added_to_hass(self) -> None:
+        """Register periodic status updates at the scheduler of the gateway."""
+        await super().async_added_to_hass()
+
+        # amount of telegrams sent per update
+        weight = (1 if self.cooling_switch and self.cooling_sender else 0) + (1 if self.thermostat is None else 0)
+        self.async_on_remove(
+            self.gateway.periodic_scheduler.register(self._async_periodic_update, self._update_frequency, weight)
+        )
 
 
     def load_value_initially(self, latest_state:State):
@@ -175,25 +183,17 @@ class ClimateController(EltakoEntity, ClimateEntity, RestoreEntity):
         LOGGER.debug(f"[climate {self.dev_id}] value initially loaded: [state: {self.state}, modes: [{self.hvac_modes}], current temp: {self.current_temperature}, target temp: {self.target_temperature}]")
 
 
-    async def _wrapped_update(self, *args) -> None:
-        while True:    
-            try:
-                # LOGGER.debug(f"[climate {self.dev_id}] Wait {self._update_frequency}s for next status update.")
-                await asyncio.sleep(self._update_frequency)
-                
-                # fakes physical switch and sends frequently in cooling state.
-                if self.cooling_switch:
-                    await self._async_check_if_cooling_is_activated()
-                    
-                    await self._async_send_mode_cooling()
-
-                # send frequently status update if not connected with thermostat. 
-                if self.thermostat is None:
-                    await self._async_send_command(self._actuator_mode, self.target_temperature)
-                
-            except Exception as e:
-                LOGGER.exception(e)
-                # FIXME should I just restart with back-off?
+    async def _async_periodic_update(self) -> None:
+        """Called by the periodic scheduler of the gateway every update interval."""
+        # fakes physical switch and sends frequently in cooling state.
+        if self.cooling_switch:
+            await self._async_check_if_cooling_is_activated()
+            
+            await self._async_send_mode_cooling()
+
+        # send frequently status update if not connected with thermostat. 
+        if self.thermostat is None:
+            await self._async_send_command(self._actuator_mode, self.target_temperature, SendPriority.PERIODIC)
 
     
     async def async_handle_event(self, call):
@@ -242,17 +242,17 @@ class ClimateController(EltakoEntity, ClimateEntity, RestoreEntity):
             LOGGER.debug(f"[climate {self.dev_id}] default state of actor was not yet transferred.")
 
 
-    async def _async_send_command(self, mode: A5_10_06.Heater_Mode, target_temp: float) -> None:
+    async def _async_send_command(self, mode: A5_10_06.Heater_Mode, target_temp: float, priority: SendPriority=None) -> None:
         """Send command to set target temperature."""
-        self._send_command(mode, target_temp)
+        self._send_command(mode, target_temp, priority)
 
-    def _send_command(self, mode: A5_10_06.Heater_Mode, target_temp: float) -> None:
+    def _send_command(self, mode: A5_10_06.Heater_Mode, target_temp: float, priority: SendPriority=None) -> None:
         """Send command to set target temperature."""
         address, _ = self._sender_id
         if self.current_temperature and self.target_temperature:
             LOGGER.debug(f"[climate {self.dev_id}] Send status update: current temp: {target_temp}, mode: {mode}")
             msg = A5_10_06(mode, target_temp, self.current_temperature, self.hvac_action == HVACAction.IDLE).encode_message(address)
-            self.send_message(msg)
+            self.send_message(msg, priority)
         else:
             LOGGER.debug(f"[climate {self.dev_id}] Either no current or target temperature is set. Waiting for status update.")
             #This is always the case when there was no sensor signal after HA started.
@@ -286,7 +286,7 @@ class ClimateController(EltakoEntity, ClimateEntity, RestoreEntity):
         """fake physical switch and send cooling status."""
         if self.cooling_sender:
             LOGGER.debug(f"[climate {self.dev_id}] Send command for cooling")
-            self.send_message(RPSMessage(self.cooling_sender.id[0], 0x30, b'\x50', True))
+            self.send_message(RPSMessage(self.cooling_sender.id[0], 0x30, b'\x50', True), SendPriority.PERIODIC)
 
 
     def _get_mode(self) -> HVACMode:
@@ -340,7 +340,7 @@ class ClimateController(EltakoEntity, ClimateEntity, RestoreEntity):
     def change_temperature_values(self, msg: ESP2Message) -> None:
         try:
             if  msg.org == 0x07:
-                decoded = self.dev_eep.decode_message(msg)
+                decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning(f"[climate {self.dev_id}] Could not decode message: %s", str(e))
             return
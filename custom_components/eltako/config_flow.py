@@ -53,8 +53,9 @@ class EltakoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         # get configuration for debug purpose
-        config = await config_helpers.async_get_home_assistant_config(self.hass, CONFIG_SCHEMA)
-        LOGGER.debug(f"Config: {config}\n")
+        # read configuration.yaml again because gateways could have been added in the meantime
+        config = await config_helpers.async_get_home_assistant_config(self.hass, CONFIG_SCHEMA, refresh=user_input is None)
+        LOGGER.debug("Config: %s\n", config)
 
         # ensure data entry is set
         if DATA_ELTAKO not in self.hass.data:
@@ -131,8 +132,11 @@ class EltakoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 baud_rate = gateway.BAUD_RATE_DEVICE_TYPE_MAPPING[gdc]
                 break
         
+        # simulated bus doesn't need any port
+        if GatewayDeviceType.SIMULATOR in gateway_selection:
+            return True
         # check ip address for esp3 over tcp
-        if GatewayDeviceType.LAN in gateway_selection:
+        elif GatewayDeviceType.LAN in gateway_selection:
             try:
                 ip = ipaddress.ip_address(serial_path)
                 return True
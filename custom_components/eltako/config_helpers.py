@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 from homeassistant.helpers.reload import async_integration_yaml_config
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
@@ -12,7 +15,11 @@ from .const import *
 DEFAULT_GENERAL_SETTINGS = {
     CONF_FAST_STATUS_CHANGE: False,
     CONF_SHOW_DEV_ID_IN_DEV_NAME: False,
-    CONF_ENABLE_TEACH_IN_BUTTONS: False
+    CONF_ENABLE_TEACH_IN_BUTTONS: False,
+    CONF_SUPPRESS_UNCHANGED_STATES: True,
+    CONF_STATE_KEEP_ALIVE_INTERVAL: DEFAULT_STATE_KEEP_ALIVE_INTERVAL,
+    CONF_TELEGRAM_DEDUPLICATION_WINDOW: 0,
+    CONF_DEVICE_INFO_ENTITIES: True,
 }
 
 class DeviceConf(dict):
@@ -74,8 +81,9 @@ async def async_get_gateway_config(hass: HomeAssistant, CONFIG_SCHEMA: dict, get
     config = await async_get_home_assistant_config(hass, CONFIG_SCHEMA, get_integration_config)
     # LOGGER.debug(f"config: {config}")
     if CONF_GATEWAY in config:
-        if isinstance(config[CONF_GATEWAY], dict) and CONF_DEVICE_TYPE in config[CONF_GATEWAY]:
-            return config[CONF_GATEWAY]
+        if isinstance(config[CONF_GATEWAY], dict):
+            if CONF_DEVICE_TYPE in config[CONF_GATEWAY]:
+                return config[CONF_GATEWAY]
         elif len(config[CONF_GATEWAY]) > 0 and CONF_DEVICE_TYPE in config[CONF_GATEWAY][0]:
             return config[CONF_GATEWAY][0]
     return None
@@ -105,7 +113,50 @@ async def async_get_gateway_config_serial_port(hass: HomeAssistant, CONFIG_SCHEM
         return gateway_config[CONF_SERIAL_PATH]
     return None
 
-async def async_get_home_assistant_config(hass: HomeAssistant, CONFIG_SCHEMA: dict, get_integration_config=async_integration_yaml_config) -> dict:
+class ConfigCache:
+    """Parsed and validated configuration shared by all gateways and platforms.
+
+    The version is increased every time the configuration is read again.
+    """
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.config: dict | None = None
+        self.version: int = 0
+
+    def invalidate(self) -> None:
+        self.config = None
+
+
+def _get_config_cache(hass: HomeAssistant) -> ConfigCache | None:
+    if hass is None:
+        return None
+    eltako_data = hass.data.setdefault(DATA_ELTAKO, {})
+    if ELTAKO_CONFIG_CACHE not in eltako_data:
+        eltako_data[ELTAKO_CONFIG_CACHE] = ConfigCache()
+    return eltako_data[ELTAKO_CONFIG_CACHE]
+
+def invalidate_home_assistant_config(hass: HomeAssistant) -> None:
+    """Read configuration.yaml again on the next request. Is called when the integration is reloaded."""
+    cache = _get_config_cache(hass)
+    if cache is not None:
+        cache.invalidate()
+
+async def async_get_home_assistant_config(hass: HomeAssistant, CONFIG_SCHEMA: dict, get_integration_config=async_integration_yaml_config, refresh: bool=False) -> dict:
+    """Return the eltako configuration. It is parsed once and cached until reload or refresh is requested."""
+    cache = _get_config_cache(hass)
+    if cache is None:
+        return await _async_read_home_assistant_config(hass, CONFIG_SCHEMA, get_integration_config)
+
+    async with cache.lock:
+        if cache.config is None or refresh:
+            start = time.perf_counter()
+            cache.config = await _async_read_home_assistant_config(hass, CONFIG_SCHEMA, get_integration_config)
+            cache.version += 1
+            LOGGER.debug("Parsed and validated configuration (version %d) in %.1f ms.", cache.version, (time.perf_counter() - start) * 1000.0)
+        return cache.config
+
+async def _async_read_home_assistant_config(hass: HomeAssistant, CONFIG_SCHEMA: dict, get_integration_config=async_integration_yaml_config) -> dict:
     _conf = await get_integration_config(hass, DOMAIN)
     if not _conf or DOMAIN not in _conf:
         LOGGER.warning("No `eltako:` key found in configuration.yaml.")
@@ -188,10 +239,14 @@ def get_bus_event_type(gateway_id: int, function_id: str, source_id: AddressExpr
     
     # add data for better handling in automations
     if data is not None:
-        event_id += f".d_{data}"
+        event_id = add_bus_event_data(event_id, data)
 
     return event_id
 
+def add_bus_event_data(event_id: str, data: str) -> str:
+    """Extend an event type created by get_bus_event_type() by data."""
+    return f"{event_id}.d_{data}"
+
 def convert_button_pos_from_hex_to_str(pos: int) -> str:
     if pos == 0x10:
         return "LB"
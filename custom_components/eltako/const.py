@@ -12,6 +12,8 @@ DATA_ELTAKO: Final = "eltako"
 DATA_ENTITIES: Final = "entities"
 ELTAKO_GATEWAY: Final = "gateway"
 ELTAKO_CONFIG: Final = "config"
+ELTAKO_CONFIG_CACHE: Final = "config_cache"
+ELTAKO_TELEGRAM_DEDUPLICATOR: Final = "telegram_deduplicator"
 MANUFACTURER: Final = "Eltako"
 
 ERROR_INVALID_GATEWAY_PATH: Final = "Invalid gateway path"
@@ -36,6 +38,11 @@ CONF_GERNERAL_SETTINGS: Final = "general_settings"
 CONF_SHOW_DEV_ID_IN_DEV_NAME: Final = "show_dev_id_in_dev_name"
 CONF_ENABLE_TEACH_IN_BUTTONS: Final = "enable_teach_in_buttons"
 CONF_FAST_STATUS_CHANGE: Final = "fast_status_change"
+CONF_SUPPRESS_UNCHANGED_STATES: Final = "suppress_unchanged_states"
+CONF_STATE_KEEP_ALIVE_INTERVAL: Final = "state_keep_alive_interval"
+DEFAULT_STATE_KEEP_ALIVE_INTERVAL: Final = 0
+CONF_TELEGRAM_DEDUPLICATION_WINDOW: Final = "telegram_deduplication_window"
+CONF_DEVICE_INFO_ENTITIES: Final = "device_info_entities"
 GATEWAY_DEFAULT_NAME: Final = "EnOcean Gateway"
 OLD_GATEWAY_DEFAULT_NAME: Final = "EnOcean ESP2 Gateway"
 CONF_GATEWAY: Final = "gateway"
@@ -46,6 +53,27 @@ CONF_DEVICE_TYPE: Final = "device_type"
 CONF_SERIAL_PATH: Final = "serial_path"
 CONF_GATEWAY_ADDRESS: Final = "address"
 CONF_GATEWAY_MESSAGE_DELAY: Final = "message_delay"
+CONF_GATEWAY_STATISTICS_INTERVAL: Final = "statistics_interval"
+DEFAULT_GATEWAY_STATISTICS_INTERVAL: Final = 1.0
+CONF_GATEWAY_PERIODIC_TELEGRAMS_PER_SECOND: Final = "periodic_telegrams_per_second"
+DEFAULT_GATEWAY_PERIODIC_TELEGRAMS_PER_SECOND: Final = 2.0
+CONF_GATEWAY_SEND_TELEGRAMS_PER_SECOND: Final = "send_telegrams_per_second"
+DEFAULT_GATEWAY_SEND_TELEGRAMS_PER_SECOND: Final = 20.0
+CONF_GATEWAY_SIMULATION_SPEED: Final = "simulation_speed"
+DEFAULT_GATEWAY_SIMULATION_SPEED: Final = 1.0
+CONF_GATEWAY_LATENCY_INSTRUMENTATION: Final = "latency_instrumentation"
+# stages and percentiles of the latency instrumentation, the sensors use them without importing the instrumentation
+STAGE_BUS_TO_DISPATCH: Final = "bus_to_dispatch"
+STAGE_DISPATCH_TO_DECODE: Final = "dispatch_to_decode"
+STAGE_DECODE_TO_STATE: Final = "decode_to_state"
+STAGE_TOTAL: Final = "total"
+STAGES: Final = [STAGE_BUS_TO_DISPATCH, STAGE_DISPATCH_TO_DECODE, STAGE_DECODE_TO_STATE, STAGE_TOTAL]
+PERCENTILES: Final = [50, 95, 99]
+CONF_GATEWAY_TELEGRAM_LOG: Final = "telegram_log"
+CONF_GATEWAY_TELEGRAM_LOG_MAX_SIZE: Final = "telegram_log_max_size"
+DEFAULT_GATEWAY_TELEGRAM_LOG_MAX_SIZE: Final = 10.0
+CONF_GATEWAY_TELEGRAM_LOG_BACKUP_COUNT: Final = "telegram_log_backup_count"
+DEFAULT_GATEWAY_TELEGRAM_LOG_BACKUP_COUNT: Final = 3
 
 CONF_GATEWAY_AUTO_RECONNECT: Final = "auto_reconnect"
 CONF_GATEWAY_PORT: Final = "port"
@@ -62,6 +90,15 @@ CONF_TIME_OPENS: Final = "time_opens"
 CONF_TIME_TILTS: Final = "time_tilts"
 CONF_INVERT_SIGNAL: Final = "invert_signal"
 CONF_VOC_TYPE_INDEXES: Final = "voc_type_indexes"
+CONF_MIN_PUBLISH_INTERVAL: Final = "min_publish_interval"
+CONF_DEADBAND: Final = "deadband"
+CONF_DEADBAND_RELATIVE: Final = "deadband_relative"
+CONF_AGGREGATION: Final = "aggregation"
+AGGREGATION_LAST: Final = "last"
+AGGREGATION_MEAN: Final = "mean"
+AGGREGATION_MIN: Final = "min"
+AGGREGATION_MAX: Final = "max"
+AGGREGATIONS: Final = [AGGREGATION_LAST, AGGREGATION_MEAN, AGGREGATION_MIN, AGGREGATION_MAX]
 
 class LANGUAGE_ABBREVIATION(StrEnum):
     LANG_ENGLISH = 'en'
@@ -89,6 +126,7 @@ class GatewayDeviceType(str, Enum):
     USB300 = 'enocean-usb300'
     ESP3 = 'esp3-gateway'
     LAN = 'mgw-lan'
+    SIMULATOR = 'simulator'             # virtual devices for load tests without hardware
 
     @classmethod
     def find(cls, value):
@@ -104,7 +142,8 @@ class GatewayDeviceType(str, Enum):
     @classmethod
     def is_bus_gateway(cls, dev_type) -> bool:
         return dev_type in [GatewayDeviceType.GatewayEltakoFAM14, GatewayDeviceType.GatewayEltakoFGW14USB,
-                            GatewayDeviceType.EltakoFAM14, GatewayDeviceType.EltakoFAMUSB, GatewayDeviceType.EltakoFGW14USB]
+                            GatewayDeviceType.EltakoFAM14, GatewayDeviceType.EltakoFAMUSB, GatewayDeviceType.EltakoFGW14USB,
+                            GatewayDeviceType.SIMULATOR]
     
     @classmethod
     def is_esp2_gateway(cls, dev_type) -> bool:
@@ -115,6 +154,10 @@ class GatewayDeviceType(str, Enum):
     def is_lan_gateway(cls, dev_type) -> bool:
         return dev_type in [GatewayDeviceType.LAN]
 
+    @classmethod
+    def is_simulator(cls, dev_type) -> bool:
+        return dev_type in [GatewayDeviceType.SIMULATOR]
+
 BAUD_RATE_DEVICE_TYPE_MAPPING: dict = {
     GatewayDeviceType.GatewayEltakoFAM14: 57600,
     GatewayDeviceType.GatewayEltakoFGW14USB: 57600,
@@ -126,4 +169,5 @@ BAUD_RATE_DEVICE_TYPE_MAPPING: dict = {
     GatewayDeviceType.USB300: 57600,
     GatewayDeviceType.ESP3: 57600,
     GatewayDeviceType.LAN: -1,
+    GatewayDeviceType.SIMULATOR: -1,
 }
\ No newline at end of file
@@ -19,7 +19,6 @@ from .config_helpers import DeviceConf
 from .gateway import EnOceanGateway
 from .const import CONF_SENDER, CONF_TIME_CLOSES, CONF_TIME_OPENS, CONF_TIME_TILTS, DOMAIN, MANUFACTURER, LOGGER
 from . import get_gateway_from_hass, get_device_config_for_gateway
-import time
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -28,28 +27,27 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Eltako cover platform."""
     gateway: EnOceanGateway = get_gateway_from_hass(hass, config_entry)
-    config: ConfigType = get_device_config_for_gateway(hass, config_entry, gateway)
 
     entities: list[EltakoEntity] = []
     
     platform = Platform.COVER
-    if platform in config:
-        for entity_config in config[platform]:
+    for device in gateway.device_index.get_platform_entries(platform):
 
-            try:
-                dev_conf = DeviceConf(entity_config, [CONF_DEVICE_CLASS, CONF_TIME_CLOSES, CONF_TIME_OPENS, CONF_TIME_TILTS])
-                sender_config = config_helpers.get_device_conf(entity_config, CONF_SENDER)
+        try:
+            dev_conf = device.config
+            sender_config = device.sender
 
-                entities.append(EltakoCover(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, 
-                                            sender_config.id, sender_config.eep, 
-                                            dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_TIME_CLOSES), dev_conf.get(CONF_TIME_OPENS), dev_conf.get(CONF_TIME_TILTS)))
+            entities.append(EltakoCover(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, 
+                                        sender_config.id, sender_config.eep, 
+                                        dev_conf.get(CONF_DEVICE_CLASS), dev_conf.get(CONF_TIME_CLOSES), dev_conf.get(CONF_TIME_OPENS), dev_conf.get(CONF_TIME_TILTS)))
 
-            except Exception as e:
-                LOGGER.warning("[%s] Could not load configuration", platform)
-                LOGGER.critical(e, exc_info=True)
+        except Exception as e:
+            LOGGER.warning("[%s] Could not load configuration", platform)
+            LOGGER.critical(e, exc_info=True)
                 
         
     validate_actuators_dev_and_sender_id(entities)
+    restore_last_states(hass, entities, platform)
     log_entities_to_be_added(entities, platform)
     async_add_entities(entities)
 
@@ -71,6 +69,10 @@ class EltakoCover(EltakoEntity, CoverEntity, RestoreEntity):
         self._time_closes = time_closes
         self._time_opens = time_opens
         self._time_tilts = time_tilts
+
+        # stop of a tilt movement is scheduled on the event loop and invalidated by any new command
+        self._tilt_stop_handle = None
+        self._command_generation = 0
         
         self._attr_supported_features = (CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE | CoverEntityFeature.STOP)
         
@@ -129,8 +131,22 @@ class EltakoCover(EltakoEntity, CoverEntity, RestoreEntity):
                      + f"state: {self.state}]")
 
 
+    def _invalidate_scheduled_tilt_stop(self) -> None:
+        """Prevent a scheduled tilt stop from being sent because a new command arrived. Can be called from any thread."""
+        self._command_generation += 1
+
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending tilt stop when the entity is removed."""
+        if self._tilt_stop_handle is not None:
+            self._tilt_stop_handle.cancel()
+            self._tilt_stop_handle = None
+        await super().async_will_remove_from_hass()
+
+
     def open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
+        self._invalidate_scheduled_tilt_stop()
         if self._time_opens is not None:
             time = self._time_opens + 1
         else:
@@ -157,6 +173,7 @@ class EltakoCover(EltakoEntity, CoverEntity, RestoreEntity):
 
     def close_cover(self, **kwargs: Any) -> None:
         """Close cover."""
+        self._invalidate_scheduled_tilt_stop()
         if self._time_closes is not None:
             time = self._time_closes + 1
         else:
@@ -185,6 +202,7 @@ class EltakoCover(EltakoEntity, CoverEntity, RestoreEntity):
         if self._time_closes is None or self._time_opens is None:
             return
         
+        self._invalidate_scheduled_tilt_stop()
         address, _ = self._sender_id
         position = kwargs[ATTR_POSITION]
         
@@ -231,6 +249,7 @@ class EltakoCover(EltakoEntity, CoverEntity, RestoreEntity):
 
     def stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
+        self._invalidate_scheduled_tilt_stop()
         address, _ = self._sender_id
 
         if self._sender_eep == H5_3F_7F:
@@ -247,7 +266,7 @@ class EltakoCover(EltakoEntity, CoverEntity, RestoreEntity):
     def value_changed(self, msg):
         """Update the internal state of the cover."""
         try:
-            decoded = self.dev_eep.decode_message(msg)
+            decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("Could not decode message: %s", str(e))
             return
@@ -322,7 +341,8 @@ class EltakoCover(EltakoEntity, CoverEntity, RestoreEntity):
             self.schedule_update_ha_state()
 
 
-    def set_cover_tilt_position(self, **kwargs: Any) -> None:
+    async def async_set_cover_tilt_position(self, **kwargs: Any) -> None:
+        """Move the cover for the time needed to reach the tilt position. Stop is scheduled on the event loop so that no thread is blocked."""
         address, _ = self._sender_id
         tilt_position = kwargs[ATTR_TILT_POSITION]
         
@@ -341,12 +361,15 @@ class EltakoCover(EltakoEntity, CoverEntity, RestoreEntity):
             elif direction == "down":
                 command = 0x02
             
+            # a new tilt command replaces the pending stop of the previous one
+            if self._tilt_stop_handle is not None:
+                self._tilt_stop_handle.cancel()
+            self._invalidate_scheduled_tilt_stop()
+
             msg = H5_3F_7F(0, command, 1).encode_message(address)
             self.send_message(msg)
-            time.sleep(sleeptime)
-            
-            msg = H5_3F_7F(0, 0x00, 1).encode_message(address)
-            self.send_message(msg)
+
+            self._tilt_stop_handle = self.hass.loop.call_later(sleeptime, self._stop_tilt_movement, self._command_generation)
 
         
         if self.general_settings[CONF_FAST_STATUS_CHANGE]:
@@ -355,4 +378,15 @@ class EltakoCover(EltakoEntity, CoverEntity, RestoreEntity):
                 self._attr_is_closing = False
             elif direction == "down":
                 self._attr_is_closing = True
-                self._attr_is_opening = False
\ No newline at end of file
+                self._attr_is_opening = False
+
+
+    def _stop_tilt_movement(self, command_generation: int) -> None:
+        """Send stop command after tilting unless another command was sent in the meantime."""
+        self._tilt_stop_handle = None
+        if command_generation != self._command_generation:
+            return
+
+        address, _ = self._sender_id
+        msg = H5_3F_7F(0, 0x00, 1).encode_message(address)
+        self.send_message(msg)
@@ -25,7 +25,6 @@ async def async_setup_entry(
 ) -> None:
     """Set up an Eltako buttons."""
     gateway: EnOceanGateway = get_gateway_from_hass(hass, config_entry)
-    config: ConfigType = get_device_config_for_gateway(hass, config_entry, gateway)
 
     entities: list[EltakoEntity] = []
     
@@ -84,5 +83,5 @@ class GatewayLastReceivedMessage(EltakoEntity, DateTimeEntity):
     def set_value(self, value: datetime) -> None:
         """Update the current value."""
 
-        self.native_value = value
+        self._attr_native_value = value
         self.schedule_update_ha_state()
\ No newline at end of file
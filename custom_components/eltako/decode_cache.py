@@ -0,0 +1,48 @@
+"""Cache for decoded telegrams shared by all entities of a gateway."""
+
+
+class MessageDecodeCache:
+    """Decodes a telegram at most once per EEP.
+
+    Devices like weather stations or meters are represented by several entities
+    which all decode the same telegram. The cache is keyed by the message type and
+    the values of the message (sender, data, status, ...), so a message object which
+    is changed and handed over again is decoded again. Only the latest telegram is kept because a telegram is
+    dispatched to all its entities before the next one is processed.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._decoded: dict = {}
+        self.hits: int = 0
+        self.decodes: int = 0
+
+    def decode(self, eep, msg):
+        """Return the decoded message for the given EEP and decode it only if not done before."""
+        # the values are compared instead of the serialized telegram which is not
+        # available for messages created with invalid values e.g. in tests
+        key = (type(msg), tuple(vars(msg).values()))
+        if key != self._key:
+            self._key = key
+            self._decoded = {}
+        else:
+            decoded = self._decoded.get(eep)
+            if decoded is not None:
+                self.hits += 1
+                return decoded
+
+        # exceptions are not cached and raised to the entity
+        decoded = eep.decode_message(msg)
+        self.decodes += 1
+        self._decoded[eep] = decoded
+        return decoded
+
+    @property
+    def avoided_decodes(self) -> int:
+        """Return the amount of decodings which were saved by the cache."""
+        return self.hits
+
+    def clear(self) -> None:
+        """Drop the cached message."""
+        self._key = None
+        self._decoded = {}
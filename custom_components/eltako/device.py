@@ -1,4 +1,5 @@
 """Representation of an Eltako device."""
+import time
 from datetime import datetime
 
 from eltakobus.message import ESP2Message, EltakoWrappedRPS, EltakoWrapped1BS, EltakoWrapped4BS, RPSMessage, Regular4BSMessage, Regular1BSMessage
@@ -6,6 +7,7 @@ from eltakobus.util import AddressExpression
 from eltakobus.eep import EEP
 
 from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import entity_registry as er, restore_state
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.entity_platform import DATA_ENTITY_PLATFORM
 from homeassistant.helpers.entity import DeviceInfo
@@ -15,12 +17,27 @@ from homeassistant.const import Platform
 
 from .const import *
 from .gateway import EnOceanGateway
+from .gateway_statistics import STATISTIC_SUPPRESSED_STATE_WRITES
+from .send_queue import SendPriority
 from . import config_helpers
 
+SUPPORTED_MESSAGE_TYPES = frozenset([EltakoWrappedRPS, EltakoWrapped1BS, EltakoWrapped4BS, RPSMessage, Regular1BSMessage, Regular4BSMessage])
+
 
 class EltakoEntity(Entity):
     """Parent class for all entities associated with the Eltako component."""
     
+    # attributes which are written into the state machine, used to detect if a state write changes anything
+    _STATE_ATTRIBUTES = (
+        '_attr_available', '_attr_name', '_attr_icon', '_attr_is_on', '_attr_native_value',
+        '_attr_is_opening', '_attr_is_closing', '_attr_is_closed', '_attr_current_cover_position', '_attr_current_cover_tilt_position',
+        '_attr_hvac_mode', '_attr_hvac_action', '_attr_current_temperature', '_attr_target_temperature',
+        '_attr_target_temperature_low', '_attr_target_temperature_high', '_attr_brightness', '_attr_extra_state_attributes',
+    )
+    _published_state: tuple | None = None
+    _published_at: float = 0.0
+    _is_state_restored: bool = False
+    _is_restoring_state: bool = False
     
     def __init__(self, platform: str, gateway: EnOceanGateway, dev_id: AddressExpression, dev_name: str="Device", dev_eep: EEP=None, description_key:str=None):
         """Initialize the device."""
@@ -79,27 +96,28 @@ class EltakoEntity(Entity):
         """Call when entity about to be added to hass."""
         await super().async_added_to_hass()
         
-        # Register callbacks.
-        event_id = config_helpers.get_bus_event_type(self.gateway.base_id, SIGNAL_RECEIVE_MESSAGE)
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, event_id, self._message_received_callback
+        # Register callbacks for all addresses this entity is interested in.
+        for address in self.listen_to_addresses:
+            self.async_on_remove(
+                self.gateway.telegram_router.register(address, self)
             )
-        )
 
-        # load initial value
-        if isinstance(self, RestoreEntity):
+        # load initial value if it was not already restored together with all entities of the platform
+        if not self._is_state_restored and self._needs_restore():
+            latest_state:State = await self.async_get_last_state()
+            if latest_state is not None:
+                self.load_value_initially(latest_state)
 
-            # check if value is not set
-            is_value_available = getattr(self, '_attr_native_value', None)
-            if is_value_available is None:
-                is_value_available = getattr(self, '_attr_is_on', None)
+    def _needs_restore(self) -> bool:
+        """Check if the entity restores states and no value is set yet."""
+        if not isinstance(self, RestoreEntity):
+            return False
 
-            # update values
-            if is_value_available is None:
-                latest_state:State = await self.async_get_last_state()
-                if latest_state is not None:
-                    self.load_value_initially(latest_state)
+        # check if value is not set
+        is_value_available = getattr(self, '_attr_native_value', None)
+        if is_value_available is None:
+            is_value_available = getattr(self, '_attr_is_on', None)
+        return is_value_available is None
 
 
     def load_value_initially(self, latest_state:State):
@@ -159,22 +177,73 @@ class EltakoEntity(Entity):
         return EltakoEntity._get_identifier(self.gateway, self.dev_id, self.description_key)
 
     def _message_received_callback(self, msg: ESP2Message) -> None:
-        """Handle incoming messages."""
-        
-        msg_types = [EltakoWrappedRPS, EltakoWrapped1BS, EltakoWrapped4BS, RPSMessage, Regular1BSMessage, Regular4BSMessage]
-
-        if type(msg) in msg_types:
-            if msg.address in self.listen_to_addresses:
-                self.value_changed(msg)
+        """Handle incoming messages. Messages are only routed to this entity if it listens to the sender address."""
+        if type(msg) in SUPPORTED_MESSAGE_TYPES:
+            self.value_changed(msg)
 
 
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the device when a message arrives."""
+
+    def decode_message(self, msg: ESP2Message):
+        """Decode the message with the EEP of this entity. The result is shared with all entities of the same device."""
+        decoded = self.gateway.decode_cache.decode(self.dev_eep, msg)
+        if self.gateway.latency_tracker is not None:
+            self.gateway.latency_tracker.telegram_decoded()
+        return decoded
+
+    def _get_state_fingerprint(self) -> tuple:
+        """Return the values of all attributes which end up in the state machine."""
+        fingerprint = []
+        for attr in self._STATE_ATTRIBUTES:
+            value = getattr(self, attr, None)
+            # dicts are changed in place by some entities
+            if isinstance(value, dict):
+                value = tuple(value.items())
+            fingerprint.append(value)
+        return tuple(fingerprint)
+
+    def _is_state_write_redundant(self) -> bool:
+        """Check if the state did not change since the last write and the keep-alive interval is not over."""
+        if not self.general_settings.get(CONF_SUPPRESS_UNCHANGED_STATES, True):
+            return False
+
+        fingerprint = self._get_state_fingerprint()
+        now = time.monotonic()
+        keep_alive_interval = self.general_settings.get(CONF_STATE_KEEP_ALIVE_INTERVAL, DEFAULT_STATE_KEEP_ALIVE_INTERVAL)
+        if fingerprint == self._published_state and (not keep_alive_interval or now - self._published_at < keep_alive_interval):
+            return True
+
+        self._published_state = fingerprint
+        self._published_at = now
+        return False
+
+    def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
+        """Schedule a state update if the state changed and record its latency if latency instrumentation is enabled."""
+        # restored states are written once when the entity is added
+        if self._is_restoring_state:
+            return
+
+        if not force_refresh and self._is_state_write_redundant():
+            self.gateway.statistics.increment(STATISTIC_SUPPRESSED_STATE_WRITES)
+            return
+
+        if self.gateway.latency_tracker is not None:
+            self.gateway.latency_tracker.state_scheduled(self.dev_eep)
+        super().schedule_update_ha_state(force_refresh)
     
-    def send_message(self, msg: ESP2Message):
+    def send_message(self, msg: ESP2Message, priority: SendPriority=None):
         """Put message on RS485 bus. First the message is put onto HA event bus so that other automations can react on messages."""
-        event_id = config_helpers.get_bus_event_type(self.gateway.base_id, SIGNAL_SEND_MESSAGE)
-        dispatcher_send(self.hass, event_id, msg)
+        if priority is None:
+            priority = self._get_send_priority()
+        dispatcher_send(self.hass, self.gateway.send_message_event_id, msg, priority)
+
+    def _get_send_priority(self) -> SendPriority:
+        """Commands triggered by a user (e.g. in the UI) are sent before commands of automations."""
+        context = getattr(self, '_context', None)
+        if context is not None and context.user_id:
+            return SendPriority.INTERACTIVE
+        return SendPriority.AUTOMATION
         
 
 def validate_actuators_dev_and_sender_id(entities:list[EltakoEntity]):
@@ -183,6 +252,40 @@ def validate_actuators_dev_and_sender_id(entities:list[EltakoEntity]):
         e.validate_dev_id()
         e.validate_sender_id()
 
+def restore_last_states(hass: HomeAssistant, entities:list[EltakoEntity], platform:Platform) -> int:
+    """Load the last states of all entities in one pass before they are added to Home Assistant.
+
+    Values are only applied to the entities without writing the state. Home Assistant writes
+    the state once when an entity is added. Returns the number of restored entities.
+    """
+    started_at = time.monotonic()
+    last_states = restore_state.async_get(hass).last_states
+    entity_registry = er.async_get(hass)
+
+    restored = 0
+    for e in entities:
+        if not e._needs_restore():
+            continue
+        e._is_state_restored = True
+
+        # entity ids can be changed by users
+        entity_id = entity_registry.async_get_entity_id(platform, DOMAIN, e.unique_id) or e.entity_id
+        stored_state = last_states.get(entity_id)
+        if stored_state is None:
+            continue
+
+        e._is_restoring_state = True
+        try:
+            e.load_value_initially(stored_state.state)
+            restored += 1
+        except Exception as ex:
+            LOGGER.warning(f"[{platform} {e.dev_id}] Cannot restore state of {e.dev_name}: {ex}")
+        finally:
+            e._is_restoring_state = False
+
+    LOGGER.info(f"[{platform}] Restored {restored} of {len(entities)} entities in {(time.monotonic() - started_at) * 1000:.1f} ms.")
+    return restored
+
 def log_entities_to_be_added(entities:list[EltakoEntity], platform:Platform) -> None:
     for e in entities:
         temp_eep = ""
@@ -0,0 +1,65 @@
+"""Index of all devices configured for a gateway."""
+from dataclasses import dataclass
+
+from homeassistant.const import CONF_DEVICE_CLASS, CONF_TEMPERATURE_UNIT
+from homeassistant.helpers.typing import ConfigType
+
+from .const import *
+from .config_helpers import DeviceConf, get_device_conf
+
+# attributes available in DeviceConf for all platforms
+DEVICE_CONF_EXTRA_KEYS = [CONF_DEVICE_CLASS, CONF_INVERT_SIGNAL, CONF_TIME_CLOSES, CONF_TIME_OPENS, CONF_TIME_TILTS,
+                          CONF_TEMPERATURE_UNIT, CONF_MAX_TARGET_TEMPERATURE, CONF_MIN_TARGET_TEMPERATURE, CONF_METER_TARIFFS]
+
+
+@dataclass(frozen=True)
+class DeviceIndexEntry:
+    """Parsed configuration of a single device.
+
+    Only the fields are frozen, the configurations are shared by all platforms and must not be changed.
+    """
+    platform: str
+    config: DeviceConf
+    sender: DeviceConf | None
+    raw: ConfigType
+
+
+class DeviceIndex:
+    """Parses the device configuration of a gateway once so that platforms don't need to do it again.
+
+    Entries can be looked up by platform.
+    """
+
+    def __init__(self, device_config: ConfigType):
+        self.device_config: ConfigType = device_config if device_config is not None else {}
+        self._by_platform: dict[str, tuple[DeviceIndexEntry, ...]] = {}
+
+        for platform in PLATFORMS:
+            entries = []
+            for entity_config in self.device_config.get(platform, []):
+                try:
+                    entry = DeviceIndexEntry(
+                        platform=platform,
+                        config=DeviceConf(entity_config, DEVICE_CONF_EXTRA_KEYS),
+                        sender=get_device_conf(entity_config, CONF_SENDER),
+                        raw=entity_config,
+                    )
+                except Exception as e:
+                    LOGGER.warning("[%s] Could not load configuration", platform)
+                    LOGGER.critical(e, exc_info=True)
+                    continue
+
+                entries.append(entry)
+
+            self._by_platform[platform] = tuple(entries)
+
+    def get_platform_entries(self, platform: str) -> tuple[DeviceIndexEntry, ...]:
+        """Return all devices configured for the given platform."""
+        return self._by_platform.get(platform, ())
+
+    def get_all_entries(self) -> list[DeviceIndexEntry]:
+        """Return all devices ordered by platform."""
+        return [entry for platform in PLATFORMS for entry in self.get_platform_entries(platform)]
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_platform.values())
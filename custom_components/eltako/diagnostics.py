@@ -0,0 +1,58 @@
+"""Diagnostics support for Eltako."""
+from __future__ import annotations
+
+from typing import Any
+
+from eltakobus.eep import F6_01_01, F6_02_01, F6_02_02
+from eltakobus.util import b2s
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import config_helpers
+from .const import *
+from .gateway import EnOceanGateway
+from . import get_gateway_from_hass
+
+
+def get_device_diagnostics(gateway: EnOceanGateway) -> list[dict[str, Any]]:
+    """Return the static information of all devices configured for the gateway.
+
+    The list is created on request instead of keeping an info entity for every device in memory.
+    """
+    devices = []
+    for device in gateway.device_index.get_all_entries():
+        dev_conf = device.config
+        data = {
+            'platform': device.platform,
+            'id': b2s(dev_conf.id[0]) if dev_conf.id is not None else None,
+            'name': dev_conf.name,
+            'eep': dev_conf.eep.eep_string if dev_conf.eep is not None else None,
+        }
+        if device.sender is not None and device.sender.id is not None:
+            data['sender_id'] = b2s(device.sender.id[0])
+        if dev_conf.eep in [F6_01_01, F6_02_01, F6_02_02]:
+            data['event_id'] = config_helpers.get_bus_event_type(gateway.dev_id, EVENT_BUTTON_PRESSED, dev_conf.id)
+        devices.append(data)
+    return devices
+
+
+def get_gateway_diagnostics(gateway: EnOceanGateway) -> dict[str, Any]:
+    """Return the information of the gateway and its devices."""
+    return {
+        'gateway': {
+            'id': gateway.dev_id,
+            'name': gateway.dev_name,
+            'base_id': b2s(gateway.base_id[0]),
+            'serial_path': gateway.serial_path,
+            'usb_protocol': gateway.native_protocol,
+            'message_delay': gateway.message_delay,
+            'auto_reconnect': gateway.is_auto_reconnect_enabled,
+        },
+        'devices': get_device_diagnostics(gateway),
+    }
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    return get_gateway_diagnostics(get_gateway_from_hass(hass, config_entry))
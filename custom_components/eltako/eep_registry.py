@@ -0,0 +1,96 @@
+"""Precomputed lookup of EEP classes and their constructor arguments."""
+import inspect
+from dataclasses import dataclass, field
+from typing import Any
+
+from eltakobus.eep import EEP
+
+
+@dataclass(frozen=True)
+class EEPRegistryEntry:
+    """EEP class with the names of its constructor arguments."""
+    eep: type
+    init_args: tuple[str, ...]
+    # values for arguments which are not provided
+    defaults: dict[str, Any] = field(default_factory=dict)
+
+    def get_init_args(self, data: dict) -> tuple[dict, dict]:
+        """Return provided and missing constructor arguments found in data."""
+        provided = {name: data[name] for name in self.init_args if name in data}
+        missing = {name: self.defaults[name] for name in self.init_args if name not in data}
+        return provided, missing
+
+
+def _normalize(eep_string: str) -> str:
+    return eep_string.strip().upper().replace('_', '-')
+
+
+class EEPRegistry:
+    """Maps EEP strings to EEP classes and their constructor arguments.
+
+    inspect.signature() and EEP.find() are comparatively expensive, so EEP classes
+    are looked up by dictionary. A class is only analysed when its EEP string is
+    requested the first time which keeps the startup of the integration short.
+    """
+
+    def __init__(self):
+        self._classes: dict[str, type] = {}
+        self._entries: dict[str, EEPRegistryEntry] = {}
+
+        for eep in self._get_all_eep_classes():
+            # only classes defining their own EEP string, subclasses can inherit it
+            eep_string = vars(eep).get('eep_string', None)
+            if isinstance(eep_string, str):
+                self._classes.setdefault(_normalize(eep_string), eep)
+
+    @staticmethod
+    def _get_all_eep_classes() -> list[type]:
+        classes = []
+        work = [EEP]
+        while work:
+            parent = work.pop()
+            for child in parent.__subclasses__():
+                if child not in classes:
+                    classes.append(child)
+                    work.append(child)
+        return classes
+
+    @staticmethod
+    def _create_entry(eep: type) -> EEPRegistryEntry:
+        sig = inspect.signature(eep.__init__)
+        init_args = tuple(param.name for param in sig.parameters.values() if param.kind == param.POSITIONAL_OR_KEYWORD and param.name != 'self')
+        return EEPRegistryEntry(eep, init_args, {name: 0 for name in init_args})
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def find(self, eep_string: str) -> EEPRegistryEntry | None:
+        """Return the registry entry for the given EEP string like 'A5-38-08'."""
+        if not isinstance(eep_string, str):
+            return None
+
+        key = _normalize(eep_string)
+        entry = self._entries.get(key)
+        if entry is None:
+            eep = self._classes.get(key)
+            if eep is None:
+                # fall back to the library for EEPs which could not be registered upfront
+                try:
+                    eep = EEP.find(eep_string)
+                except Exception:
+                    eep = None
+            if eep is not None:
+                entry = self._create_entry(eep)
+                self._entries[key] = entry
+        return entry
+
+
+_REGISTRY: EEPRegistry | None = None
+
+
+def get_eep_registry() -> EEPRegistry:
+    """Return the registry which is shared by all gateways. It is built on first use."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = EEPRegistry()
+    return _REGISTRY
@@ -1,4 +1,6 @@
 """Support for Eltako devices."""
+import time
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.helpers.typing import ConfigType
@@ -10,6 +12,8 @@ from .const import *
 from .schema import CONFIG_SCHEMA
 from . import config_helpers
 from .gateway import *
+from .device_index import DeviceIndex
+from .telegram_deduplicator import TelegramDeduplicator
 
 LOG_PREFIX = "Eltako Integration Setup"
 
@@ -63,6 +67,18 @@ def set_gateway_to_hass(hass: HomeAssistant, gateway_enity: EnOceanGateway) -> N
 
     hass.data[DATA_ELTAKO][gateway_enity.dev_name] = gateway_enity
 
+def get_telegram_deduplicator(hass: HomeAssistant, general_settings: dict) -> TelegramDeduplicator | None:
+    """Return the deduplicator shared by all gateways or None if de-duplication is disabled."""
+    window = general_settings.get(CONF_TELEGRAM_DEDUPLICATION_WINDOW, 0)
+    if not window:
+        return None
+
+    deduplicator = hass.data[DATA_ELTAKO].get(ELTAKO_TELEGRAM_DEDUPLICATOR, None)
+    if deduplicator is None or deduplicator.window != window:
+        deduplicator = TelegramDeduplicator(window)
+        hass.data[DATA_ELTAKO][ELTAKO_TELEGRAM_DEDUPLICATOR] = deduplicator
+    return deduplicator
+
 def get_device_config_for_gateway(hass: HomeAssistant, config_entry: ConfigEntry, gateway: EnOceanGateway) -> ConfigType:
     return config_helpers.get_device_config(hass.data[DATA_ELTAKO][ELTAKO_CONFIG], gateway.dev_id)
 
@@ -90,7 +106,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     eltako_data = hass.data.setdefault(DATA_ELTAKO, {})
     eltako_data[ELTAKO_CONFIG] = config
     # print whole eltako configuration
-    LOGGER.debug(f"config: {config}\n")
+    LOGGER.debug("config: %s\n", config)
 
     # Migrage existing gateway configs / ESP2 was removed in the name
     migrate_old_gateway_descriptions(hass)
@@ -137,8 +153,30 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     auto_reconnect = gateway_config.get(CONF_GATEWAY_AUTO_RECONNECT, True)
     gateway_base_id = AddressExpression.parse(gateway_config[CONF_BASE_ID])
     message_delay = gateway_config.get(CONF_GATEWAY_MESSAGE_DELAY, None)
+    statistics_interval = gateway_config.get(CONF_GATEWAY_STATISTICS_INTERVAL, DEFAULT_GATEWAY_STATISTICS_INTERVAL)
+    periodic_telegrams_per_second = gateway_config.get(CONF_GATEWAY_PERIODIC_TELEGRAMS_PER_SECOND, DEFAULT_GATEWAY_PERIODIC_TELEGRAMS_PER_SECOND)
+    send_telegrams_per_second = gateway_config.get(CONF_GATEWAY_SEND_TELEGRAMS_PER_SECOND, DEFAULT_GATEWAY_SEND_TELEGRAMS_PER_SECOND)
+    simulation_speed = gateway_config.get(CONF_GATEWAY_SIMULATION_SPEED, DEFAULT_GATEWAY_SIMULATION_SPEED)
+    latency_instrumentation = gateway_config.get(CONF_GATEWAY_LATENCY_INSTRUMENTATION, False)
+    telegram_recorder = None
+    if gateway_config.get(CONF_GATEWAY_TELEGRAM_LOG, None):
+        # lazy import because recording is rarely enabled
+        from .telegram_recorder import TelegramRecorder
+        telegram_recorder = TelegramRecorder(hass.config.path(gateway_config[CONF_GATEWAY_TELEGRAM_LOG]),
+                                             int(gateway_config.get(CONF_GATEWAY_TELEGRAM_LOG_MAX_SIZE, DEFAULT_GATEWAY_TELEGRAM_LOG_MAX_SIZE) * 1024 * 1024),
+                                             gateway_config.get(CONF_GATEWAY_TELEGRAM_LOG_BACKUP_COUNT, DEFAULT_GATEWAY_TELEGRAM_LOG_BACKUP_COUNT))
+    telegram_deduplicator = get_telegram_deduplicator(hass, general_settings)
     LOGGER.debug(f"id: {gateway_id}, device type: {gateway_device_type}, serial path: {gateway_serial_path}, baud rate: {baud_rate}, base id: {gateway_base_id}")
-    usb_gateway = EnOceanGateway(general_settings, hass, gateway_id, gateway_device_type, gateway_serial_path, baud_rate, port, gateway_base_id, gateway_name, auto_reconnect, message_delay, config_entry)
+    usb_gateway = EnOceanGateway(general_settings, hass, gateway_id, gateway_device_type, gateway_serial_path, baud_rate, port, gateway_base_id, gateway_name, auto_reconnect, message_delay, config_entry, 
+                                 statistics_interval=statistics_interval, periodic_telegrams_per_second=periodic_telegrams_per_second,
+                                 send_telegrams_per_second=send_telegrams_per_second, telegram_recorder=telegram_recorder,
+                                 simulation_speed=simulation_speed, latency_instrumentation=latency_instrumentation,
+                                 telegram_deduplicator=telegram_deduplicator)
+
+    # parse device configuration once for all platforms
+    start = time.perf_counter()
+    usb_gateway.device_index = DeviceIndex(config_helpers.get_device_config(config, gateway_id))
+    LOGGER.debug("[%s] Indexed %d devices in %.1f ms.", LOG_PREFIX, len(usb_gateway.device_index), (time.perf_counter() - start) * 1000.0)
 
     
     await usb_gateway.async_setup()
@@ -158,7 +196,10 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     gateway = get_gateway_from_hass(hass, config_entry)
 
     LOGGER.info("Unload %s and all its supported devices!", gateway.dev_name)
-    gateway.unload()
+    await gateway.async_unload()
     del hass.data[DATA_ELTAKO][gateway.dev_name]
 
+    # configuration is read again when the gateway is set up again
+    config_helpers.invalidate_home_assistant_config(hass)
+
     return True
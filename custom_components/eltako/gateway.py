@@ -1,12 +1,16 @@
 """Representation of an Eltako gateway."""
+from __future__ import annotations
+
 import glob
 
 from os.path import basename, normpath
 import pytz
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 
 import serial
 import asyncio
+import time
+from typing import TYPE_CHECKING
 
 from eltakobus.serial import RS485SerialInterfaceV2
 from eltakobus.message import ESP2Message, EltakoPoll
@@ -14,15 +18,41 @@ from eltakobus.message import ESP2Message, EltakoPoll
 from eltakobus.util import AddressExpression
 from eltakobus.eep import EEP
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, SupportsResponse, callback
 from homeassistant.const import CONF_MAC
 from homeassistant.helpers.dispatcher import async_dispatcher_connect, dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceRegistry
 from homeassistant.config_entries import ConfigEntry
 
 from .const import *
 from . import config_helpers
+from .telegram_router import TelegramRouter
+from .message_bridge import MessageBridge
+from .decode_cache import MessageDecodeCache
+from .scheduler import PeriodicScheduler
+from .send_queue import SendQueue, SendPriority
+from .device_index import DeviceIndex
+from .eep_registry import EEPRegistry, EEPRegistryEntry, get_eep_registry
+from .gateway_statistics import GatewayStatistics, STATISTIC_LAST_MESSAGE_RECEIVED, STATISTIC_RECEIVED_MESSAGE_COUNT, STATISTIC_LATENCY, STATISTIC_RECONNECT_COUNT, STATISTIC_RECONNECT_DURATION, \
+    STATISTIC_DUPLICATE_TELEGRAMS
+from .backoff import ExponentialBackoff
+from .telegram_deduplicator import TelegramDeduplicator
+
+if TYPE_CHECKING:
+    # optional features are only imported when they are enabled
+    from .latency import LatencyTracker
+    from .telegram_recorder import TelegramRecorder
+
+# interval in seconds in which recorded telegrams are written to disk
+TELEGRAM_RECORDER_FLUSH_INTERVAL = 5
+
+# seconds to wait for the bus thread to exit before it is abandoned
+BUS_STOP_TIMEOUT = 5
+# seconds a gateway may be disconnected before it is reconnected, doubled for every failed attempt
+RECONNECT_BACKOFF_INITIAL = 10
+RECONNECT_BACKOFF_MAX = 300
 
 
 async def async_get_base_ids_of_registered_gateway(device_registry: DeviceRegistry) -> list[str]:
@@ -48,7 +78,11 @@ class EnOceanGateway:
 
     def __init__(self, general_settings:dict, hass: HomeAssistant, 
                  dev_id: int, dev_type: GatewayDeviceType, serial_path: str, baud_rate: int, port: int, base_id: AddressExpression, dev_name: str, auto_reconnect: bool=True, message_delay:float=None, 
-                 config_entry: ConfigEntry = None):
+                 config_entry: ConfigEntry = None, statistics_interval: float=DEFAULT_GATEWAY_STATISTICS_INTERVAL,
+                 periodic_telegrams_per_second: float=DEFAULT_GATEWAY_PERIODIC_TELEGRAMS_PER_SECOND,
+                 send_telegrams_per_second: float=DEFAULT_GATEWAY_SEND_TELEGRAMS_PER_SECOND,
+                 telegram_recorder: TelegramRecorder=None, simulation_speed: float=DEFAULT_GATEWAY_SIMULATION_SPEED,
+                 latency_instrumentation: bool=False, telegram_deduplicator: TelegramDeduplicator=None):
 
         """Initialize the Eltako gateway."""
 
@@ -57,6 +91,7 @@ class EnOceanGateway:
         self.baud_rate = baud_rate
         self._auto_reconnect = auto_reconnect
         self._message_delay = message_delay
+        self._simulation_speed = simulation_speed
         self.port = port
         self._attr_dev_type = dev_type
         self._attr_serial_path = serial_path
@@ -66,15 +101,49 @@ class EnOceanGateway:
         self.general_settings = general_settings
         self._attr_dev_id = dev_id
         self._attr_base_id = base_id
+        # signal for messages to be sent, entities send a message for every command
+        self._send_message_event_id = config_helpers.get_bus_event_type(base_id, SIGNAL_SEND_MESSAGE)
         self.config_entry_id = config_entry.entry_id
 
-        self._last_message_received_handler = None
         self._connection_state_handler = None
-        self._received_message_count_handler = None
+
+        # reconnects are done in the event loop, blocking parts run in an executor
+        self._reconnect_lock = asyncio.Lock()
+        self._reconnect_backoff = ExponentialBackoff(RECONNECT_BACKOFF_INITIAL, RECONNECT_BACKOFF_MAX)
+        self._reconnect_handle: asyncio.TimerHandle | None = None
+        self._is_running = False
+
+        self._statistics = GatewayStatistics()
+        self._statistics_interval = statistics_interval
+        self._statistics_flush_handle = None
+
+        self._periodic_scheduler = PeriodicScheduler(hass, periodic_telegrams_per_second)
+        self._send_queue = SendQueue(hass, self._async_send_message_to_serial_bus, send_telegrams_per_second, self._statistics)
+
+        self._telegram_router = TelegramRouter()
+        # received telegrams are handed over from the bus thread in batches
+        self._message_bridge = MessageBridge(hass)
+        # parsed device configuration, set when the gateway is set up
+        self.device_index: DeviceIndex = DeviceIndex({})
+        self._eep_registry: EEPRegistry = get_eep_registry()
+        self._decode_cache = MessageDecodeCache()
+
+        # optionally records all received and sent telegrams
+        self._telegram_recorder = telegram_recorder
+        self._telegram_recorder_flush_handle = None
+
+        # optionally drops telegrams already received by another gateway, shared by all gateways
+        self._telegram_deduplicator = telegram_deduplicator
+
+        # optionally measures latencies of received telegrams, None if disabled
+        self._latency_tracker: LatencyTracker | None = None
+        if latency_instrumentation:
+            from .latency import LatencyTracker
+            self._latency_tracker = LatencyTracker()
 
         self._attr_model = GATEWAY_DEFAULT_NAME + " - " + self.dev_type.upper()
 
-        if GatewayDeviceType.is_esp2_gateway(self.dev_type):
+        if GatewayDeviceType.is_esp2_gateway(self.dev_type) or GatewayDeviceType.is_simulator(self.dev_type):
             self.native_protocol = 'ESP2'
         else:
             self.native_protocol = 'ESP3'
@@ -95,39 +164,76 @@ class EnOceanGateway:
             self.hass.create_task(
                 self._connection_state_handler(status)
             )
+        if self._is_running:
+            # status changes are reported from the bus thread
+            self.hass.loop.call_soon_threadsafe(self._schedule_reconnect, status)
 
 
-    def set_last_message_received_handler(self, handler):
-        self._last_message_received_handler = handler
+    @callback
+    def _schedule_reconnect(self, connected: bool) -> None:
+        """Reconnect with exponential back-off as long as the gateway stays disconnected."""
+        if connected or not self._is_running or not self._auto_reconnect:
+            self._reconnect_backoff.reset()
+            self._cancel_scheduled_reconnect()
+            return
 
+        if self._reconnect_handle is not None:
+            return
+
+        delay = self._reconnect_backoff.next_delay()
+        LOGGER.debug("[Gateway] [Id: %d] Is disconnected. Reconnect in %s seconds if not connected until then.", self.dev_id, delay)
+        self._reconnect_handle = self.hass.loop.call_later(delay, self._reconnect_if_disconnected)
+
+
+    @callback
+    def _reconnect_if_disconnected(self) -> None:
+        self._reconnect_handle = None
+        if self._is_running and not self._bus.is_active():
+            self.hass.async_create_task(self.async_reconnect())
 
-    def _fire_last_message_received_event(self):
-        if self._last_message_received_handler:
-            self.hass.create_task(
-                self._last_message_received_handler( datetime.now(UTC).replace(tzinfo=pytz.UTC) )
-            )
+
+    def _cancel_scheduled_reconnect(self) -> None:
+        if self._reconnect_handle is not None:
+            self._reconnect_handle.cancel()
+            self._reconnect_handle = None
+
+
+    def set_last_message_received_handler(self, handler):
+        async def async_timestamp_to_datetime(timestamp: float) -> None:
+            await handler( datetime.fromtimestamp(timestamp, UTC).replace(tzinfo=pytz.UTC) )
+        self._statistics.add_listener(STATISTIC_LAST_MESSAGE_RECEIVED, async_timestamp_to_datetime)
 
 
     def set_received_message_count_handler(self, handler):
-        self._received_message_count_handler = handler
+        self._statistics.add_listener(STATISTIC_RECEIVED_MESSAGE_COUNT, handler)
 
 
-    def _fire_received_message_count_event(self):
-        self._received_message_count += 1
-        if self._received_message_count_handler:
-            self.hass.create_task(
-                self._received_message_count_handler( self._received_message_count ),
-            )
+    @property
+    def send_queue(self) -> SendQueue:
+        """Return the queue of outgoing telegrams."""
+        return self._send_queue
+
+
+    @property
+    def periodic_scheduler(self) -> PeriodicScheduler:
+        """Return the scheduler for periodic work of entities like status updates of climate controllers."""
+        return self._periodic_scheduler
+
+
+    @property
+    def statistics(self) -> GatewayStatistics:
+        """Return the statistics which are periodically flushed to the sensors."""
+        return self._statistics
+
 
     def process_messages(self, data=None):
-        """Received message from bus in HA loop. (Actions needs to run outside bus thread!)"""
-        self._fire_received_message_count_event()
-        self._fire_last_message_received_event()
+        """Count received message. Values are only accumulated and flushed periodically to the sensors."""
+        self._statistics.increment(STATISTIC_RECEIVED_MESSAGE_COUNT)
+        self._statistics.set(STATISTIC_LAST_MESSAGE_RECEIVED, time.time())
 
     
     def _init_bus(self):
-        self._received_message_count = 0
-        self._fire_received_message_count_event()
+        self._statistics.set(STATISTIC_RECEIVED_MESSAGE_COUNT, 0)
 
         if GatewayDeviceType.is_esp2_gateway(self.dev_type):
             self._bus = RS485SerialInterfaceV2(self.serial_path, 
@@ -136,6 +242,14 @@ class EnOceanGateway:
                                                delay_message=self._message_delay,
                                                auto_reconnect=self._auto_reconnect)
             
+        elif GatewayDeviceType.is_simulator(self.dev_type):
+            # lazy import to avoid preloading the simulator
+            from .simulated_bus import SimulatedBus
+            # devices are read when the bus is started because the device index is set after the gateway is created
+            self._bus = SimulatedBus(callback=self._callback_receive_message_from_serial_bus,
+                                     get_devices=lambda: self.device_index.get_all_entries(),
+                                     speed=self._simulation_speed)
+
         elif GatewayDeviceType.is_lan_gateway(self.dev_type):
             # lazy import to avoid preloading library
             from esp2_gateway_adapter.esp3_tcp_com import TCP2SerialCommunicator
@@ -213,21 +327,50 @@ class EnOceanGateway:
     ### send and receive funtions for RS485 bus (serial bus)
     ### all events are looped through the HA event bus so that other automations can work with those events. History about events can aslo be created.
 
-    def reconnect(self):
-        self._bus.stop()
-        self._init_bus()
-        self._bus.start()
+    async def async_reconnect(self) -> None:
+        """Replace the bus by a new connection without blocking the event loop."""
+        async with self._reconnect_lock:
+            start = time.monotonic()
+            LOGGER.info("[Gateway] [Id: %d] Reconnect", self.dev_id)
+            await self._async_stop_bus()
+            self._init_bus()
+            self._bus.start()
+
+            self._statistics.increment(STATISTIC_RECONNECT_COUNT)
+            self._statistics.set(STATISTIC_RECONNECT_DURATION, round((time.monotonic() - start) * 1000.0, 1))
+
+
+    async def _async_stop_bus(self) -> None:
+        """Stop the bus thread and wait in an executor until it exited or the timeout is over."""
+        bus = self._bus
+        bus.stop()
+        if not bus.is_alive():
+            return
+        await self.hass.async_add_executor_job(bus.join, BUS_STOP_TIMEOUT)
+        if bus.is_alive():
+            LOGGER.warning("[Gateway] [Id: %d] Bus thread did not stop within %d seconds and is abandoned.", self.dev_id, BUS_STOP_TIMEOUT)
 
 
     async def async_setup(self):
         """Initialized serial bus and register callback function on HA event bus."""
         self._bus.start()
+        self._is_running = True
         LOGGER.debug("[Gateway] [Id: %d] Was started.", self.dev_id)
 
+        # flush statistics periodically instead of for every received message
+        self._statistics_flush_handle = async_track_time_interval(
+            self.hass, self._async_flush_statistics, timedelta(seconds=self._statistics_interval)
+        )
+
+        if self._telegram_recorder is not None:
+            LOGGER.info("[Gateway] [Id: %d] Record telegrams into %s", self.dev_id, self._telegram_recorder.filename)
+            self._telegram_recorder_flush_handle = async_track_time_interval(
+                self.hass, self._async_flush_telegram_recorder, timedelta(seconds=TELEGRAM_RECORDER_FLUSH_INTERVAL)
+            )
+
         # receive messages from HA event bus
-        event_id = config_helpers.get_bus_event_type(self.base_id, SIGNAL_SEND_MESSAGE)
         self.dispatcher_disconnect_handle = async_dispatcher_connect(
-            self.hass, event_id, self._callback_send_message_to_serial_bus
+            self.hass, self._send_message_event_id, self._callback_send_message_to_serial_bus
         )
 
         # Register home assistant service for sending arbitrary telegrams.
@@ -238,78 +381,166 @@ class EnOceanGateway:
         service_name = f"gateway_{self._attr_dev_id}_send_message"
         self.hass.services.async_register(DOMAIN, service_name, self.async_service_send_message)
 
+        # Batch service to send many telegrams with one call. Results are reported per entry.
+        service_name = f"gateway_{self._attr_dev_id}_send_messages"
+        self.hass.services.async_register(DOMAIN, service_name, self.async_service_send_messages, supports_response=SupportsResponse.OPTIONAL)
+
 
     # Command Section
-    async def async_service_send_message(self, event, raise_exception=False) -> None:
-        """Send an arbitrary message with the provided eep."""
-        LOGGER.debug(f"[Service Send Message: {event.service}] Received event data: {event.data}")
-        
+    def _parse_service_sender(self, data: dict) -> tuple[AddressExpression, EEPRegistryEntry]:
+        """Return sender id and EEP of a send message request. Raises ValueError if one of them is invalid."""
+        sender_id_str = data.get("id", None)
         try:
-            sender_id_str = event.data.get("id", None)
             sender_id:AddressExpression = AddressExpression.parse(sender_id_str)
-        except:
-            LOGGER.error(f"[Service Send Message: {event.service}] No valid sender id defined. (Given sender id: {sender_id_str})")
-            return
+        except Exception:
+            raise ValueError(f"No valid sender id defined. (Given sender id: {sender_id_str})")
+
+        sender_eep_str = data.get("eep", None)
+        sender_eep = self._eep_registry.find(sender_eep_str)
+        if sender_eep is None:
+            raise ValueError(f"No valid EEP defined. (Given EEP: {sender_eep_str})")
+
+        return sender_id, sender_eep
+
+
+    @staticmethod
+    def _create_eep(sender_eep: EEPRegistryEntry, data: dict, log_prefix: str) -> EEP:
+        """Create the EEP with arguments from data. Missing arguments are set to 0."""
+        knargs, uknargs = sender_eep.get_init_args(data)
+        LOGGER.debug("[%s] Provided EEP (%s) args: %s)", log_prefix, sender_eep.eep.__name__, knargs)
+        LOGGER.debug("[%s] Missing EEP (%s) args: %s)", log_prefix, sender_eep.eep.__name__, uknargs)
+        return sender_eep.eep(**knargs, **uknargs)
+
 
+    @staticmethod
+    def _get_service_send_priority(event) -> SendPriority:
+        """Service calls triggered by a user are sent before the ones of automations."""
+        context = getattr(event, 'context', None)
+        return SendPriority.INTERACTIVE if context is not None and context.user_id else SendPriority.AUTOMATION
+
+
+    async def async_service_send_message(self, event, raise_exception=False) -> None:
+        """Send an arbitrary message with the provided eep."""
+        log_prefix = f"Service Send Message: {event.service}"
+        LOGGER.debug("[%s] Received event data: %s", log_prefix, event.data)
+        
         try:
-            sender_eep_str = event.data.get("eep", None)
-            sender_eep:EEP = EEP.find(sender_eep_str)
-        except:
-            LOGGER.error(f"[Service Send Message: {event.service}] No valid sender id defined. (Given sender id: {sender_id_str})")
+            sender_id, sender_eep = self._parse_service_sender(event.data)
+        except ValueError as e:
+            LOGGER.error(f"[{log_prefix}] {e}")
             return
         
-        # prepare all arguements for eep constructor
-        import inspect
-        sig = inspect.signature(sender_eep.__init__)
-        eep_init_args = [param.name for param in sig.parameters.values() if param.kind == param.POSITIONAL_OR_KEYWORD]
-        knargs = {filter_key:event.data[filter_key] for filter_key in eep_init_args if filter_key in event.data and filter_key != 'self'}
-        LOGGER.debug(f"[Service Send Message: {event.service}] Provided EEP ({sender_eep.__name__}) args: {knargs})")
-        uknargs = {filter_key:0 for filter_key in eep_init_args if filter_key not in event.data and filter_key != 'self'}
-        LOGGER.debug(f"[Service Send Message: {event.service}] Missing EEP ({sender_eep.__name__}) args: {uknargs})")
-        eep_args = knargs
-        eep_args.update(uknargs)
-            
-        eep:EEP = sender_eep(**eep_args)
+        eep:EEP = self._create_eep(sender_eep, event.data, log_prefix)
 
         try:
             # create message
             msg = eep.encode_message(sender_id[0])
-            LOGGER.debug(f"[Service Send Message: {event.service}] Generated message: {msg} Serialized: {msg.serialize().hex()}")
+            LOGGER.debug(f"[{log_prefix}] Generated message: {msg} Serialized: {msg.serialize().hex()}")
             # send message
-            self.send_message(msg)
+            self.send_message(msg, self._get_service_send_priority(event))
         except Exception as e:
-            LOGGER.error(f"[Service Send Message: {event.service}] Cannot send message.", exc_info=True, stack_info=True)
+            LOGGER.error(f"[{log_prefix}] Cannot send message.", exc_info=True, stack_info=True)
             if raise_exception:
                 raise e
 
 
+    async def async_service_send_messages(self, event) -> dict:
+        """Send a list of arbitrary messages. All entries are validated and encoded before the valid ones are queued at once.
 
-    def send_message(self, msg: ESP2Message):
+        Each entry of the list 'messages' has the same fields as for the service send_message. If 'atomic' is true
+        no message is sent if one entry is invalid. Returns the result per entry.
+        """
+        log_prefix = f"Service Send Messages: {event.service}"
+        entries = event.data.get("messages", [])
+        atomic = event.data.get("atomic", False)
+        LOGGER.debug(f"[{log_prefix}] Received {len(entries)} messages.")
+
+        results = []
+        messages = []
+        for index, entry in enumerate(entries):
+            result = {"index": index, "id": None, "eep": None, "success": False}
+            try:
+                if not isinstance(entry, dict):
+                    raise ValueError("Entry is not a dictionary.")
+                result["id"] = entry.get("id", None)
+                result["eep"] = entry.get("eep", None)
+                sender_id, sender_eep = self._parse_service_sender(entry)
+                eep:EEP = self._create_eep(sender_eep, entry, log_prefix)
+                messages.append(eep.encode_message(sender_id[0]))
+                result["success"] = True
+            except Exception as e:
+                LOGGER.error(f"[{log_prefix}] Entry {index} is invalid: {e}")
+                result["error"] = str(e)
+            results.append(result)
+
+        if atomic and len(messages) < len(entries):
+            LOGGER.error(f"[{log_prefix}] No message sent because of invalid entries.")
+            for result in results:
+                result["success"] = False
+            messages = []
+
+        self.send_messages(messages, self._get_service_send_priority(event))
+
+        return {"results": results}
+
+
+    def send_message(self, msg: ESP2Message, priority: SendPriority=SendPriority.AUTOMATION):
         """Put message on RS485 bus. First the message is put onto HA event bus so that other automations can react on messages."""
-        event_id = config_helpers.get_bus_event_type(self.base_id, SIGNAL_SEND_MESSAGE)
-        dispatcher_send(self.hass, event_id, msg)
+        dispatcher_send(self.hass, self._send_message_event_id, msg, priority)
+
+
+    @callback
+    def send_messages(self, msgs: list[ESP2Message], priority: SendPriority=SendPriority.AUTOMATION):
+        """Queue several messages at once so that no other message is put in between. Must be called from the event loop."""
+        for msg in msgs:
+            self._callback_send_message_to_serial_bus(msg, priority)
+
+
+    async def async_unload(self):
+        """Disconnect callbacks established at init time and stop the bus without blocking the event loop."""
+        self._is_running = False
+        self._cancel_scheduled_reconnect()
+
+        if self._statistics_flush_handle:
+            self._statistics_flush_handle()
+            self._statistics_flush_handle = None
+
+        self._periodic_scheduler.cancel()
+        self._send_queue.cancel()
 
+        if self._telegram_recorder_flush_handle:
+            self._telegram_recorder_flush_handle()
+            self._telegram_recorder_flush_handle = None
+        if self._telegram_recorder is not None:
+            await self.hass.async_add_executor_job(self._telegram_recorder.close)
 
-    def unload(self):
-        """Disconnect callbacks established at init time."""
         if self.dispatcher_disconnect_handle:
-            self._bus.stop()
-            self._bus.join()
+            async with self._reconnect_lock:
+                await self._async_stop_bus()
             LOGGER.debug("[Gateway] [Id: %d] Was stopped.", self.dev_id)
             self.dispatcher_disconnect_handle()
             self.dispatcher_disconnect_handle = None
 
 
-    def _callback_send_message_to_serial_bus(self, msg):
+    @callback
+    def _callback_send_message_to_serial_bus(self, msg, priority: SendPriority=SendPriority.AUTOMATION):
         """Callback method call from HA when receiving events from serial bus."""
         if self._bus.is_active():
             if isinstance(msg, ESP2Message):
-                LOGGER.debug("[Gateway] [Id: %d] Send message: %s - Serialized: %s", self.dev_id, msg, msg.serialize().hex())
+                # messages are sent ordered by priority and limited in rate
+                self._send_queue.put(msg, priority)
+        else:
+            LOGGER.warn("[Gateway] [Id: %d] Serial port %s is not available!!! message (%s) was not sent.", self.dev_id, self.serial_path, msg)
 
-                # put message on serial bus
-                self.hass.create_task(
-                    self._bus.send(msg)
-                )
+
+    async def _async_send_message_to_serial_bus(self, msg: ESP2Message) -> None:
+        """Put message on serial bus. Called by the send queue."""
+        if self._bus.is_active():
+            LOGGER.debug("[Gateway] [Id: %d] Send message: %s - Serialized: %s", self.dev_id, msg, msg.serialize().hex())
+            if self._telegram_recorder is not None:
+                from .telegram_recorder import TelegramDirection
+                self._telegram_recorder.record(TelegramDirection.SENT, msg)
+            await self._bus.send(msg)
         else:
             LOGGER.warn("[Gateway] [Id: %d] Serial port %s is not available!!! message (%s) was not sent.", self.dev_id, self.serial_path, msg)
 
@@ -322,13 +553,104 @@ class EnOceanGateway:
         """
 
         if type(message) not in [EltakoPoll]:
-            LOGGER.debug("[Gateway] [Id: %d] Received message: %s", self.dev_id, message)
-            self.process_messages()
+            if self._telegram_recorder is not None and isinstance(message, ESP2Message):
+                from .telegram_recorder import TelegramDirection
+                self._telegram_recorder.record(TelegramDirection.RECEIVED, message)
+
+            self._process_received_message(message)
+
+
+    def _process_received_message(self, message):
+        """Count message and hand it over to the entities. Can be called from any thread."""
+        LOGGER.debug("[Gateway] [Id: %d] Received message: %s", self.dev_id, message)
+        self.process_messages()
+
+        if isinstance(message, ESP2Message):
+            if self._telegram_deduplicator is not None and self._is_duplicate(message):
+                self._statistics.increment(STATISTIC_DUPLICATE_TELEGRAMS)
+                return
+
+            # only entities listening to the sender address get the message
+            if self._latency_tracker is None:
+                self._message_bridge.call_soon(self._telegram_router.dispatch, message)
+            else:
+                self._message_bridge.call_soon(self._dispatch_with_latency_tracking, message, time.perf_counter())
+
+
+    def _is_duplicate(self, message: ESP2Message) -> bool:
+        """Check if the telegram was already handed over to entities by another gateway."""
+        has_subscribers = len(self._telegram_router.get_subscribers(message.address)) > 0
+        return self._telegram_deduplicator.is_duplicate(message, self, has_subscribers)
+
+
+    def _dispatch_with_latency_tracking(self, message: ESP2Message, received_at: float) -> None:
+        self._latency_tracker.telegram_dispatched(received_at)
+        try:
+            self._telegram_router.dispatch(message)
+        finally:
+            self._latency_tracker.telegram_done()
+
+
+    async def _async_flush_statistics(self, *args) -> None:
+        if self._latency_tracker is not None:
+            self._statistics.set(STATISTIC_LATENCY, self._latency_tracker.snapshot())
+        await self._statistics.async_flush()
+
+
+    async def _async_flush_telegram_recorder(self, *args) -> None:
+        try:
+            await self.hass.async_add_executor_job(self._telegram_recorder.flush)
+        except OSError:
+            LOGGER.exception("[Gateway] [Id: %d] Cannot write telegrams to %s", self.dev_id, self._telegram_recorder.filename)
+
+
+    async def async_replay_telegrams(self, filename: str, speed: float | None = 1.0) -> int:
+        """Feed received telegrams of a telegram log into the gateway as if they came from the bus.
+
+        speed 1.0 keeps the original timing, 10.0 is ten times faster and None replays as fast as possible.
+        Returns the amount of replayed telegrams.
+        """
+        from .telegram_recorder import async_replay_telegrams, read_telegram_records
+
+        records = await self.hass.async_add_executor_job(read_telegram_records, filename)
+        LOGGER.info("[Gateway] [Id: %d] Replay %d recorded telegrams from %s", self.dev_id, len(records), filename)
+        return await async_replay_telegrams(records, self._process_received_message, speed)
+
+    @property
+    def telegram_router(self) -> TelegramRouter:
+        """Return the router dispatching received messages to the entities."""
+        return self._telegram_router
+
+    @property
+    def message_bridge(self) -> MessageBridge:
+        """Return the bridge handing over received messages from the bus thread into the event loop."""
+        return self._message_bridge
+
+    @property
+    def telegram_recorder(self) -> TelegramRecorder | None:
+        """Return the recorder of received and sent telegrams if recording is enabled."""
+        return self._telegram_recorder
+
+    @property
+    def send_message_event_id(self) -> str:
+        """Return the signal used to put messages onto the bus of this gateway."""
+        return self._send_message_event_id
+
+    @property
+    def telegram_deduplicator(self) -> TelegramDeduplicator | None:
+        """Return the deduplicator shared by all gateways if de-duplication is enabled."""
+        return self._telegram_deduplicator
+
+    @property
+    def latency_tracker(self) -> LatencyTracker | None:
+        """Return the latency tracker if latency instrumentation is enabled."""
+        return self._latency_tracker
+
+    @property
+    def decode_cache(self) -> MessageDecodeCache:
+        """Return the cache sharing decoded messages between entities."""
+        return self._decode_cache
 
-            if isinstance(message, ESP2Message):
-                event_id = config_helpers.get_bus_event_type(self.base_id, SIGNAL_RECEIVE_MESSAGE)
-                dispatcher_send(self.hass, event_id, message)
-            
     @property
     def unique_id(self) -> str:
         """Return the unique id of the gateway."""
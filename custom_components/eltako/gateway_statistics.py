@@ -0,0 +1,77 @@
+"""Coalescing statistics of a gateway."""
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .const import LOGGER
+
+STATISTIC_RECEIVED_MESSAGE_COUNT = "received_message_count"
+STATISTIC_LAST_MESSAGE_RECEIVED = "last_message_received"
+STATISTIC_SEND_QUEUE_DEPTH = "send_queue_depth"
+STATISTIC_SEND_QUEUE_WAIT_TIME = "send_queue_wait_time"
+STATISTIC_LATENCY = "latency"
+STATISTIC_SUPPRESSED_STATE_WRITES = "suppressed_state_writes"
+STATISTIC_RECONNECT_COUNT = "reconnect_count"
+STATISTIC_RECONNECT_DURATION = "reconnect_duration"
+STATISTIC_DUPLICATE_TELEGRAMS = "duplicate_telegrams"
+
+_NOT_FLUSHED = object()
+
+
+class GatewayStatistics:
+    """Accumulates statistics in plain values and hands them over to listeners in batches.
+
+    Counters are updated for every telegram which can be thousands per second during
+    status bursts of a FAM14. Instead of creating a task and a state write per telegram
+    the values are only collected and flushed periodically. Listeners are only called
+    for values which changed since the last flush.
+    """
+
+    def __init__(self):
+        self._values: dict[str, Any] = {}
+        self._flushed_values: dict[str, Any] = {}
+        self._listeners: dict[str, list[Callable[[Any], Awaitable[None]]]] = {}
+        self.flush_count: int = 0
+
+    def increment(self, key: str, amount: int = 1) -> None:
+        """Increase a counter."""
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, key: str, value: Any) -> None:
+        """Set the latest value of a statistic."""
+        self._values[key] = value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the current (maybe not yet flushed) value of a statistic."""
+        return self._values.get(key, default)
+
+    def add_listener(self, key: str, listener: Callable[[Any], Awaitable[None]]) -> Callable[[], None]:
+        """Register an async listener for a statistic. Returns a function to remove it."""
+        self._listeners.setdefault(key, []).append(listener)
+        # new listeners get the current value with the next flush
+        self._flushed_values.pop(key, None)
+
+        def remove_listener() -> None:
+            listeners = self._listeners.get(key, [])
+            if listener in listeners:
+                listeners.remove(listener)
+
+        return remove_listener
+
+    async def async_flush(self, *args) -> int:
+        """Hand over all changed values to their listeners. Returns the amount of called listeners."""
+        called_listeners = 0
+        for key, value in list(self._values.items()):
+            listeners = self._listeners.get(key)
+            if not listeners or self._flushed_values.get(key, _NOT_FLUSHED) == value:
+                continue
+
+            self._flushed_values[key] = value
+            for listener in list(listeners):
+                try:
+                    await listener(value)
+                except Exception:
+                    LOGGER.exception("[Gateway Statistics] Listener for '%s' failed.", key)
+                called_listeners += 1
+
+        self.flush_count += 1
+        return called_listeners
@@ -0,0 +1,122 @@
+"""Optional latency measurement of received telegrams from the bus to the state write in Home Assistant."""
+import math
+import time
+
+from .const import STAGE_BUS_TO_DISPATCH, STAGE_DISPATCH_TO_DECODE, STAGE_DECODE_TO_STATE, STAGE_TOTAL, STAGES, PERCENTILES
+
+
+class LatencyHistogram:
+    """Histogram with logarithmic buckets from 10µs to 100s.
+
+    Memory is constant regardless of the amount of samples. Percentiles are reported as
+    upper bound of the bucket they fall into which is at most 26% above the real value.
+    """
+
+    MIN_VALUE = 1e-5
+    BUCKETS_PER_DECADE = 10
+    DECADES = 7
+
+    def __init__(self):
+        # first bucket holds values below MIN_VALUE, last one values above the range
+        self._counts: list[int] = [0] * (self.BUCKETS_PER_DECADE * self.DECADES + 2)
+        self.count: int = 0
+        self.max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a latency in seconds."""
+        if seconds < self.MIN_VALUE:
+            index = 0
+        else:
+            index = min(int(math.log10(seconds / self.MIN_VALUE) * self.BUCKETS_PER_DECADE) + 1, len(self._counts) - 1)
+        self._counts[index] += 1
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+
+    def _upper_bound(self, index: int) -> float:
+        return self.MIN_VALUE * 10 ** (index / self.BUCKETS_PER_DECADE)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Return the latency in seconds below which the given percentage of samples lies."""
+        if self.count == 0:
+            return None
+
+        rank = math.ceil(self.count * percentile / 100.0)
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= max(rank, 1):
+                # values above the range are reported with the maximum
+                if index == len(self._counts) - 1:
+                    return self.max
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """Return count and percentiles in milliseconds."""
+        result = {"count": self.count}
+        for p in PERCENTILES:
+            value = self.percentile(p)
+            result[f"p{p}"] = round(value * 1000.0, 2) if value is not None else None
+        return result
+
+
+class LatencyTracker:
+    """Measures how long received telegrams take from the bus thread to the state write of the entities.
+
+    Telegrams are dispatched one after another in the event loop so only the timestamps
+    of the telegram being dispatched are kept. Stages are recorded for the first entity
+    which decodes the telegram and schedules a state update.
+    """
+
+    def __init__(self):
+        self.stages: dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in STAGES}
+        # total latency per EEP
+        self.eeps: dict[str, LatencyHistogram] = {}
+        self._received_at: float | None = None
+        self._dispatched_at: float = 0.0
+        self._last_stage_at: float | None = None
+        self._state_recorded = False
+
+    def telegram_dispatched(self, received_at: float) -> None:
+        """Start tracking a telegram which was received from the bus at the given time.perf_counter() value."""
+        now = time.perf_counter()
+        self.stages[STAGE_BUS_TO_DISPATCH].record(now - received_at)
+        self._received_at = received_at
+        self._last_stage_at = None
+        self._dispatched_at = now
+        self._state_recorded = False
+
+    def telegram_decoded(self) -> None:
+        """Record the time the telegram was decoded first."""
+        if self._received_at is None or self._last_stage_at is not None:
+            return
+        self._last_stage_at = time.perf_counter()
+        self.stages[STAGE_DISPATCH_TO_DECODE].record(self._last_stage_at - self._dispatched_at)
+
+    def state_scheduled(self, eep) -> None:
+        """Record the time the first state update was scheduled because of the telegram."""
+        if self._received_at is None or self._state_recorded:
+            return
+        now = time.perf_counter()
+        self._state_recorded = True
+        if self._last_stage_at is not None:
+            self.stages[STAGE_DECODE_TO_STATE].record(now - self._last_stage_at)
+
+        total = now - self._received_at
+        self.stages[STAGE_TOTAL].record(total)
+        if eep is not None:
+            histogram = self.eeps.get(eep.eep_string)
+            if histogram is None:
+                histogram = self.eeps[eep.eep_string] = LatencyHistogram()
+            histogram.record(total)
+
+    def telegram_done(self) -> None:
+        """Stop tracking the telegram. State updates scheduled afterwards are not caused by it."""
+        self._received_at = None
+
+    def snapshot(self) -> dict:
+        """Return percentiles in milliseconds per stage and per EEP."""
+        result = {stage: histogram.summary() for stage, histogram in self.stages.items()}
+        result["eep"] = {eep: histogram.summary() for eep, histogram in sorted(self.eeps.items())}
+        return result
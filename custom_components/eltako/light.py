@@ -32,27 +32,26 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Eltako light platform."""
     gateway: EnOceanGateway = get_gateway_from_hass(hass, config_entry)
-    config: ConfigType = get_device_config_for_gateway(hass, config_entry, gateway)
 
     entities: list[EltakoEntity] = []
     
     platform = Platform.LIGHT
-    if platform in config:
-        for entity_config in config[platform]:
-            try:
-                dev_conf = DeviceConf(entity_config)
-                sender_config = config_helpers.get_device_conf(entity_config, CONF_SENDER)
-
-                if dev_conf.eep in [A5_38_08]:
-                    entities.append(EltakoDimmableLight(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, sender_config.id, sender_config.eep))
-                elif dev_conf.eep in [M5_38_08]:
-                    entities.append(EltakoSwitchableLight(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, sender_config.id, sender_config.eep))
+    for device in gateway.device_index.get_platform_entries(platform):
+        try:
+            dev_conf = device.config
+            sender_config = device.sender
+
+            if dev_conf.eep in [A5_38_08]:
+                entities.append(EltakoDimmableLight(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, sender_config.id, sender_config.eep))
+            elif dev_conf.eep in [M5_38_08]:
+                entities.append(EltakoSwitchableLight(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, sender_config.id, sender_config.eep))
             
-            except Exception as e:
-                LOGGER.warning("[%s %s] Could not load configuration", platform, str(dev_conf.id))
-                LOGGER.critical(e, exc_info=True)
+        except Exception as e:
+            LOGGER.warning("[%s %s] Could not load configuration", platform, str(dev_conf.id))
+            LOGGER.critical(e, exc_info=True)
         
     validate_actuators_dev_and_sender_id(entities)
+    restore_last_states(hass, entities, platform)
     log_entities_to_be_added(entities, platform)
     async_add_entities(entities)
 
@@ -174,7 +173,7 @@ class EltakoDimmableLight(AbstractLightEntity):
         """
         try:
             if msg.org == 0x07:
-                decoded:A5_38_08 = self.dev_eep.decode_message(msg)
+                decoded:A5_38_08 = self.decode_message(msg)
             elif msg.org == 0x05:
                 LOGGER.debug("[Dimmable Light] Ignore on/off message with org=0x05")
                 return
@@ -292,7 +291,7 @@ class EltakoSwitchableLight(AbstractLightEntity):
     def value_changed(self, msg):
         """Update the internal state of this device."""
         try:
-            decoded = self.dev_eep.decode_message(msg)
+            decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[%s %s] Could not decode message: %s", Platform.LIGHT, str(self.dev_id), str(e))
             return
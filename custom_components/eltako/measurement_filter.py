@@ -0,0 +1,91 @@
+"""Throttling, deadband and aggregation of measurement values which are sent at a high rate."""
+import time
+
+from .const import *
+
+
+class MeasurementFilter:
+    """Decides which received values of a sensor are published to Home Assistant.
+
+    Values are collected in a window which is closed when the minimum publish interval
+    is over. The window only keeps count, sum, minimum and maximum so that memory is
+    constant regardless of how many telegrams arrive. The aggregated value of a window
+    is only published if it differs from the last published value by more than the
+    deadband.
+    """
+
+    def __init__(self, min_publish_interval: float = 0, deadband: float = 0, deadband_relative: float = 0,
+                 aggregation: str = AGGREGATION_LAST):
+        self.min_publish_interval = min_publish_interval
+        self.deadband = deadband
+        # in percent of the last published value
+        self.deadband_relative = deadband_relative
+        self.aggregation = aggregation
+
+        self.last_raw_value: float | None = None
+        self.published_value: float | None = None
+        self._reset_window()
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """Create a filter from the sensor configuration. Returns None if no option is set."""
+        options = {
+            'min_publish_interval': config.get(CONF_MIN_PUBLISH_INTERVAL, 0),
+            'deadband': config.get(CONF_DEADBAND, 0),
+            'deadband_relative': config.get(CONF_DEADBAND_RELATIVE, 0),
+            'aggregation': config.get(CONF_AGGREGATION, AGGREGATION_LAST),
+        }
+        if not options['min_publish_interval'] and not options['deadband'] and not options['deadband_relative']:
+            return None
+        return cls(**options)
+
+    def _reset_window(self) -> None:
+        self._window_started_at = None
+        self._count = 0
+        self._sum = 0.0
+        self._min = None
+        self._max = None
+
+    def _aggregate(self) -> float:
+        if self.aggregation == AGGREGATION_MEAN:
+            return self._sum / self._count
+        if self.aggregation == AGGREGATION_MIN:
+            return self._min
+        if self.aggregation == AGGREGATION_MAX:
+            return self._max
+        return self.last_raw_value
+
+    def _exceeds_deadband(self, value: float) -> bool:
+        if self.published_value is None:
+            return True
+        difference = abs(value - self.published_value)
+        if difference <= self.deadband:
+            return False
+        return difference > abs(self.published_value) * self.deadband_relative / 100.0
+
+    def add(self, value: float, now: float = None) -> float | None:
+        """Add a received value and return the value to be published or None."""
+        if now is None:
+            now = time.monotonic()
+
+        self.last_raw_value = value
+        if self._window_started_at is None:
+            self._window_started_at = now
+        self._count += 1
+        self._sum += value
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+
+        # the first value is published immediately
+        if self.published_value is not None and now - self._window_started_at < self.min_publish_interval:
+            return None
+
+        aggregated = self._aggregate()
+        self._reset_window()
+        if not self._exceeds_deadband(aggregated):
+            return None
+
+        self.published_value = aggregated
+        return aggregated
@@ -0,0 +1,47 @@
+"""Batched hand-over of received telegrams from the bus thread into the event loop."""
+from collections import deque
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant
+
+from .const import LOGGER
+
+
+class MessageBridge:
+    """Calls functions in the event loop which are requested from another thread.
+
+    Calls are appended to a deque which is thread-safe without a lock. The event loop
+    is only woken up for the first call after it drained the deque so that a burst of
+    telegrams results in one wake-up. All pending calls are then executed in order.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._pending: deque[tuple[Callable, tuple]] = deque()
+        self._wakeup_scheduled = False
+        self.wakeup_count: int = 0
+        self.call_count: int = 0
+
+    def call_soon(self, function: Callable, *args) -> None:
+        """Execute the function in the event loop. Can be called from any thread."""
+        self._pending.append((function, args))
+        # the flag is reset by the loop before it takes the pending calls, so no call is missed
+        if not self._wakeup_scheduled:
+            self._wakeup_scheduled = True
+            self.wakeup_count += 1
+            self.hass.loop.call_soon_threadsafe(self._drain)
+
+    def _drain(self) -> None:
+        self._wakeup_scheduled = False
+        pending = self._pending
+        # calls added in the meantime have scheduled a new wake-up
+        for _ in range(len(pending)):
+            function, args = pending.popleft()
+            try:
+                function(*args)
+            except Exception:
+                LOGGER.exception("[Message Bridge] Cannot process %s", args)
+            self.call_count += 1
+
+    def __len__(self) -> int:
+        return len(self._pending)
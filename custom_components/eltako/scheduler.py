@@ -0,0 +1,110 @@
+"""Shared scheduler for periodic work of all entities of a gateway."""
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+
+from .const import LOGGER
+
+
+class PeriodicJob:
+    """Job which is repeatedly executed by the scheduler."""
+
+    def __init__(self, action: Callable[[], Awaitable[None]], interval: float, weight: int):
+        self.action = action
+        self.interval = interval
+        # amount of telegrams the job sends per run
+        self.weight = weight
+        self.next_run: float = 0
+
+
+class PeriodicScheduler:
+    """Runs periodic jobs of one gateway in a single task.
+
+    Jobs with the same interval get evenly distributed phase offsets so that they
+    don't send their telegrams all at once. Additionally, jobs are delayed if the
+    telegrams of the previous job exceed the telegrams per second budget.
+    """
+
+    def __init__(self, hass: HomeAssistant, telegrams_per_second: float):
+        self.hass = hass
+        self._telegrams_per_second = telegrams_per_second
+        self._jobs: list[PeriodicJob] = []
+        self._epoch: float | None = None
+        self._budget_free_at: float = 0
+        self._jobs_changed = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def job_count(self) -> int:
+        """Return the amount of registered jobs."""
+        return len(self._jobs)
+
+    def _time(self) -> float:
+        return self.hass.loop.time()
+
+    def register(self, action: Callable[[], Awaitable[None]], interval: float, weight: int = 1) -> Callable[[], None]:
+        """Register a coroutine function to be called every interval seconds. Returns a function to unregister it."""
+        job = PeriodicJob(action, interval, weight)
+        self._jobs.append(job)
+        self._distribute_phases(interval)
+
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(self._async_run(), "eltako_periodic_scheduler")
+
+        def unregister() -> None:
+            if job in self._jobs:
+                self._jobs.remove(job)
+                self._distribute_phases(interval)
+
+        return unregister
+
+    def _distribute_phases(self, interval: float) -> None:
+        """Spread all jobs having the same interval evenly across it."""
+        now = self._time()
+        if self._epoch is None:
+            self._epoch = now
+
+        jobs = [j for j in self._jobs if j.interval == interval]
+        for i, job in enumerate(jobs):
+            next_run = self._epoch + i * interval / len(jobs)
+            # first run is in the future, at the latest after one interval
+            periods = int((now - next_run) // interval) + 1
+            job.next_run = next_run + max(periods, 0) * interval
+
+        self._jobs_changed.set()
+
+    async def _async_run(self) -> None:
+        while True:
+            if len(self._jobs) == 0:
+                delay = None
+            else:
+                job = min(self._jobs, key=lambda j: j.next_run)
+                now = self._time()
+                delay = max(job.next_run, self._budget_free_at) - now
+
+            if delay is None or delay > 0:
+                # wait for next job or until jobs changed
+                self._jobs_changed.clear()
+                try:
+                    await asyncio.wait_for(self._jobs_changed.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            job.next_run += job.interval
+            if job.next_run <= now:
+                job.next_run = now + job.interval
+            self._budget_free_at = now + job.weight / self._telegrams_per_second
+
+            try:
+                await job.action()
+            except Exception:
+                LOGGER.exception("[Periodic Scheduler] Periodic job %s failed.", job.action)
+
+    def cancel(self) -> None:
+        """Stop running jobs."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._jobs.clear()
@@ -80,6 +80,10 @@ class GeneralSettings(EltakoPlatformSchema):
     ENTITY_SCHEMA = vol.Schema({
             vol.Optional(CONF_FAST_STATUS_CHANGE, default=False): cv.boolean,
             vol.Optional(CONF_SHOW_DEV_ID_IN_DEV_NAME, default=False): cv.boolean,
+            vol.Optional(CONF_SUPPRESS_UNCHANGED_STATES, default=True): cv.boolean,
+            vol.Optional(CONF_STATE_KEEP_ALIVE_INTERVAL, default=DEFAULT_STATE_KEEP_ALIVE_INTERVAL): cv.positive_int,
+            vol.Optional(CONF_TELEGRAM_DEDUPLICATION_WINDOW, default=0): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+            vol.Optional(CONF_DEVICE_INFO_ENTITIES, default=True): cv.boolean,
         })
     
     @classmethod
@@ -187,6 +191,10 @@ class SensorSchema(EltakoPlatformSchema):
                 vol.Optional(CONF_VOC_TYPE_INDEXES, default=[0]): vol.All(cv.ensure_list, [vol.In([v.index for v in VOC_SubstancesType])]),
                 vol.Optional(CONF_METER_TARIFFS, default=DEFAULT_METER_TARIFFS): vol.All(cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1, max=16))]),
                 vol.Optional(CONF_DEVICE_CLASS): BINARY_SENSOR_DEVICE_CLASSES_SCHEMA,
+                vol.Optional(CONF_MIN_PUBLISH_INTERVAL, default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(CONF_DEADBAND, default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(CONF_DEADBAND_RELATIVE, default=0): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                vol.Optional(CONF_AGGREGATION, default=AGGREGATION_LAST): vol.In(AGGREGATIONS),
             }
         ),
     )
@@ -271,6 +279,14 @@ class GatewaySchema(EltakoPlatformSchema):
             vol.Optional(CONF_GATEWAY_AUTO_RECONNECT, default=True): cv.boolean,
             vol.Optional(CONF_GATEWAY_ADDRESS): cv.string,
             vol.Optional(CONF_GATEWAY_MESSAGE_DELAY, default=0.01): cv.Number,
+            vol.Optional(CONF_GATEWAY_STATISTICS_INTERVAL, default=DEFAULT_GATEWAY_STATISTICS_INTERVAL): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+            vol.Optional(CONF_GATEWAY_PERIODIC_TELEGRAMS_PER_SECOND, default=DEFAULT_GATEWAY_PERIODIC_TELEGRAMS_PER_SECOND): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+            vol.Optional(CONF_GATEWAY_SEND_TELEGRAMS_PER_SECOND, default=DEFAULT_GATEWAY_SEND_TELEGRAMS_PER_SECOND): vol.All(vol.Coerce(float), vol.Range(min=1)),
+            vol.Optional(CONF_GATEWAY_SIMULATION_SPEED, default=DEFAULT_GATEWAY_SIMULATION_SPEED): vol.All(vol.Coerce(float), vol.Range(min=0.01)),
+            vol.Optional(CONF_GATEWAY_LATENCY_INSTRUMENTATION, default=False): cv.boolean,
+            vol.Optional(CONF_GATEWAY_TELEGRAM_LOG): cv.string,
+            vol.Optional(CONF_GATEWAY_TELEGRAM_LOG_MAX_SIZE, default=DEFAULT_GATEWAY_TELEGRAM_LOG_MAX_SIZE): vol.All(vol.Coerce(float), vol.Range(min=0.01)),
+            vol.Optional(CONF_GATEWAY_TELEGRAM_LOG_BACKUP_COUNT, default=DEFAULT_GATEWAY_TELEGRAM_LOG_BACKUP_COUNT): vol.All(vol.Coerce(int), vol.Range(min=0)),
             vol.Optional(CONF_GATEWAY_PORT, default=5100): cv.Number,
             vol.Optional(CONF_DEVICES): vol.All(vol.Schema({
                 **BinarySensorSchema.platform_node(),
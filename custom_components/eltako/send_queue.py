@@ -0,0 +1,79 @@
+"""Prioritised and rate limited queue for outgoing telegrams of a gateway."""
+import asyncio
+import itertools
+from collections.abc import Awaitable, Callable
+from enum import IntEnum
+
+from eltakobus.message import ESP2Message
+
+from homeassistant.core import HomeAssistant
+
+from .const import LOGGER
+from .gateway_statistics import GatewayStatistics, STATISTIC_SEND_QUEUE_DEPTH, STATISTIC_SEND_QUEUE_WAIT_TIME
+
+
+class SendPriority(IntEnum):
+    """Priority classes of outgoing telegrams. Lower values are sent first."""
+    INTERACTIVE = 0
+    TEACH_IN = 1
+    AUTOMATION = 2
+    PERIODIC = 3
+
+
+class SendQueue:
+    """Sends telegrams one after another ordered by priority and limited to a maximum rate.
+
+    Telegrams of the same priority are sent in the order they were queued.
+    """
+
+    def __init__(self, hass: HomeAssistant, send: Callable[[ESP2Message], Awaitable[None]], telegrams_per_second: float, statistics: GatewayStatistics):
+        self.hass = hass
+        self._send = send
+        self._min_send_interval = 1.0 / telegrams_per_second
+        self._statistics = statistics
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        # keeps order for telegrams of the same priority
+        self._sequence = itertools.count()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def depth(self) -> int:
+        """Return the amount of telegrams waiting to be sent."""
+        return self._queue.qsize()
+
+    def put(self, msg: ESP2Message, priority: SendPriority = SendPriority.AUTOMATION) -> None:
+        """Queue a telegram. Must be called from the event loop."""
+        self._queue.put_nowait((priority, next(self._sequence), self.hass.loop.time(), msg))
+        self._statistics.set(STATISTIC_SEND_QUEUE_DEPTH, self._queue.qsize())
+
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(self._async_run(), "eltako_send_queue")
+
+    async def _async_run(self) -> None:
+        last_sent = None
+        while True:
+            # wait before taking the next telegram so that telegrams with a higher priority
+            # which are queued in the meantime are sent first
+            if last_sent is not None:
+                delay = last_sent + self._min_send_interval - self.hass.loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            _, _, queued_at, msg = await self._queue.get()
+
+            last_sent = self.hass.loop.time()
+            self._statistics.set(STATISTIC_SEND_QUEUE_DEPTH, self._queue.qsize())
+            self._statistics.set(STATISTIC_SEND_QUEUE_WAIT_TIME, round((last_sent - queued_at) * 1000.0, 1))
+
+            try:
+                await self._send(msg)
+            except Exception:
+                LOGGER.exception("[Send Queue] Cannot send message %s", msg)
+
+    def cancel(self) -> None:
+        """Stop sending and drop all queued telegrams."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._queue = asyncio.PriorityQueue()
+        self._statistics.set(STATISTIC_SEND_QUEUE_DEPTH, 0)
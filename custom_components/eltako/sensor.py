@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 from datetime import datetime
 
 from eltakobus.util import AddressExpression, b2s
@@ -19,6 +20,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     PERCENTAGE,
+    UnitOfTime,
     STATE_CLOSED,
     STATE_OPEN,
     LIGHT_LUX,
@@ -32,6 +34,7 @@ from homeassistant.const import (
     PERCENTAGE,
     CONF_LANGUAGE,
     UnitOfElectricPotential,
+    EntityCategory,
 )
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
@@ -44,6 +47,9 @@ from homeassistant.helpers import entity_registry as er
 from .device import *
 from .config_helpers import *
 from .gateway import EnOceanGateway
+from .gateway_statistics import STATISTIC_SEND_QUEUE_DEPTH, STATISTIC_SEND_QUEUE_WAIT_TIME, STATISTIC_LATENCY, STATISTIC_SUPPRESSED_STATE_WRITES, \
+    STATISTIC_RECONNECT_COUNT, STATISTIC_RECONNECT_DURATION, STATISTIC_DUPLICATE_TELEGRAMS
+from .measurement_filter import MeasurementFilter
 from .const import *
 from . import get_gateway_from_hass, get_device_config_for_gateway
 
@@ -291,128 +297,133 @@ async def async_setup_entry(
 ) -> None:
     """Set up an Eltako sensor device."""
     gateway: EnOceanGateway = get_gateway_from_hass(hass, config_entry)
-    config: ConfigType = get_device_config_for_gateway(hass, config_entry, gateway)
 
     entities: list[EltakoEntity] = []
     
     platform = Platform.SENSOR
-    if platform in config:
-        for entity_config in config[platform]:
-            try:
-                dev_conf = DeviceConf(entity_config, [CONF_METER_TARIFFS])
-                dev_name = dev_conf.name
+    for device in gateway.device_index.get_platform_entries(platform):
+        entity_config = device.raw
+        try:
+            dev_conf = device.config
+            dev_name = dev_conf.name
             
-                if dev_conf.eep in [A5_13_01]:
-                    if dev_name == dev_conf.name:
-                        dev_name = DEFAULT_DEVICE_NAME_WEATHER_STATION
+            if dev_conf.eep in [A5_13_01]:
+                if dev_name == dev_conf.name:
+                    dev_name = DEFAULT_DEVICE_NAME_WEATHER_STATION
                     
-                    entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_ILLUMINANCE_DAWN))
-                    entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_TEMPERATURE))
-                    entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_WIND_SPEED))
-                    entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_RAIN))
-                    entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_ILLUMINANCE_WEST))
-                    entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_ILLUMINANCE_CENTRAL))
-                    entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_ILLUMINANCE_EAST))
+                entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_ILLUMINANCE_DAWN))
+                entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_TEMPERATURE))
+                entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_WIND_SPEED))
+                entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_RAIN))
+                entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_ILLUMINANCE_WEST))
+                entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_ILLUMINANCE_CENTRAL))
+                entities.append(EltakoWeatherStation(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WEATHER_STATION_ILLUMINANCE_EAST))
                     
-                elif dev_conf.eep in [F6_10_00]:
-                    if dev_name == "":
-                        dev_name = DEFAULT_DEVICE_NAME_WINDOW_HANDLE
+            elif dev_conf.eep in [F6_10_00]:
+                if dev_name == "":
+                    dev_name = DEFAULT_DEVICE_NAME_WINDOW_HANDLE
                     
-                    entities.append(EltakoWindowHandle(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WINDOWHANDLE))
+                entities.append(EltakoWindowHandle(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WINDOWHANDLE))
                     
-                elif dev_conf.eep in [A5_12_01]:
-                    if dev_name == "":
-                        dev_name = DEFAULT_DEVICE_NAME_ELECTRICITY_METER
+            elif dev_conf.eep in [A5_12_01]:
+                if dev_name == "":
+                    dev_name = DEFAULT_DEVICE_NAME_ELECTRICITY_METER
                     
-                    for tariff in dev_conf.get(CONF_METER_TARIFFS, []):
-                        entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_ELECTRICITY_CUMULATIVE, tariff=(tariff - 1)))
-                    _tariff_in_name = dev_conf.get(CONF_METER_TARIFFS, []) != []
-                    entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_ELECTRICITY_CURRENT, tariff=0, tariff_in_name=_tariff_in_name))
-
-                elif dev_conf.eep in [A5_12_02]:
-                    if dev_name == "":
-                        dev_name = DEFAULT_DEVICE_NAME_GAS_METER
+                for tariff in dev_conf.get(CONF_METER_TARIFFS, []):
+                    entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_ELECTRICITY_CUMULATIVE, tariff=(tariff - 1)))
+                _tariff_in_name = dev_conf.get(CONF_METER_TARIFFS, []) != []
+                entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_ELECTRICITY_CURRENT, tariff=0, tariff_in_name=_tariff_in_name,
+                                                   measurement_filter=MeasurementFilter.from_config(dev_conf)))
+
+            elif dev_conf.eep in [A5_12_02]:
+                if dev_name == "":
+                    dev_name = DEFAULT_DEVICE_NAME_GAS_METER
                         
-                    for tariff in dev_conf.get(CONF_METER_TARIFFS, []):
-                        entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_GAS_CUMULATIVE, tariff=(tariff - 1)))
-                        entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_GAS_CURRENT, tariff=(tariff - 1)))
-
-                elif dev_conf.eep in [A5_12_03]:
-                    if dev_name == "":
-                        dev_name = DEFAULT_DEVICE_NAME_WATER_METER
+                for tariff in dev_conf.get(CONF_METER_TARIFFS, []):
+                    entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_GAS_CUMULATIVE, tariff=(tariff - 1)))
+                    entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_GAS_CURRENT, tariff=(tariff - 1),
+                                                       measurement_filter=MeasurementFilter.from_config(dev_conf)))
+
+            elif dev_conf.eep in [A5_12_03]:
+                if dev_name == "":
+                    dev_name = DEFAULT_DEVICE_NAME_WATER_METER
                         
-                    for tariff in dev_conf.get(CONF_METER_TARIFFS, []):
-                        entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WATER_CUMULATIVE, tariff=(tariff - 1)))
-                        entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WATER_CURRENT, tariff=(tariff - 1)))
+                for tariff in dev_conf.get(CONF_METER_TARIFFS, []):
+                    entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WATER_CUMULATIVE, tariff=(tariff - 1)))
+                    entities.append(EltakoMeterSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, SENSOR_DESC_WATER_CURRENT, tariff=(tariff - 1),
+                                                       measurement_filter=MeasurementFilter.from_config(dev_conf)))
 
-                elif dev_conf.eep in [A5_04_01, A5_04_02, A5_04_03, A5_10_12]:
+            elif dev_conf.eep in [A5_04_01, A5_04_02, A5_04_03, A5_10_12]:
                     
-                    entities.append(EltakoTemperatureSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
-                    entities.append(EltakoHumiditySensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
-                    if dev_conf.eep in [A5_10_12]:
-                        entities.append(EltakoTargetTemperatureSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
-
-                elif dev_conf.eep in [A5_10_06, A5_10_03]:
-                    entities.append(EltakoTemperatureSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
+                entities.append(EltakoTemperatureSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
+                entities.append(EltakoHumiditySensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
+                if dev_conf.eep in [A5_10_12]:
                     entities.append(EltakoTargetTemperatureSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
+
+            elif dev_conf.eep in [A5_10_06, A5_10_03]:
+                entities.append(EltakoTemperatureSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
+                entities.append(EltakoTargetTemperatureSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
                 
-                elif dev_conf.eep in [A5_09_0C]:
-                ### Eltako FLGTF only supports VOCT Total
-                    for t in VOC_SubstancesType:
-                        if t.index in entity_config[CONF_VOC_TYPE_INDEXES]:
-                            entities.append(EltakoAirQualitySensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, t, entity_config[CONF_LANGUAGE]))
-
-                elif dev_conf.eep in [A5_07_01]:
-                    entities.append(EltakoPirSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
-                    entities.append(EltakoVoltageSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
-
-                elif dev_conf.eep in [A5_08_01]:
-                    entities.append(EltakoTemperatureSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
-                    entities.append(EltakoIlluminationSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
-                    entities.append(EltakoBatteryVoltageSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
-                    # _pir_status => as binary sensor
-
-                elif dev_conf.eep in [A5_06_01]:
-                    entities.append(EltakoIlluminationSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
-                    #TODO: add twilight
-                    #TODO: add daylight
-                    # both are currently combined in illumination
-
-            except Exception as e:
-                LOGGER.warning("[%s] Could not load configuration", platform)
-                LOGGER.critical(e, exc_info=True)
+            elif dev_conf.eep in [A5_09_0C]:
+            ### Eltako FLGTF only supports VOCT Total
+                for t in VOC_SubstancesType:
+                    if t.index in entity_config[CONF_VOC_TYPE_INDEXES]:
+                        entities.append(EltakoAirQualitySensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep, t, entity_config[CONF_LANGUAGE]))
+
+            elif dev_conf.eep in [A5_07_01]:
+                entities.append(EltakoPirSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
+                entities.append(EltakoVoltageSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
+
+            elif dev_conf.eep in [A5_08_01]:
+                entities.append(EltakoTemperatureSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
+                entities.append(EltakoIlluminationSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
+                entities.append(EltakoBatteryVoltageSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
+                # _pir_status => as binary sensor
+
+            elif dev_conf.eep in [A5_06_01]:
+                entities.append(EltakoIlluminationSensor(platform, gateway, dev_conf.id, dev_name, dev_conf.eep))
+                #TODO: add twilight
+                #TODO: add daylight
+                # both are currently combined in illumination
+
+        except Exception as e:
+            LOGGER.warning("[%s] Could not load configuration", platform)
+            LOGGER.critical(e, exc_info=True)
+
+    # static information of devices is also available in the diagnostics of the integration
+    show_device_info_entities = gateway.general_settings.get(CONF_DEVICE_INFO_ENTITIES, True)
+    if not show_device_info_entities:
+        remove_device_info_entities(hass, gateway)
 
     # add labels for buttons
-    if Platform.BINARY_SENSOR in config:
-        for entity_config in config[Platform.BINARY_SENSOR]:
-            try:
-                dev_conf = DeviceConf(entity_config)
-                if dev_conf.eep in [F6_01_01, F6_02_01, F6_02_02]:
-                    def convert_event(event):
-                        # if hasattr(event, 'data') and isinstance(event.data, dict) and 'pressed_buttons' in event.data:
-                        return config_helpers.button_abbreviation_to_str(event.data['pressed_buttons'])
-
-                    event_id = config_helpers.get_bus_event_type(gateway.dev_id, EVENT_BUTTON_PRESSED, dev_conf.id)
-                    if dev_conf.eep in [F6_02_01, F6_02_02]:
-                        entities.append(EventListenerInfoField(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, event_id, "Pushed Buttons", convert_event, "mdi:gesture-tap-button"))
+    for device in gateway.device_index.get_platform_entries(Platform.BINARY_SENSOR):
+        try:
+            dev_conf = device.config
+            if dev_conf.eep in [F6_01_01, F6_02_01, F6_02_02]:
+                def convert_event(event):
+                    # if hasattr(event, 'data') and isinstance(event.data, dict) and 'pressed_buttons' in event.data:
+                    return config_helpers.button_abbreviation_to_str(event.data['pressed_buttons'])
 
+                event_id = config_helpers.get_bus_event_type(gateway.dev_id, EVENT_BUTTON_PRESSED, dev_conf.id)
+                if dev_conf.eep in [F6_02_01, F6_02_02]:
+                    entities.append(EventListenerInfoField(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, event_id, "Pushed Buttons", convert_event, "mdi:gesture-tap-button"))
+
+                if show_device_info_entities:
                     entities.append(StaticInfoField(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, "Event Id", event_id, "mdi:form-textbox"))
             
-            except Exception as e:
-                LOGGER.warning("[%s] Could not load configuration", Platform.BINARY_SENSOR)
-                LOGGER.critical(e, exc_info=True)
+        except Exception as e:
+            LOGGER.warning("[%s] Could not load configuration", Platform.BINARY_SENSOR)
+            LOGGER.critical(e, exc_info=True)
 
     # add id field for every device
-    for pl in PLATFORMS:
-        if pl in config:
-            for entity_config in config[pl]:
-                try:
-                    dev_conf = DeviceConf(entity_config)
-                    entities.append(StaticInfoField(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, "Id", b2s(dev_conf.id[0]), "mdi:identifier"))
+    for device in gateway.device_index.get_all_entries() if show_device_info_entities else ():
+        try:
+            dev_conf = device.config
+            entities.append(StaticInfoField(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, "Id", b2s(dev_conf.id[0]), "mdi:identifier"))
                 
-                except Exception as e:
-                    LOGGER.warning("[%s] Could not load configuration", Platform.BINARY_SENSOR)
-                    LOGGER.critical(e, exc_info=True)
+        except Exception as e:
+            LOGGER.warning("[%s] Could not load configuration", Platform.BINARY_SENSOR)
+            LOGGER.critical(e, exc_info=True)
 
 
     # add gateway information
@@ -424,12 +435,41 @@ async def async_setup_entry(
     entities.append(GatewayInfoField(platform, gateway, "Auto Connect Enabled", gateway.is_auto_reconnect_enabled, "mdi:connection"))
     entities.append(GatewayLastReceivedMessage(platform, gateway))
     entities.append(GatewayReceivedMessagesInActiveSession(platform, gateway))
+    entities.append(GatewayStatisticSensor(platform, gateway, STATISTIC_SEND_QUEUE_DEPTH, "Send Queue Depth", "mdi:tray-full"))
+    entities.append(GatewayStatisticSensor(platform, gateway, STATISTIC_SEND_QUEUE_WAIT_TIME, "Send Queue Wait Time", "mdi:timer-sand", UnitOfTime.MILLISECONDS))
+    entities.append(GatewayStatisticSensor(platform, gateway, STATISTIC_SUPPRESSED_STATE_WRITES, "Suppressed State Writes", "mdi:content-save-off-outline", state_class=SensorStateClass.TOTAL_INCREASING))
+    entities.append(GatewayStatisticSensor(platform, gateway, STATISTIC_RECONNECT_COUNT, "Reconnects", "mdi:connection", state_class=SensorStateClass.TOTAL_INCREASING))
+    entities.append(GatewayStatisticSensor(platform, gateway, STATISTIC_RECONNECT_DURATION, "Reconnect Duration", "mdi:timer-sand", UnitOfTime.MILLISECONDS))
+    if gateway.telegram_deduplicator is not None:
+        entities.append(GatewayStatisticSensor(platform, gateway, STATISTIC_DUPLICATE_TELEGRAMS, "Dropped Duplicate Telegrams", "mdi:content-duplicate", state_class=SensorStateClass.TOTAL_INCREASING))
+    if gateway.latency_tracker is not None:
+        for percentile in PERCENTILES:
+            entities.append(GatewayLatencySensor(platform, gateway, percentile))
 
     validate_actuators_dev_and_sender_id(entities)
+    restore_last_states(hass, entities, platform)
     log_entities_to_be_added(entities, platform)
     async_add_entities(entities)
 
 
+DEVICE_INFO_ENTITY_KEYS = ["Id", "Event Id"]
+
+def remove_device_info_entities(hass: HomeAssistant, gateway: EnOceanGateway) -> int:
+    """Remove info entities of devices which were created before they got disabled. Returns the amount of removed entities."""
+    entity_registry = er.async_get(hass)
+    count = 0
+    for device in gateway.device_index.get_all_entries():
+        for key in DEVICE_INFO_ENTITY_KEYS:
+            unique_id = EltakoEntity._get_identifier(gateway, device.config.id, key)
+            entity_id = entity_registry.async_get_entity_id(Platform.SENSOR, DOMAIN, unique_id)
+            if entity_id is not None:
+                entity_registry.async_remove(entity_id)
+                count += 1
+    if count > 0:
+        LOGGER.info("[%s] Removed %d disabled device info entities", Platform.SENSOR, count)
+    return count
+
+
 class EltakoSensor(EltakoEntity, RestoreEntity, SensorEntity):
     """Representation of an  Eltako sensor device such as a power meter."""
 
@@ -492,7 +532,7 @@ class EltakoPirSensor(EltakoSensor):
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the sensor."""
         try:
-            decoded:A5_07_01 = self.dev_eep.decode_message(msg)
+            decoded:A5_07_01 = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[Motion Sensor %s] Could not decode message: %s", self.dev_id, str(e))
             return
@@ -512,7 +552,7 @@ class EltakoVoltageSensor(EltakoSensor):
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the sensor."""
         try:
-            decoded:A5_07_01 = self.dev_eep.decode_message(msg)
+            decoded:A5_07_01 = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[Voltage Sensor %s] Could not decode message: %s", self.dev_id, str(e))
             return
@@ -529,12 +569,18 @@ class EltakoMeterSensor(EltakoSensor):
     - A5-12-01 (Automated Meter Reading, Electricity)
     - A5-12-02 (Automated Meter Reading, Gas)
     - A5-12-03 (Automated Meter Reading, Water)
+
+    Current values can be throttled, filtered by a deadband and aggregated by a measurement filter.
+    The received value which triggered the last publish is then available in the attribute 'raw_value'.
+    Values suppressed by the filter are not shown. Without measurement filter the attribute is not set.
     """
-    def __init__(self, platform: str, gateway: EnOceanGateway, dev_id: AddressExpression, dev_name:str, dev_eep:EEP, description: EltakoSensorEntityDescription, *, tariff, tariff_in_name:bool=True) -> None:
+    def __init__(self, platform: str, gateway: EnOceanGateway, dev_id: AddressExpression, dev_name:str, dev_eep:EEP, description: EltakoSensorEntityDescription, *, tariff, tariff_in_name:bool=True,
+                 measurement_filter: MeasurementFilter=None) -> None:
         """Initialize the Eltako meter sensor device."""
         super().__init__(platform, gateway, dev_id, dev_name, dev_eep, description)
         self._tariff = tariff
         self._tariff_in_name = tariff_in_name
+        self._measurement_filter = measurement_filter
 
     @property
     def name(self):
@@ -550,7 +596,7 @@ class EltakoMeterSensor(EltakoSensor):
         For current values, we respect the channel just for gas and water.
         """
         try:
-            decoded = self.dev_eep.decode_message(msg)
+            decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[Meter Sensor %s] Could not decode message: %s", self.dev_id, str(e))
             return
@@ -571,13 +617,24 @@ class EltakoMeterSensor(EltakoSensor):
             self._attr_native_value = round(calculatedValue, 2)
             self.schedule_update_ha_state()
         elif (not cumulative) and msg.data[3] != 0x8F and self.entity_description.key == SENSOR_TYPE_ELECTRICITY_CURRENT: # 0x8F means that, it's sending the serial number of the meter
-            self._attr_native_value = round(calculatedValue, 2)
-            self.schedule_update_ha_state()
+            self._publish_current_value(round(calculatedValue, 2))
         elif (not cumulative) and self._tariff == tariff and (
             self.entity_description.key == SENSOR_TYPE_GAS_CURRENT or
             self.entity_description.key == SENSOR_TYPE_WATER_CURRENT):
             # l/s -> m3/h
-            self._attr_native_value = round(calculatedValue * 3.6, 2)
+            self._publish_current_value(round(calculatedValue * 3.6, 2))
+
+    def _publish_current_value(self, value: float) -> None:
+        """Publish the value directly or as decided by the measurement filter."""
+        if self._measurement_filter is None:
+            self._attr_native_value = value
+            self.schedule_update_ha_state()
+            return
+
+        published_value = self._measurement_filter.add(value)
+        if published_value is not None:
+            self._attr_native_value = round(published_value, 2)
+            self._attr_extra_state_attributes = {"raw_value": value}
             self.schedule_update_ha_state()
 
 
@@ -595,7 +652,7 @@ class EltakoWindowHandle(EltakoSensor):
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the sensor."""
         try:
-            decoded:F6_10_00 = self.dev_eep.decode_message(msg)
+            decoded:F6_10_00 = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[Window Handle Sensor %s] Could not decode message: %s", self.dev_id, str(e))
             return
@@ -626,7 +683,7 @@ class EltakoWeatherStation(EltakoSensor):
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the sensor."""
         try:
-            decoded = self.dev_eep.decode_message(msg)
+            decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[Weather Station %s] Could not decode message: %s", self.dev_id, str(e))
             return
@@ -693,7 +750,7 @@ class EltakoTemperatureSensor(EltakoSensor):
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the sensor."""
         try:
-            decoded = self.dev_eep.decode_message(msg)
+            decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[Temperature Sensor %s] Could not decode message: %s", self.dev_id, str(e))
             return
@@ -715,7 +772,7 @@ class EltakoIlluminationSensor(EltakoSensor):
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the sensor."""
         try:
-            decoded = self.dev_eep.decode_message(msg)
+            decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[Illumination Sensor %s] Could not decode message: %s", self.dev_id, str(e))
             return
@@ -738,7 +795,7 @@ class EltakoBatteryVoltageSensor(EltakoSensor):
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the sensor."""
         try:
-            decoded = self.dev_eep.decode_message(msg)
+            decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[Battery Voltage Sensor %s] Could not decode message: %s", self.dev_id, str(e))
             return
@@ -765,7 +822,7 @@ class EltakoTargetTemperatureSensor(EltakoSensor):
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the sensor."""
         try:
-            decoded = self.dev_eep.decode_message(msg)
+            decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[Target Temperature Sensor %s] Could not decode message: %s", self.dev_id, str(e))
             return
@@ -792,7 +849,7 @@ class EltakoHumiditySensor(EltakoSensor):
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the sensor."""
         try:
-            decoded = self.dev_eep.decode_message(msg)
+            decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[Humidity Sensor %s] Could not decode message: %s", self.dev_id, str(e))
             return
@@ -838,7 +895,7 @@ class EltakoAirQualitySensor(EltakoSensor):
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the sensor."""
         try:
-            decoded = self.dev_eep.decode_message(msg)
+            decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[Air Quality Sensor %s] Could not decode message: %s", self.dev_id, str(e))
             return
@@ -891,7 +948,7 @@ class GatewayLastReceivedMessage(EltakoSensor):
         # LOGGER.debug("[%s] Last message received", Platform.SENSOR)
 
         if isinstance(value, datetime):
-            self.native_value = value
+            self._attr_native_value = value
             self.schedule_update_ha_state()
 
 class GatewayReceivedMessagesInActiveSession(EltakoSensor):
@@ -938,10 +995,89 @@ class GatewayReceivedMessagesInActiveSession(EltakoSensor):
         """Update the current value."""
         # LOGGER.debug("[%s] received amount of messages: %s", Platform.SENSOR, str(value))
 
-        self.native_value = value
+        self._attr_native_value = value
         self.schedule_update_ha_state()
 
 
+class GatewayStatisticSensor(EltakoSensor):
+    """Displays a statistic value of the gateway which is periodically flushed."""
+
+    def __init__(self, platform: str, gateway: EnOceanGateway, statistic_key: str, name: str, icon: str=None, unit: str=None, state_class: SensorStateClass=SensorStateClass.MEASUREMENT):
+        super().__init__(platform, gateway,
+                         dev_id=gateway.base_id, 
+                         dev_name=name, 
+                         dev_eep=None,
+                         description=EltakoSensorEntityDescription(
+                            key=name,
+                            name=name,
+                            state_class=state_class,
+                            entity_category=EntityCategory.DIAGNOSTIC,
+                            native_unit_of_measurement=unit,
+                            icon=icon,
+                            has_entity_name= True,
+                        )
+        )
+        self._attr_name = name
+        self.gateway.statistics.add_listener(statistic_key, self.async_value_changed)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.gateway.serial_path)},
+            name= self.gateway.dev_name,
+            manufacturer=MANUFACTURER,
+            model=self.gateway.model,
+            via_device=(DOMAIN, self.gateway.serial_path)
+        )
+    
+    async def async_value_changed(self, value) -> None:
+        try:
+            self.value_changed(value)
+        except AttributeError as e:
+            # Home Assistant not ready yet
+            pass  
+
+    def value_changed(self, value) -> None:
+        """Update the current value."""
+        self._attr_native_value = value
+        self.schedule_update_ha_state()
+
+
+class GatewayLatencySensor(GatewayStatisticSensor):
+    """Displays a percentile of the time from receiving a telegram until the state update of the entity.
+
+    The percentiles of the single stages and of every EEP are available as attributes.
+    """
+
+    def __init__(self, platform: str, gateway: EnOceanGateway, percentile: int):
+        self._percentile_key = f"p{percentile}"
+        super().__init__(platform, gateway, STATISTIC_LATENCY, f"Telegram Latency P{percentile}", "mdi:timer-outline", UnitOfTime.MILLISECONDS)
+
+    def value_changed(self, value: dict) -> None:
+        """Update the current value."""
+        attributes = {"count": value[STAGE_TOTAL]["count"]}
+        for stage in STAGES:
+            if stage != STAGE_TOTAL:
+                attributes[stage] = value[stage][self._percentile_key]
+        for eep, summary in value["eep"].items():
+            attributes[eep] = summary[self._percentile_key]
+
+        self._attr_extra_state_attributes = attributes
+        self._attr_native_value = value[STAGE_TOTAL][self._percentile_key]
+        self.schedule_update_ha_state()
+
+
+@functools.lru_cache(maxsize=None)
+def get_info_field_description(key: str, icon: str=None) -> EltakoSensorEntityDescription:
+    """Return the description of an info field. Descriptions are shared by all devices having the same field."""
+    return EltakoSensorEntityDescription(
+        key=key,
+        name=key,
+        icon=icon,
+        has_entity_name= True,
+    )
+
 class StaticInfoField(EltakoSensor):
     """Key value fields for gateway information"""
 
@@ -950,15 +1086,12 @@ class StaticInfoField(EltakoSensor):
                          dev_id=dev_id, 
                          dev_name=dev_name, 
                          dev_eep=dev_eep,
-                         description=EltakoSensorEntityDescription(
-                            key=key,
-                            name=key,
-                            icon=icon,
-                            has_entity_name= True,
-                        )
+                         description=get_info_field_description(key, icon)
         )
         self._attr_name = key
         self._attr_native_value = value
+        # static values don't need to receive telegrams
+        self.listen_to_addresses = ()
 
     def value_changed(self, value) -> None:
         pass
@@ -996,12 +1129,7 @@ class EventListenerInfoField(EltakoSensor):
                          dev_id=dev_id, 
                          dev_name=dev_name, 
                          dev_eep=dev_eep,
-                         description=EltakoSensorEntityDescription(
-                            key=key,
-                            name=key,
-                            icon=icon,
-                            has_entity_name= True,
-                        )
+                         description=get_info_field_description(key, icon)
         )
         self.convert_event_function = convert_event_function
         self._attr_name = key
@@ -1014,7 +1142,7 @@ class EventListenerInfoField(EltakoSensor):
     
     def value_changed(self, event) -> None:
         LOGGER.debug(f"Received event: {event}")
-        self.native_value = self.convert_event_function(event)
+        self._attr_native_value = self.convert_event_function(event)
 
         self.schedule_update_ha_state()
             
\ No newline at end of file
@@ -0,0 +1,304 @@
+"""Simulated bus with virtual devices for load tests without hardware.
+
+The simulated bus can be used instead of a serial or TCP connection by configuring a
+gateway with device type 'simulator'. Every configured device gets a virtual counterpart
+which sends status telegrams on its own like a real sensor and answers commands like a
+real actuator.
+"""
+import heapq
+import itertools
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+from eltakobus.eep import *
+from eltakobus.message import ESP2Message, Regular4BSMessage
+
+from .const import LOGGER
+from .device_index import DeviceIndexEntry
+
+# interval in seconds in which virtual devices send telegrams on their own
+DEFAULT_TRAFFIC_INTERVALS: dict[type, float] = {
+    F6_02_01: 60.0,
+    F6_02_02: 60.0,
+    A5_12_01: 10.0,
+    A5_13_01: 10.0,
+    G5_3F_7F: 300.0,
+    A5_10_06: 60.0,
+    A5_38_08: 300.0,
+    M5_38_08: 300.0,
+}
+
+# delay in seconds after which actuators confirm a command
+DEFAULT_RESPONSE_DELAY = 0.02
+
+
+def _as_received(msg: ESP2Message) -> ESP2Message:
+    """Convert an encoded telegram into the form it has when it is received from the bus."""
+    return type(msg)(msg.address, msg.status, msg.data, False)
+
+
+class SimulatedDevice:
+    """Virtual device which sends status telegrams and answers commands."""
+
+    def __init__(self, address: bytes, eep: type, sender_address: bytes | None = None, sender_eep: type | None = None,
+                 rng: random.Random | None = None):
+        self.address = address
+        self.eep = eep
+        self.sender_address = sender_address
+        self.sender_eep = sender_eep
+        self._rng = rng or random.Random()
+
+        # incremented with every command so that outdated delayed responses can be dropped
+        self.command_generation: int = 0
+
+        self._is_on = False
+        self._dimming_value = 0
+        self._meter_reading = self._rng.randint(0, 100000)
+        self._temperature = self._rng.uniform(15.0, 25.0)
+        self._target_temperature = 21.0
+        self._heater_mode = A5_10_06.Heater_Mode.NORMAL
+        self._cover_direction = None
+        self._cover_started = 0.0
+        self._cover_travel_time = 0
+
+    @classmethod
+    def from_device_index_entry(cls, entry: DeviceIndexEntry, rng: random.Random | None = None) -> "SimulatedDevice | None":
+        """Return a virtual device for a configured device or None if the device has no id or EEP."""
+        if entry.config.id is None or entry.config.eep is None:
+            return None
+        sender_address = entry.sender.id[0] if entry.sender is not None and entry.sender.id is not None else None
+        sender_eep = entry.sender.eep if entry.sender is not None else None
+        return cls(bytes(entry.config.id[0]), entry.config.eep, sender_address, sender_eep, rng)
+
+    def generate(self) -> list[ESP2Message]:
+        """Return telegrams the device sends on its own."""
+        if self.eep in [F6_02_01, F6_02_02]:
+            action = self._rng.randint(0, 3)
+            return [F6_02_01(action, 1, 0, 0).encode_message(self.address),
+                    F6_02_01(action, 0, 0, 0).encode_message(self.address)]
+
+        elif self.eep == A5_12_01:
+            self._meter_reading += self._rng.randint(0, 50)
+            power = self._rng.randint(0, 3000)
+            # cumulative value and current power of tariff 1, divisor 0
+            return [Regular4BSMessage(self.address, 0x00, self._meter_reading.to_bytes(3, 'big') + bytes([0x08]), True),
+                    Regular4BSMessage(self.address, 0x00, power.to_bytes(3, 'big') + bytes([0x0C]), True)]
+
+        elif self.eep == A5_13_01:
+            self._temperature += self._rng.uniform(-0.5, 0.5)
+            return [self._weather_station_telegram(0x01, dawn_sensor=self._rng.uniform(0, 999), temperature=self._temperature,
+                                                   wind_speed=self._rng.uniform(0, 20), day_night=0, rain_indication=0),
+                    self._weather_station_telegram(0x02, sun_west=self._rng.uniform(0, 150), sun_south=self._rng.uniform(0, 150),
+                                                   sun_east=self._rng.uniform(0, 150), hemisphere=0)]
+
+        elif self.eep == G5_3F_7F:
+            return [G5_3F_7F(state=self._rng.choice([0x50, 0x70])).encode_message(self.address)]
+
+        elif self.eep == A5_10_06:
+            self._temperature = min(max(self._temperature + self._rng.uniform(-0.3, 0.3), 0.0), 40.0)
+            return [self._climate_status()]
+
+        elif self.eep == A5_38_08:
+            return [self._dimmer_status()]
+
+        elif self.eep == M5_38_08:
+            return [M5_38_08(int(self._is_on)).encode_message(self.address)]
+
+        return []
+
+    def respond(self, command: ESP2Message, now: float) -> list[tuple[float, ESP2Message]]:
+        """Return telegrams with their delay in seconds the actuator sends as answer to a command.
+
+        now is the time in seconds at which the command was sent.
+        """
+        try:
+            decoded = self.sender_eep.decode_message(command)
+        except Exception:
+            return []
+
+        answers = self._respond(decoded, now)
+        if answers:
+            self.command_generation += 1
+        return answers
+
+    def _respond(self, decoded: EEP, now: float) -> list[tuple[float, ESP2Message]]:
+        if self.eep == M5_38_08:
+            if self.sender_eep in [F6_02_01, F6_02_02]:
+                if decoded.energy_bow != 1:
+                    return []
+                self._is_on = decoded.rocker_first_action in [1, 3]
+            elif self.sender_eep == A5_38_08 and decoded.command == 0x01:
+                self._is_on = decoded.switching.switching_command == 1
+            else:
+                return []
+            return [(0, M5_38_08(int(self._is_on)).encode_message(self.address))]
+
+        elif self.eep == A5_38_08 and self.sender_eep == A5_38_08:
+            if decoded.command == 0x01:
+                self._is_on = decoded.switching.switching_command == 1
+            elif decoded.command == 0x02:
+                self._is_on = decoded.dimming.switching_command == 1
+                self._dimming_value = decoded.dimming.dimming_value
+            return [(0, self._dimmer_status())]
+
+        elif self.eep == G5_3F_7F and self.sender_eep == H5_3F_7F:
+            if decoded.command in [0x01, 0x02]:
+                self._cover_direction = decoded.command
+                self._cover_started = now
+                self._cover_travel_time = decoded.time
+                end_state = 0x70 if decoded.command == 0x01 else 0x50
+                return [(0, G5_3F_7F(state=decoded.command).encode_message(self.address)),
+                        (float(decoded.time), G5_3F_7F(state=end_state).encode_message(self.address))]
+            elif decoded.command == 0x00 and self._cover_direction is not None:
+                # report driven time in 100ms when stopped at an intermediate position
+                driven_time = min(int((now - self._cover_started) * 10), self._cover_travel_time * 10)
+                direction = self._cover_direction
+                self._cover_direction = None
+                return [(0, G5_3F_7F(time=driven_time, direction=direction).encode_message(self.address))]
+            return []
+
+        elif self.eep == A5_10_06 and self.sender_eep == A5_10_06:
+            self._heater_mode = decoded.mode
+            self._target_temperature = decoded.target_temperature
+            return [(0, self._climate_status())]
+
+        return []
+
+    def _weather_station_telegram(self, identifier: int, **values) -> ESP2Message:
+        msg = A5_13_01(identifier=identifier, learn_button=1, **values).encode_message(self.address)
+        # identifier is not encoded by eltakobus
+        return Regular4BSMessage(self.address, 0x00, bytes(msg.data[:3]) + bytes([msg.data[3] | (identifier << 4)]), True)
+
+    def _climate_status(self) -> ESP2Message:
+        return A5_10_06(self._heater_mode, self._target_temperature, self._temperature, False).encode_message(self.address)
+
+    def _dimmer_status(self) -> ESP2Message:
+        dimming = CentralCommandDimming(self._dimming_value, 0, 1, 0, 0, int(self._is_on))
+        return A5_38_08(command=0x02, dimming=dimming).encode_message(self.address)
+
+
+class SimulatedBus(threading.Thread):
+    """Drop-in replacement for the serial bus driving virtual devices.
+
+    Like the real bus it runs in its own thread and hands over received telegrams to
+    the callback. Telegrams sent by the gateway are answered by the virtual actuator
+    which listens to the sender address of the command.
+    """
+
+    def __init__(self, callback: Callable[[ESP2Message], None], get_devices: Callable[[], Iterable[DeviceIndexEntry]],
+                 speed: float = 1.0, intervals: dict[type, float] | None = None, response_delay: float = DEFAULT_RESPONSE_DELAY,
+                 seed: int | None = None):
+        super().__init__(name="eltako_simulated_bus", daemon=True)
+        self._callback = callback
+        self._get_devices = get_devices
+        # time scale of all intervals, e.g. 10 means telegrams are sent 10 times more often
+        self.speed = speed
+        self.intervals = DEFAULT_TRAFFIC_INTERVALS if intervals is None else intervals
+        self.response_delay = response_delay
+        self._rng = random.Random(seed)
+
+        self.devices: list[SimulatedDevice] = []
+        self._devices_by_sender: dict[bytes, list[SimulatedDevice]] = {}
+
+        self._commands: queue.Queue = queue.Queue()
+        self._wakeup = threading.Event()
+        self._stop_flag = threading.Event()
+        self._running = threading.Event()
+        self._status_changed_handler = None
+
+        self.sent_telegram_count: int = 0
+        self.received_command_count: int = 0
+
+    def set_status_changed_handler(self, handler) -> None:
+        self._status_changed_handler = handler
+        self._fire_status_changed_handler(self.is_active())
+
+    def _fire_status_changed_handler(self, connected: bool) -> None:
+        try:
+            if self._status_changed_handler:
+                self._status_changed_handler(connected)
+        except Exception:
+            pass
+
+    def is_active(self) -> bool:
+        return self._running.is_set() and not self._stop_flag.is_set()
+
+    def stop(self) -> None:
+        self._stop_flag.set()
+        self._wakeup.set()
+
+    async def send(self, msg: ESP2Message) -> None:
+        """Hand over a command to the virtual actuators. Can be called from any thread."""
+        self._commands.put((time.monotonic(), msg))
+        self._wakeup.set()
+
+    def _create_devices(self) -> None:
+        self.devices = []
+        self._devices_by_sender = {}
+        for entry in self._get_devices():
+            device = SimulatedDevice.from_device_index_entry(entry, self._rng)
+            if device is None:
+                continue
+            self.devices.append(device)
+            if device.sender_address is not None and device.sender_eep is not None:
+                self._devices_by_sender.setdefault(device.sender_address, []).append(device)
+
+    def _emit(self, msg: ESP2Message) -> None:
+        self.sent_telegram_count += 1
+        try:
+            self._callback(_as_received(msg))
+        except Exception:
+            LOGGER.exception("[Simulated Bus] Callback failed for message %s", msg)
+
+    def run(self) -> None:
+        self._create_devices()
+        LOGGER.info("[Simulated Bus] Simulate %d devices with speed %s.", len(self.devices), self.speed)
+
+        # heap of (due time, sequence, device, command generation or None for traffic, telegram)
+        events = []
+        sequence = itertools.count()
+        now = time.monotonic()
+        for device in self.devices:
+            interval = self.intervals.get(device.eep)
+            if interval:
+                # spread first telegrams randomly across the interval
+                heapq.heappush(events, (now + self._rng.uniform(0, interval / self.speed), next(sequence), device, None, None))
+
+        self._running.set()
+        self._fire_status_changed_handler(True)
+
+        while not self._stop_flag.is_set():
+            # cleared before commands are processed so that no wakeup gets lost
+            self._wakeup.clear()
+            now = time.monotonic()
+
+            while not self._commands.empty():
+                sent_at, command = self._commands.get_nowait()
+                self.received_command_count += 1
+                for device in self._devices_by_sender.get(bytes(command.address), []):
+                    # devices see the scaled time so that driven times of covers match the speed
+                    for delay, answer in device.respond(command, sent_at * self.speed):
+                        due = sent_at + self.response_delay + delay / self.speed
+                        heapq.heappush(events, (due, next(sequence), device, device.command_generation, answer))
+
+            while events and events[0][0] <= now:
+                due, _, device, generation, answer = heapq.heappop(events)
+                if generation is None:
+                    for msg in device.generate():
+                        self._emit(msg)
+                    interval = self.intervals[device.eep] / self.speed
+                    heapq.heappush(events, (max(due + interval, now), next(sequence), device, None, None))
+                elif generation == device.command_generation:
+                    # answers to outdated commands are dropped like a stopped cover doesn't report its end position
+                    self._emit(answer)
+
+            timeout = events[0][0] - time.monotonic() if events else None
+            if timeout is None or timeout > 0:
+                self._wakeup.wait(timeout)
+
+        self._running.clear()
+        self._fire_status_changed_handler(False)
+        LOGGER.info("[Simulated Bus] Stopped after sending %d telegrams.", self.sent_telegram_count)
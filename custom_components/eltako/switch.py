@@ -27,25 +27,24 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Eltako switch platform."""
     gateway: EnOceanGateway = get_gateway_from_hass(hass, config_entry)
-    config: ConfigType = get_device_config_for_gateway(hass, config_entry, gateway)
 
     entities: list[EltakoEntity] = []
     
     platform = Platform.SWITCH
-    if platform in config:
-        for entity_config in config[platform]:
-            try:
-                dev_conf = DeviceConf(entity_config)
-                sender_config = config_helpers.get_device_conf(entity_config, CONF_SENDER)
+    for device in gateway.device_index.get_platform_entries(platform):
+        try:
+            dev_conf = device.config
+            sender_config = device.sender
 
-                entities.append(EltakoSwitch(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, sender_config.id, sender_config.eep))
+            entities.append(EltakoSwitch(platform, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, sender_config.id, sender_config.eep))
             
-            except Exception as e:
-                LOGGER.warning("[%s] Could not load configuration", platform)
-                LOGGER.critical(e, exc_info=True)
+        except Exception as e:
+            LOGGER.warning("[%s] Could not load configuration", platform)
+            LOGGER.critical(e, exc_info=True)
                 
     
     validate_actuators_dev_and_sender_id(entities)
+    restore_last_states(hass, entities, platform)
     log_entities_to_be_added(entities, platform)
     async_add_entities(entities)
 
@@ -147,7 +146,7 @@ class EltakoSwitch(EltakoEntity, SwitchEntity, RestoreEntity):
     def value_changed(self, msg: ESP2Message):
         """Update the internal state of the switch."""
         try:
-            decoded = self.dev_eep.decode_message(msg)
+            decoded = self.decode_message(msg)
         except Exception as e:
             LOGGER.warning("[%s %s] Could not decode message: %s", Platform.SWITCH, str(self.dev_id), str(e))
             return
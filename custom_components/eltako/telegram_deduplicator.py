@@ -0,0 +1,76 @@
+"""De-duplication of telegrams which are received by several gateways."""
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from eltakobus.message import ESP2Message
+
+DEFAULT_DEDUPLICATION_CAPACITY = 1024
+
+
+class TelegramDeduplicator:
+    """Detects telegrams which were already received within a time window.
+
+    Wireless telegrams are often received by several transceivers. The deduplicator is
+    shared by all gateways so that only the first gateway hands a telegram over to the
+    entities. Telegrams are identified by organisation, data and sender address. The
+    leading header byte and the status byte are ignored because they contain the
+    repeater count which differs depending on how a telegram was received.
+
+    A telegram is only dropped if it was first received by another gateway which has
+    entities for the sender. Repeated telegrams received by the same gateway (e.g. a
+    rocker pressed twice) are real events and passed on.
+
+    The last telegrams are kept in a ring buffer of fixed size so that memory stays
+    bounded during telegram bursts. Can be called from the threads of all gateways.
+    """
+
+    def __init__(self, window: float, capacity: int = DEFAULT_DEDUPLICATION_CAPACITY):
+        self.window = window
+        self.capacity = capacity
+        self.dropped_count: int = 0
+        # (expiry time, key) in order of arrival
+        self._ring: deque[tuple[float, bytes]] = deque()
+        # key => (expiry time, first receiving gateway, if that gateway handled the telegram)
+        self._entries: dict[bytes, tuple[float, Any, bool]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(msg: ESP2Message) -> bytes:
+        return msg.body[1:-1]
+
+    def is_duplicate(self, msg: ESP2Message, receiver: Any, handled: bool = True, now: float = None) -> bool:
+        """Return True if the telegram was already handled by another gateway within the window, otherwise remember it.
+
+        receiver identifies the gateway which received the telegram. handled tells if it has entities for the sender.
+        """
+        if now is None:
+            now = time.monotonic()
+        key = self._get_key(msg)
+
+        with self._lock:
+            # forget expired telegrams
+            while self._ring and self._ring[0][0] <= now:
+                self._forget(*self._ring.popleft())
+
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now and entry[1] != receiver and entry[2]:
+                self.dropped_count += 1
+                return True
+
+            if len(self._ring) >= self.capacity:
+                self._forget(*self._ring.popleft())
+            expiry = now + self.window
+            self._ring.append((expiry, key))
+            self._entries[key] = (expiry, receiver, handled)
+            return False
+
+    def _forget(self, expiry: float, key: bytes) -> None:
+        # the key may have been added again in the meantime
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == expiry:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
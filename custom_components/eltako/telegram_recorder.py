@@ -0,0 +1,189 @@
+"""Recording and replay of telegrams in a compact binary log format.
+
+A log file starts with a header followed by records. Each record consists of the
+timestamp (seconds since epoch as double), the direction, the length of the frame
+and the serialized ESP2 frame itself:
+
+    | timestamp (8 bytes) | direction (1 byte) | length (2 bytes) | frame (length bytes) |
+
+All numbers are little endian. A typical ESP2 telegram takes 25 bytes.
+"""
+import asyncio
+import os
+import struct
+import threading
+import time
+from collections.abc import Callable
+from enum import IntEnum
+from typing import NamedTuple
+
+from eltakobus.message import ESP2Message, prettify
+
+from .const import LOGGER
+
+FILE_HEADER = b"ELTAKOTLG\x01"
+_RECORD_HEADER = struct.Struct("<dBH")
+
+# yield to the event loop every n telegrams if replaying as fast as possible
+_REPLAY_YIELD_INTERVAL = 100
+
+
+class TelegramDirection(IntEnum):
+    """Direction of a recorded telegram."""
+    RECEIVED = 0
+    SENT = 1
+
+
+class TelegramRecord(NamedTuple):
+    """Single recorded telegram."""
+    timestamp: float
+    direction: TelegramDirection
+    frame: bytes
+
+    def to_message(self) -> ESP2Message:
+        """Parse the frame like the serial bus does it for received telegrams."""
+        return prettify(ESP2Message.parse(self.frame))
+
+
+class TelegramRecorder:
+    """Appends received and sent telegrams to a binary log file which is rotated by size.
+
+    Recording only copies the frame into a memory buffer so that it can be done from
+    the serial bus thread as well as from the event loop. The buffer is written to disk
+    by flush() which does blocking I/O and should run in an executor.
+    """
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int = 3):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.record_count: int = 0
+        self.dropped_count: int = 0
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._file = None
+
+    def record(self, direction: TelegramDirection, msg: ESP2Message, timestamp: float = None) -> None:
+        """Add a telegram to the log. Can be called from any thread."""
+        frame = msg.serialize()
+        if timestamp is None:
+            timestamp = time.time()
+
+        with self._lock:
+            # don't eat up memory if the buffer cannot be written
+            if len(self._buffer) > self.max_bytes:
+                self.dropped_count += 1
+                return
+            self._buffer += _RECORD_HEADER.pack(timestamp, direction, len(frame))
+            self._buffer += frame
+            self.record_count += 1
+
+    def flush(self) -> None:
+        """Write buffered telegrams to disk and rotate the file if it gets too big."""
+        with self._lock:
+            data = bytes(self._buffer)
+            self._buffer.clear()
+
+        if len(data) == 0:
+            return
+
+        if self._file is None:
+            self._open()
+        if self._file.tell() > len(FILE_HEADER) and self._file.tell() + len(data) > self.max_bytes:
+            self._rotate()
+
+        self._file.write(data)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write remaining telegrams and close the log file."""
+        try:
+            self.flush()
+        except OSError:
+            LOGGER.exception("[Telegram Recorder] Cannot write telegrams to %s", self.filename)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self) -> None:
+        directory = os.path.dirname(self.filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.filename, "ab")
+        if self._file.tell() == 0:
+            self._file.write(FILE_HEADER)
+
+    def _rotate(self) -> None:
+        """Rename log.n to log.n+1, ..., log to log.1 and start a new file like logging.RotatingFileHandler does."""
+        self._file.close()
+        self._file = None
+
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                src = f"{self.filename}.{i}"
+                if os.path.exists(src):
+                    os.replace(src, f"{self.filename}.{i + 1}")
+            os.replace(self.filename, f"{self.filename}.1")
+        else:
+            os.remove(self.filename)
+
+        self._open()
+
+
+def read_telegram_records(filename: str) -> list[TelegramRecord]:
+    """Read all telegrams of a log file. A truncated last record is ignored."""
+    with open(filename, "rb") as f:
+        data = f.read()
+
+    if not data.startswith(FILE_HEADER):
+        raise ValueError(f"{filename} is not a telegram log file.")
+
+    records = []
+    pos = len(FILE_HEADER)
+    while pos + _RECORD_HEADER.size <= len(data):
+        timestamp, direction, length = _RECORD_HEADER.unpack_from(data, pos)
+        pos += _RECORD_HEADER.size
+        if pos + length > len(data):
+            break
+        records.append(TelegramRecord(timestamp, TelegramDirection(direction), data[pos:pos + length]))
+        pos += length
+
+    return records
+
+
+async def async_replay_telegrams(records: list[TelegramRecord], receive: Callable[[ESP2Message], None], speed: float | None = 1.0,
+                                 directions: tuple[TelegramDirection, ...] = (TelegramDirection.RECEIVED,)) -> int:
+    """Feed recorded telegrams into receive() and return the amount of replayed telegrams.
+
+    speed 1.0 replays with the original timing, 10.0 ten times faster and None or 0 as fast as possible.
+    Only received telegrams are replayed by default so that nothing is sent on a real bus.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    first_timestamp = None
+    count = 0
+
+    for record in records:
+        if record.direction not in directions:
+            continue
+
+        try:
+            msg = record.to_message()
+        except Exception:
+            LOGGER.warning("[Telegram Recorder] Cannot parse recorded frame %s", record.frame.hex())
+            continue
+
+        if first_timestamp is None:
+            first_timestamp = record.timestamp
+
+        if speed:
+            delay = start + (record.timestamp - first_timestamp) / speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        elif count % _REPLAY_YIELD_INTERVAL == 0:
+            await asyncio.sleep(0)
+
+        receive(msg)
+        count += 1
+
+    return count
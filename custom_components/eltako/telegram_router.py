@@ -0,0 +1,66 @@
+"""Address based routing of received telegrams to Eltako entities."""
+from collections.abc import Callable
+
+from .const import LOGGER
+
+
+class TelegramRouter:
+    """Dispatches received telegrams only to the entities listening to the sender address.
+
+    Subscribers are kept in a dict from address bytes to a set of entities so that
+    the cost of a telegram depends on the amount of interested entities and not on
+    the total amount of entities registered at a gateway.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[bytes, set] = {}
+
+    @staticmethod
+    def _to_address_bytes(address) -> bytes:
+        # listen_to_addresses can contain plain bytes or AddressExpressions
+        if isinstance(address, (bytes, bytearray)):
+            return bytes(address)
+        return bytes(address[0])
+
+    def register(self, address, subscriber) -> Callable[[], None]:
+        """Register an entity for telegrams sent by the given address. Returns a function to unregister it."""
+        address = self._to_address_bytes(address)
+        self._subscribers.setdefault(address, set()).add(subscriber)
+
+        def unregister() -> None:
+            self.unregister(address, subscriber)
+
+        return unregister
+
+    def unregister(self, address, subscriber) -> None:
+        """Remove an entity from the subscribers of the given address."""
+        address = self._to_address_bytes(address)
+        subscribers = self._subscribers.get(address)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if len(subscribers) == 0:
+                del self._subscribers[address]
+
+    def get_subscribers(self, address) -> set:
+        """Return all entities listening to the given address."""
+        return self._subscribers.get(self._to_address_bytes(address), set())
+
+    @property
+    def address_count(self) -> int:
+        """Return the amount of addresses having at least one subscriber."""
+        return len(self._subscribers)
+
+    def dispatch(self, msg) -> int:
+        """Hand over the telegram to all entities listening to its sender address. Returns the amount of notified entities."""
+        subscribers = self._subscribers.get(getattr(msg, 'address', None))
+        if not subscribers:
+            return 0
+
+        # copy because entities can unregister while handling the message
+        for subscriber in tuple(subscribers):
+            try:
+                subscriber._message_received_callback(msg)
+            except Exception:
+                LOGGER.exception("[Telegram Router] Entity %s could not process message %s", subscriber, msg)
+
+        return len(subscribers)
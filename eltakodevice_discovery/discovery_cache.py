@@ -0,0 +1,95 @@
+import difflib
+import hashlib
+import json
+import logging
+import os
+
+from eltakobus.device import BusObject
+
+
+DISCOVERY_CACHE_VERSION = 1
+
+
+def get_memory_checksum(memory: list[str]) -> str:
+    """Checksum of the memory lines in hex representation. Lines which were not read are None."""
+    return hashlib.sha1(json.dumps(memory).encode()).hexdigest()
+
+
+class DiscoveryCache():
+    """Keeps the memory of discovered devices on disk so that a rescan only reads devices which changed.
+
+    Devices are identified by their address. The cached memory is only used if the
+    discovery reply of the device is unchanged and the stored memory matches its checksum.
+    Changes of the memory itself are not detected, so with refresh the memory of all devices
+    is read again. The last generated configuration is kept to show what changed with the next run.
+    """
+
+    def __init__(self, filename: str, refresh: bool=False):
+        self.filename = filename
+        self.refresh = refresh
+        self.devices: dict[str, dict] = {}
+        self.config: str = None
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> None:
+        if not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, 'r', encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Cannot read discovery cache {self.filename}, all devices will be read: {e}")
+            return
+
+        if data.get('version') != DISCOVERY_CACHE_VERSION:
+            logging.info(f"Discovery cache {self.filename} has an old format, all devices will be read.")
+            return
+
+        self.devices = data.get('devices', {})
+        self.config = data.get('config')
+
+    def save(self) -> None:
+        data = {
+            'version': DISCOVERY_CACHE_VERSION,
+            'devices': self.devices,
+            'config': self.config,
+        }
+        # replace the file at once so that an interrupted run does not corrupt the cache
+        tmp_filename = self.filename + '.tmp'
+        with open(tmp_filename, 'w', encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_filename, self.filename)
+
+    def restore_memory(self, dev: BusObject) -> bool:
+        """Set the cached memory to the device if it did not change. Returns False if the memory needs to be read from the bus."""
+        entry = self.devices.get(str(dev.address))
+        if self.refresh or entry is None or entry['discovery_reply'] != dev.discovery_response.payload.hex() or entry['memory_checksum'] != get_memory_checksum(entry['memory']):
+            self.misses += 1
+            return False
+
+        dev.memory = [bytes.fromhex(l) if l is not None else None for l in entry['memory']]
+        self.hits += 1
+        return True
+
+    def update_device(self, dev: BusObject) -> None:
+        """Store discovery reply and memory of the device."""
+        memory = [l.hex() if l is not None else None for l in dev.memory]
+        self.devices[str(dev.address)] = {
+            'model': type(dev).__name__,
+            'discovery_reply': dev.discovery_response.payload.hex(),
+            'memory': memory,
+            'memory_checksum': get_memory_checksum(memory),
+        }
+
+    def remove_missing_devices(self, addresses: list[int]) -> None:
+        """Forget devices which were not found anymore."""
+        for address in set(self.devices.keys()) - set(str(a) for a in addresses):
+            del self.devices[address]
+
+    def get_config_diff(self, config: str, filename: str) -> str:
+        """Return the changes of the configuration since the last run as unified diff and remember the new one."""
+        previous = self.config if self.config is not None else ""
+        self.config = config
+        return "".join(difflib.unified_diff(previous.splitlines(keepends=True), config.splitlines(keepends=True),
+                                            fromfile=f"{filename} (previous)", tofile=filename))
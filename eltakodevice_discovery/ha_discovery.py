@@ -8,6 +8,7 @@ os.environ.setdefault('SKIPP_IMPORT_HOME_ASSISTANT', "True")
 import argparse
 from argparse import RawTextHelpFormatter
 import asyncio
+import time
 from typing import Iterator
 
 from termcolor import colored
@@ -16,17 +17,26 @@ import logging
 from eltakobus import *
 from eltakobus.locking import buslocked
 from ymalRepresentation import HaConfig
+from discovery_cache import DiscoveryCache
 
 
 DEFAULT_SENDER_ADDRESS = 0x0000B000
 
+DEFAULT_FAST_SCAN_TIMEOUT = 1.0
+MIN_FAST_SCAN_TIMEOUT = 0.1
+# a single lost reply must not hide a device
+FAST_SCAN_RETRIES = 2
+
 async def create_busobject(bus: RS485SerialInterface, id: int) -> BusObject:
     response = await bus.exchange(EltakoDiscoveryRequest(address=id), EltakoDiscoveryReply)
 
     assert id == response.reported_address, "Queried for ID %s, received %s" % (id, prettify(response))
 
+    return create_busobject_from_reply(bus, response)
+
+def create_busobject_from_reply(bus: RS485SerialInterface, response: EltakoDiscoveryReply) -> BusObject:
     for o in sorted_known_objects:
-        if response.model.startswith(o.discovery_name) and (o.size is None or o.size == response.reported_size):
+        if response.model[0:2] in o.discovery_names and (o.size is None or o.size == response.reported_size):
             return o(response, bus=bus)
     else:
         return BusObject(response, bus=bus)
@@ -40,6 +50,91 @@ async def enumerate_bus(bus: RS485SerialInterface) -> Iterator[BusObject]:
         except TimeoutError:
             continue
 
+
+class AdaptiveTimeout:
+    """Timeout for requests on the bus learned from the latency of previous replies.
+
+    Calculated like the retransmission timeout of TCP: smoothed latency plus four
+    times its variation, limited by a minimum and a maximum.
+    """
+
+    def __init__(self, initial: float=DEFAULT_FAST_SCAN_TIMEOUT, minimum: float=MIN_FAST_SCAN_TIMEOUT, maximum: float=DEFAULT_FAST_SCAN_TIMEOUT):
+        self.timeout = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self._smoothed_latency = None
+        self._latency_variation = None
+
+    def add_latency(self, latency: float) -> None:
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+            self._latency_variation = latency / 2
+        else:
+            self._latency_variation = 0.75 * self._latency_variation + 0.25 * abs(self._smoothed_latency - latency)
+            self._smoothed_latency = 0.875 * self._smoothed_latency + 0.125 * latency
+
+        self.timeout = min(max(self._smoothed_latency + 4 * self._latency_variation, self.minimum), self.maximum)
+
+
+class AdaptiveTimeoutBus(BusInterface):
+    """Forwards requests to the bus with an adaptive timeout. Memory of devices is read through it as well."""
+
+    def __init__(self, bus: RS485SerialInterface, timeout: AdaptiveTimeout, retries: int=3):
+        self.bus = bus
+        self.timeout = timeout
+        self.retries = retries
+
+    async def exchange(self, request, responsetype=None, retries: int=None):
+        if retries is None:
+            retries = self.retries
+        start = time.monotonic()
+
+        if isinstance(self.bus, RS485SerialInterfaceV2):
+            response = await self.bus.exchange(request, responsetype, retries=retries, timeout=self.timeout.timeout)
+            # all retries ran out of time
+            if response is None:
+                raise TimeoutError
+        else:
+            try:
+                response = await asyncio.wait_for(self.bus.exchange(request, responsetype), self.timeout.timeout * retries)
+            except asyncio.TimeoutError:
+                raise TimeoutError
+
+        self.timeout.add_latency(time.monotonic() - start)
+        return response
+
+    async def base_exchange(self, request):
+        return await self.bus.base_exchange(request)
+
+    async def send(self, request):
+        return await self.bus.send(request)
+
+
+async def fast_enumerate_bus(bus: RS485SerialInterface) -> Iterator[BusObject]:
+    """Search the bus for devices with short timeouts, yield bus objects for every match.
+
+    Every address is requested twice at most and the timeout is adapted to the latency
+    of the replies received so far. Addresses occupied by the channels of a found device
+    are skipped. The memory of the found devices is also read with the adaptive timeout.
+    """
+    timeout_bus = AdaptiveTimeoutBus(bus, AdaptiveTimeout())
+
+    i = 1
+    while i < 256:
+        try:
+            response = await timeout_bus.exchange(EltakoDiscoveryRequest(address=i), EltakoDiscoveryReply, retries=FAST_SCAN_RETRIES)
+        except TimeoutError:
+            i += 1
+            continue
+
+        if response.reported_address != i:
+            logging.warning("Queried for ID %s, received %s" % (i, prettify(response)))
+            i += 1
+            continue
+
+        yield create_busobject_from_reply(timeout_bus, response)
+        i += max(response.reported_size, 1)
+
 async def lock_bus(bus):
     logging.debug(await(locking.lock_bus(bus)))
 
@@ -49,12 +144,21 @@ async def unlock_bus(bus):
 
 
 @buslocked
-async def ha_config(bus: RS485SerialInterface, config: HaConfig, offset_address:bytes, write_sender_address_to_mem:bool) -> None:
+async def ha_config(bus: RS485SerialInterface, config: HaConfig, offset_address:bytes, write_sender_address_to_mem:bool, fast_scan:bool=False, cache:DiscoveryCache=None) -> None:
     
     logging.info(colored("Start scanning for devices", 'red'))
-    async for dev in enumerate_bus(bus):
+    scan_start = time.monotonic()
+    device_start = scan_start
+    device_count = 0
+    found_addresses = []
+    async for dev in (fast_enumerate_bus(bus) if fast_scan else enumerate_bus(bus)):
+        found_addresses.append(dev.address)
         try:
             logging.info(colored(f"Found device: {dev}",'grey'))
+            # memory is only read from the bus if the device changed since the last run
+            if cache is not None and cache.restore_memory(dev):
+                logging.info(f"Use cached memory of device {dev.address}")
+
             await config.add_device(dev)
 
             if write_sender_address_to_mem:
@@ -63,9 +167,23 @@ async def ha_config(bus: RS485SerialInterface, config: HaConfig, offset_address:
                         sender_address = (int(offset_address, 16) + dev.address).to_bytes(4, 'big')
                         await dev.ensure_programmed(i, AddressExpression((sender_address, None)), A5_38_08)
 
+            if cache is not None:
+                cache.update_device(dev)
+
         except TimeoutError:
             logging.error("Read error, skipping: Device %s announces %d memory but produces timeouts at reading" % (dev, dev.discovery_response.memory_size))
-    logging.info(colored("Device scan finished.", 'red'))
+
+        # includes probing the addresses in front of the device and reading its memory
+        device_end = time.monotonic()
+        device_count += 1
+        logging.info(f"Scan time of device {dev.address}: {device_end - device_start:.2f}s")
+        device_start = device_end
+
+    scan_time = time.monotonic() - scan_start
+    logging.info(colored(f"Device scan finished. Found {device_count} devices in {scan_time:.1f}s ({scan_time / max(device_count, 1):.2f}s per device).", 'red'))
+    if cache is not None:
+        cache.remove_missing_devices(found_addresses)
+        logging.info(f"Memory of {cache.hits} devices taken from cache, {cache.misses} devices read from the bus.")
 
 
 async def listen(bus: RS485SerialInterface, config: HaConfig, ensure_unlocked) -> None:
@@ -111,13 +229,24 @@ In the output file EEPs for sensors need to be manually extend before copying th
                    action=argparse.BooleanOptionalAction,
                    help="Writes the sender address for Home Assistant into memory of devices if not exists.", 
                    default=False)
+    p.add_argument('-fs', '--fast_scan', 
+                   action=argparse.BooleanOptionalAction,
+                   help="Requests every address at most twice with a timeout adapted to the latency of the devices and skips addresses of device channels.", 
+                   default=False)
+    p.add_argument('-c', '--cache', 
+                   help="file in which discovered devices are cached. Only devices which changed are read again and the changes of the configuration are shown.", 
+                   default=None)
+    p.add_argument('-r', '--refresh', 
+                   action=argparse.BooleanOptionalAction,
+                   help="Reads the memory of all devices again and updates the cache. Required if the memory of a device was changed e.g. by teaching in sensors.", 
+                   default=False)
 
     opts = p.parse_args()
 
-    run(opts.verbose, opts.eltakobus, opts.baud_rate, opts.offset_sender_address, opts.write_sender_address_to_device, opts.output, check_sensors=True)
+    run(opts.verbose, opts.eltakobus, opts.baud_rate, opts.offset_sender_address, opts.write_sender_address_to_device, opts.output, check_sensors=True, fast_scan=opts.fast_scan, cache_filename=opts.cache, refresh_cache=opts.refresh)
 
 
-def run(verbose:int=0, eltakobus:str=None, baud_rate:int=0, offset_sender_address:int=0, write_sender_address_to_device:bool=False, filename:str=None, check_sensors:bool=False) -> str:
+def run(verbose:int=0, eltakobus:str=None, baud_rate:int=0, offset_sender_address:int=0, write_sender_address_to_device:bool=False, filename:str=None, check_sensors:bool=False, fast_scan:bool=False, cache_filename:str=None, refresh_cache:bool=False) -> str:
 
     log_level = logging.INFO
     if verbose > 0:
@@ -132,10 +261,16 @@ def run(verbose:int=0, eltakobus:str=None, baud_rate:int=0, offset_sender_addres
     bus.start()
     bus.is_serial_connected.wait()
 
+    cache = None
+    if cache_filename is not None:
+        # memory written to the devices needs to be read again
+        cache = DiscoveryCache(cache_filename, refresh=refresh_cache or write_sender_address_to_device)
+        cache.load()
+
     try:
         config = HaConfig(int(offset_sender_address,16), save_debug_log_config=True)
         
-        maintask = asyncio.Task( ha_config(bus, config, offset_sender_address, write_sender_address_to_device), loop=loop )
+        maintask = asyncio.Task( ha_config(bus, config, offset_sender_address, write_sender_address_to_device, fast_scan, cache), loop=loop )
         result = loop.run_until_complete(maintask)
 
         if check_sensors:
@@ -152,6 +287,15 @@ def run(verbose:int=0, eltakobus:str=None, baud_rate:int=0, offset_sender_addres
     if filename is not None:
         config.save_as_yaml_to_flie(filename)
 
+    if cache is not None:
+        diff = cache.get_config_diff(config.generate_config(), filename or "ha.yaml")
+        if diff:
+            logging.info(colored("Changes of the configuration since the last run:", 'red'))
+            logging.info(diff)
+        else:
+            logging.info(colored("Configuration did not change since the last run.", 'red'))
+        cache.save()
+
     if result is not None:
         logging.info(result)
 
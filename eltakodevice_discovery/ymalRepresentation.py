@@ -35,6 +35,11 @@ EEP_MAPPING = [
     {'hw-type': 'FAE14SSR', CONF_EEP: 'A5-10-06', 'sender_eep': 'A5-10-06', CONF_TYPE: Platform.CLIMATE, 'description': 'Eltako heating/cooling', 'address_count': 2},
 ]
 
+# first entry of every hardware type
+EEP_MAPPING_BY_HW_TYPE = {}
+for i in EEP_MAPPING:
+    EEP_MAPPING_BY_HW_TYPE.setdefault(i['hw-type'], i)
+
 ORG_MAPPING = {
     5: {'Telegram': 'RPS', 'RORG': 'F6', CONF_NAME: 'Switch', CONF_TYPE: Platform.BINARY_SENSOR, CONF_EEP: 'F6-02-01' },
     6: {'Telegram': '1BS', 'RORG': 'D5', CONF_NAME: '1 Byte Communication', CONF_TYPE: Platform.SENSOR, CONF_EEP: 'D5-??-??' },
@@ -56,6 +61,8 @@ class HaConfig():
         self.fam14_base_id = '00-00-00-00'
 
         self.collected_sensor_list:[SensorInfo] = []
+        # collected sensors by device address and function group
+        self.collected_sensors_by_device:dict[tuple[int, int], list[SensorInfo]] = {}
 
     def get_detected_sensor_by_id(self, id:str) -> dict:
         if id not in self.detected_sensors.keys():
@@ -66,11 +73,7 @@ class HaConfig():
         return self.detected_sensors[id]
     
     def find_sensors(self, dev_id:int, in_func_group: int) -> [SensorInfo]:
-        result = []
-        for s in self.collected_sensor_list: 
-            if int.from_bytes(s.dev_adr, "big") == dev_id and s.in_func_group == in_func_group:
-                result.append(s)
-        return result
+        return list(self.collected_sensors_by_device.get((dev_id, in_func_group), []))
     
     def find_sensor(self, dev_id:int, in_func_group: int) -> SensorInfo:
         l = self.find_sensors(dev_id, in_func_group)
@@ -79,10 +82,7 @@ class HaConfig():
         return None
 
     def find_device_info(self, name):
-        for i in EEP_MAPPING:
-            if i['hw-type'] == name:
-                return i
-        return None
+        return EEP_MAPPING_BY_HW_TYPE.get(name, None)
     
     def add_or_get_sensor(self, sensor_id:str, device_id:str, dev_type:str) -> dict:
         sensor = None
@@ -116,6 +116,8 @@ class HaConfig():
 
     def add_sensors(self, sensors: [SensorInfo]) -> None:
         self.collected_sensor_list.extend( sensors )
+        for s in sensors:
+            self.collected_sensors_by_device.setdefault((int.from_bytes(s.dev_adr, "big"), s.in_func_group), []).append(s)
 
         for s in sensors:
             if self.filter_out_base_address(s.sensor_id):
@@ -26,11 +26,27 @@ class HassMock():
         
     def __init__(self) -> None:
         self.bus = BusMock()
-        self.loop = asyncio.get_event_loop()
+        try:
+            self.loop = asyncio.get_event_loop()
+        except RuntimeError:
+            # asyncio.run() of a previous test removed the event loop
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
 
     # def async_create_task(self, async_call):
     #     asyncio.run( async_call )
-        
+
+    async def async_add_executor_job(self, target, *args):
+        return await self.loop.run_in_executor(None, target, *args)
+
+class HassLoopMock():
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+
+    def async_create_background_task(self, target, name):
+        return self.loop.create_task(target)
+
 class ConfigEntryMock():
 
     def __init__(self):
@@ -80,3 +80,21 @@ class TestBinarySensor_F6_02_01(unittest.TestCase):
             last_el = len(bs.hass.bus.fired_events)-1
             pressed_buttons = bs.hass.bus.fired_events[last_el]['event_data']['pressed_buttons']
             self.assertEqual(pressed_buttons, test_data[1])
+
+    def test_event_types_are_not_computed_per_telegram(self):
+        """Event types of a rocker switch are computed once per sender and not on the hot path of every telegram."""
+        bs = TestBinarySensor().create_binary_sensor()
+        press = RPSMessage(b'\xfe\xdb\xb6\x40', status=b'\x30', data=b'\x70')
+        release = RPSMessage(b'\xfe\xdb\xb6\x40', status=b'\x20', data=b'\x00')
+        calls = 100
+        # event types of a new sender are computed with its first telegram
+        bs.value_changed(release)
+
+        with mock.patch('custom_components.eltako.config_helpers.get_bus_event_type', wraps=get_bus_event_type) as event_type_mock:
+            for i in range(0, calls):
+                bs.value_changed(press if i % 2 == 0 else release)
+
+        event_type_mock.assert_not_called()
+        self.assertEqual(len(bs.hass.bus.fired_events), 2 * (calls + 1))
+        self.assertEqual(bs.hass.bus.fired_events[2]['event_type'],
+                         get_bus_event_type(bs.gateway.dev_id, EVENT_BUTTON_PRESSED, AddressExpression((press.address, None))))
@@ -40,6 +40,36 @@ class TestIdComparison(IsolatedAsyncioTestCase):
         config = await async_get_home_assistant_config(None, CONFIG_SCHEMA, get_ha_config)
         pass
 
+    async def test_config_is_cached(self):
+        hass = HassMock()
+        hass.data = {}
+        read_count = 0
+
+        async def count_reads(hass, domain):
+            nonlocal read_count
+            read_count += 1
+            return await get_ha_config(hass, domain)
+
+        config1 = await async_get_home_assistant_config(hass, CONFIG_SCHEMA, count_reads)
+        config2 = await async_get_home_assistant_config(hass, CONFIG_SCHEMA, count_reads)
+        gateway_config = await config_helpers.async_get_gateway_config(hass, CONFIG_SCHEMA, count_reads)
+        self.assertEqual(gateway_config[CONF_BASE_ID], "FF-AA-80-00")
+        self.assertIs(config1, config2)
+        self.assertEqual(read_count, 1)
+        self.assertEqual(hass.data[DATA_ELTAKO][ELTAKO_CONFIG_CACHE].version, 1)
+
+        # reload
+        config_helpers.invalidate_home_assistant_config(hass)
+        config3 = await async_get_home_assistant_config(hass, CONFIG_SCHEMA, count_reads)
+        self.assertIsNot(config1, config3)
+        self.assertEqual(read_count, 2)
+        self.assertEqual(hass.data[DATA_ELTAKO][ELTAKO_CONFIG_CACHE].version, 2)
+
+    async def test_gateway_config_without_device_type(self):
+        # gateway configured as single dict in the old format
+        gateway_config = await config_helpers.async_get_gateway_config(None, CONFIG_SCHEMA, get_config_basic_fam14)
+        self.assertIsNone(gateway_config)
+
 class TestDeviceConfig(TestCase):
 
     CONFIG1 = {
@@ -1,5 +1,7 @@
 import unittest
 import os
+import time
+import asyncio
 from tests.mocks import *
 from unittest import mock, IsolatedAsyncioTestCase, TestCase
 from homeassistant.helpers.entity import Entity
@@ -291,6 +293,62 @@ class TestCover(unittest.TestCase):
         self.last_sent_command = None
 #############################################################################################
 
+    def test_tilt_stop_is_scheduled_on_event_loop(self):
+        ec = self.create_blind()
+        ec._time_tilts = 1 # 0.1s for complete tilt
+        ec._attr_current_cover_tilt_position = 0
+        sent_commands = []
+        ec.send_message = lambda msg: sent_commands.append(msg)
+
+        async def tilt():
+            ec.hass.loop = asyncio.get_running_loop()
+            await ec.async_set_cover_tilt_position(tilt_position=100)
+            self.assertEqual(len(sent_commands), 1)
+            self.assertEqual(sent_commands[0].body, b'k\x07\x00\x00\x01\x08\x00\x00\xb1\x07\x00')
+            await asyncio.sleep(0.2)
+
+        asyncio.run(tilt())
+        self.assertEqual(len(sent_commands), 2)
+        self.assertEqual(sent_commands[1].body, b'k\x07\x00\x00\x00\x08\x00\x00\xb1\x07\x00')
+
+    def test_tilt_stop_is_cancelled_by_new_command(self):
+        ec = self.create_blind()
+        ec._time_tilts = 1
+        ec._attr_current_cover_tilt_position = 0
+        sent_commands = []
+        ec.send_message = lambda msg: sent_commands.append(msg)
+
+        async def tilt_and_open():
+            ec.hass.loop = asyncio.get_running_loop()
+            await ec.async_set_cover_tilt_position(tilt_position=100)
+            ec.open_cover()
+            await asyncio.sleep(0.2)
+
+        asyncio.run(tilt_and_open())
+        # move, open and no stop
+        self.assertEqual(len(sent_commands), 2)
+        self.assertEqual(sent_commands[1].body, b'k\x07\x00\x0b\x01\x08\x00\x00\xb1\x07\x00')
+
+    def test_many_concurrent_tilts(self):
+        covers = [self.create_blind() for _ in range(0, 20)]
+        sent_commands = []
+        for ec in covers:
+            ec._time_tilts = 2 # 0.2s for complete tilt
+            ec._attr_current_cover_tilt_position = 0
+            ec.send_message = lambda msg: sent_commands.append(msg)
+
+        async def tilt_all():
+            for ec in covers:
+                ec.hass.loop = asyncio.get_running_loop()
+            await asyncio.gather(*[ec.async_set_cover_tilt_position(tilt_position=100) for ec in covers])
+            await asyncio.sleep(0.3)
+
+        start = time.perf_counter()
+        asyncio.run(tilt_all())
+        # all tilts run in parallel without blocking a thread each
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(len(sent_commands), 40)
+
 
     def test_initial_loading_opening(self):
         ec = self.create_cover()
@@ -0,0 +1,80 @@
+import unittest
+from unittest import mock
+from tests.mocks import *
+from homeassistant.helpers.entity import Entity
+from homeassistant.const import Platform
+from custom_components.eltako.sensor import *
+from custom_components.eltako.decode_cache import MessageDecodeCache
+from eltakobus import *
+
+# mock update of Home Assistant
+Entity.schedule_update_ha_state = mock.Mock(return_value=None)
+
+
+class TestDecodeCache(unittest.TestCase):
+
+    def test_decode_once_per_eep(self):
+        cache = MessageDecodeCache()
+        msg = Regular4BSMessage(address=b'\x05\x1e\x83\x15', status=b'\x00', data=b'\x0f\x7d\x07\x1a', outgoing=False)
+
+        d1 = cache.decode(A5_13_01, msg)
+        d2 = cache.decode(A5_13_01, msg)
+        self.assertIs(d1, d2)
+        self.assertEqual(cache.decodes, 1)
+        self.assertEqual(cache.hits, 1)
+
+        # same message with another EEP is decoded separately
+        cache.decode(A5_07_01, msg)
+        self.assertEqual(cache.decodes, 2)
+
+        # a new telegram invalidates the cache
+        msg2 = Regular4BSMessage(address=b'\x05\x1e\x83\x15', status=b'\x00', data=b'\x0f\x7d\x08\x1a', outgoing=False)
+        self.assertIsNot(cache.decode(A5_13_01, msg2), d1)
+        self.assertEqual(cache.decodes, 3)
+
+        # the same telegram in another message object is not decoded again
+        msg3 = Regular4BSMessage(address=b'\x05\x1e\x83\x15', status=b'\x00', data=b'\x0f\x7d\x08\x1a', outgoing=False)
+        cache.decode(A5_13_01, msg3)
+        self.assertEqual(cache.decodes, 3)
+
+    def test_changed_message_is_decoded_again(self):
+        cache = MessageDecodeCache()
+        msg = Regular4BSMessage(address=b'\x00\x00\x10\x08', data=b'\x00\x96\xC8\x09', status=b'\x00')
+        d1 = cache.decode(A5_07_01, msg)
+
+        msg.data = b'\x00\x96\x0A\x09'
+        d2 = cache.decode(A5_07_01, msg)
+        self.assertIsNot(d1, d2)
+        self.assertEqual(cache.decodes, 2)
+
+    def test_failures_are_not_cached(self):
+        cache = MessageDecodeCache()
+        msg = RPSMessage(b'\x00\x00\x00\x01', status=b'\x30', data=b'\x70')
+
+        for _ in range(0, 2):
+            with self.assertRaises(Exception):
+                cache.decode(A5_13_01, msg)
+        self.assertEqual(cache.decodes, 0)
+        self.assertEqual(cache.hits, 0)
+
+    def test_weather_station_entities_share_decoding(self):
+        gateway = GatewayMock()
+        dev_id = AddressExpression.parse("05-1E-83-15")
+        descriptions = [
+            SENSOR_DESC_WEATHER_STATION_ILLUMINANCE_DAWN,
+            SENSOR_DESC_WEATHER_STATION_TEMPERATURE,
+            SENSOR_DESC_WEATHER_STATION_WIND_SPEED,
+            SENSOR_DESC_WEATHER_STATION_RAIN,
+        ]
+        entities = [EltakoWeatherStation(Platform.SENSOR, gateway, dev_id, "dev name", A5_13_01, d) for d in descriptions]
+
+        msg = Regular4BSMessage(address=b'\x05\x1e\x83\x15', status=b'\x00', data=b'\x0f\x7d\x07\x1a', outgoing=False)
+        for e in entities:
+            e.value_changed(msg)
+
+        self.assertEqual(gateway.decode_cache.decodes, 1)
+        self.assertEqual(gateway.decode_cache.hits, len(entities) - 1)
+        self.assertEqual(entities[0].native_value, 58.76470588235294)
+        self.assertEqual(entities[1].native_value, 18.823529411764703)
+        self.assertEqual(entities[2].native_value, 1.9215686274509804)
+        self.assertEqual(entities[3].native_value, 1)
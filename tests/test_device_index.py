@@ -0,0 +1,54 @@
+import unittest
+from eltakobus.eep import *
+from eltakobus.util import AddressExpression
+from custom_components.eltako.device_index import DeviceIndex
+from custom_components.eltako.const import *
+from homeassistant.const import CONF_ID, CONF_NAME, Platform
+
+
+class TestDeviceIndex(unittest.TestCase):
+
+    device_config = {
+        Platform.LIGHT: [
+            {CONF_ID: 'FF-AA-00-01', CONF_EEP: 'A5-38-08', CONF_NAME: 'light 1',
+             CONF_SENDER: {CONF_ID: '00-00-B0-01', CONF_EEP: 'A5-38-08'}},
+            # invalid address is skipped
+            {CONF_ID: 'not an address', CONF_EEP: 'A5-38-08', CONF_NAME: 'broken'},
+        ],
+        Platform.COVER: [
+            {CONF_ID: 'FF-AA-00-03', CONF_EEP: 'G5-3F-7F', CONF_NAME: 'cover 1', CONF_TIME_CLOSES: 10, CONF_TIME_OPENS: 12,
+             CONF_SENDER: {CONF_ID: '00-00-B0-03', CONF_EEP: 'H5-3F-7F'}},
+        ],
+        Platform.BINARY_SENSOR: [
+            {CONF_ID: 'FE-DB-00-01', CONF_EEP: 'F6-02-01', CONF_NAME: 'switch 1'},
+            {CONF_ID: 'FE-DB-00-01', CONF_EEP: 'F6-02-01', CONF_NAME: 'switch 1 copy'},
+        ],
+    }
+
+    def test_platform_entries(self):
+        index = DeviceIndex(self.device_config)
+
+        lights = index.get_platform_entries(Platform.LIGHT)
+        self.assertEqual(len(lights), 1)
+        self.assertEqual(lights[0].config.eep, A5_38_08)
+        self.assertEqual(lights[0].config.name, 'light 1')
+        self.assertEqual(lights[0].sender.id, AddressExpression.parse('00-00-B0-01'))
+        self.assertEqual(lights[0].sender.eep, A5_38_08)
+
+        covers = index.get_platform_entries(Platform.COVER)
+        self.assertEqual(covers[0].config.get(CONF_TIME_CLOSES), 10)
+        self.assertEqual(covers[0].config.get(CONF_TIME_OPENS), 12)
+        self.assertIsNone(covers[0].config.get(CONF_TIME_TILTS))
+        self.assertIs(covers[0].raw, self.device_config[Platform.COVER][0])
+
+        self.assertIsNone(index.get_platform_entries(Platform.BINARY_SENSOR)[0].sender)
+        self.assertEqual(index.get_platform_entries(Platform.SENSOR), ())
+        self.assertEqual(len(index), 4)
+        self.assertEqual([e.platform for e in index.get_all_entries()],
+                         [p for p in PLATFORMS for _ in index.get_platform_entries(p)])
+
+    def test_empty_config(self):
+        for config in [None, {}]:
+            index = DeviceIndex(config)
+            self.assertEqual(len(index), 0)
+            self.assertEqual(index.get_all_entries(), [])
@@ -0,0 +1,104 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from eltakodevice_discovery.discovery_cache import DiscoveryCache, DISCOVERY_CACHE_VERSION
+
+
+class BusObjectMock():
+
+    def __init__(self, address: int, payload: bytes, memory: list[bytes]=None):
+        self.address = address
+        self.discovery_response = mock.Mock(payload=payload)
+        self.memory = memory
+
+
+MEMORY = [bytes(range(16)), None, b'\xff' * 16]
+
+
+class TestDiscoveryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, 'discovery_cache.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def create_cache(self, refresh: bool=False) -> DiscoveryCache:
+        cache = DiscoveryCache(self.filename, refresh)
+        cache.load()
+        return cache
+
+    def test_save_and_load(self):
+        cache = self.create_cache()
+        self.assertEqual(cache.devices, {})
+        cache.update_device(BusObjectMock(1, b'\x01\x04', MEMORY))
+        cache.get_config_diff("eltako:\n", "ha.yaml")
+        cache.save()
+        self.assertFalse(os.path.exists(self.filename + '.tmp'))
+
+        cache = self.create_cache()
+        self.assertEqual(list(cache.devices.keys()), ['1'])
+        self.assertEqual(cache.config, "eltako:\n")
+
+    def test_hit_and_miss(self):
+        cache = self.create_cache()
+        cache.update_device(BusObjectMock(1, b'\x01\x04', MEMORY))
+        cache.save()
+
+        cache = self.create_cache()
+        dev = BusObjectMock(1, b'\x01\x04')
+        self.assertTrue(cache.restore_memory(dev))
+        self.assertEqual(dev.memory, MEMORY)
+
+        # unknown device and changed discovery reply
+        self.assertFalse(cache.restore_memory(BusObjectMock(2, b'\x02\x01')))
+        self.assertFalse(cache.restore_memory(BusObjectMock(1, b'\x01\x02')))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_corrupt_memory(self):
+        cache = self.create_cache()
+        cache.update_device(BusObjectMock(1, b'\x01\x04', MEMORY))
+        cache.devices['1']['memory'][0] = '00' * 16
+        self.assertFalse(cache.restore_memory(BusObjectMock(1, b'\x01\x04')))
+
+    def test_refresh(self):
+        cache = self.create_cache()
+        cache.update_device(BusObjectMock(1, b'\x01\x04', MEMORY))
+        cache.save()
+
+        cache = self.create_cache(refresh=True)
+        dev = BusObjectMock(1, b'\x01\x04')
+        self.assertFalse(cache.restore_memory(dev))
+        self.assertIsNone(dev.memory)
+
+    def test_invalid_file(self):
+        with open(self.filename, 'w') as f:
+            f.write("{")
+        self.assertEqual(self.create_cache().devices, {})
+
+        with open(self.filename, 'w') as f:
+            json.dump({'version': DISCOVERY_CACHE_VERSION + 1, 'devices': {'1': {}}}, f)
+        self.assertEqual(self.create_cache().devices, {})
+
+    def test_remove_missing_devices(self):
+        cache = self.create_cache()
+        for address in [1, 5, 8]:
+            cache.update_device(BusObjectMock(address, b'\x01\x01', MEMORY))
+
+        cache.remove_missing_devices([1, 8])
+        self.assertEqual(sorted(cache.devices.keys()), ['1', '8'])
+
+    def test_config_diff(self):
+        cache = self.create_cache()
+        diff = cache.get_config_diff("eltako:\n  light:\n", "ha.yaml")
+        self.assertIn("+eltako:", diff)
+
+        self.assertEqual(cache.get_config_diff("eltako:\n  light:\n", "ha.yaml"), "")
+
+        diff = cache.get_config_diff("eltako:\n  cover:\n", "ha.yaml")
+        self.assertIn("-  light:", diff)
+        self.assertIn("+  cover:", diff)
+        self.assertIn("ha.yaml (previous)", diff)
@@ -0,0 +1,101 @@
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+from eltakobus import *
+# the discovery tool disables the Home Assistant part of the integration which is used by other tests,
+# so the integration is imported completely before
+import custom_components.eltako
+
+# the discovery tool is a script which imports its modules from its own directory
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'eltakodevice_discovery'))
+with mock.patch.dict(os.environ):
+    from ha_discovery import AdaptiveTimeout, AdaptiveTimeoutBus, fast_enumerate_bus, FAST_SCAN_RETRIES, MIN_FAST_SCAN_TIMEOUT, DEFAULT_FAST_SCAN_TIMEOUT
+
+
+class BusMock(RS485SerialInterfaceV2):
+    """Answers discovery requests of the given devices without a serial connection."""
+
+    def __init__(self, devices: dict[int, int], lost_replies: list[int]=()):
+        # serial port is not opened
+        self.devices = devices
+        self.lost_replies = list(lost_replies)
+        self.requests = []
+        self.timeouts = []
+
+    async def exchange(self, request, responsetype=None, retries=3, timeout=1.0):
+        for _ in range(retries):
+            self.requests.append(request.address)
+            self.timeouts.append(timeout)
+            if request.address in self.lost_replies:
+                self.lost_replies.remove(request.address)
+                continue
+            if request.address in self.devices:
+                return EltakoDiscoveryReply(request.address, self.devices[request.address], 0, b'\x00\x00\x00\x00', False)
+        return None
+
+
+def enumerate_addresses(bus: BusMock) -> list[int]:
+    async def run():
+        return [dev.address async for dev in fast_enumerate_bus(bus)]
+    return asyncio.run(run())
+
+
+class TestAdaptiveTimeout(unittest.TestCase):
+
+    def test_limits(self):
+        timeout = AdaptiveTimeout()
+        self.assertEqual(timeout.timeout, DEFAULT_FAST_SCAN_TIMEOUT)
+
+        timeout.add_latency(0.01)
+        self.assertEqual(timeout.timeout, MIN_FAST_SCAN_TIMEOUT)
+
+        timeout.add_latency(10)
+        self.assertEqual(timeout.timeout, DEFAULT_FAST_SCAN_TIMEOUT)
+
+    def test_learns_latency(self):
+        timeout = AdaptiveTimeout()
+        for _ in range(50):
+            timeout.add_latency(0.2)
+        self.assertAlmostEqual(timeout.timeout, 0.2, places=2)
+
+        # variation of the latency increases the timeout
+        timeout.add_latency(0.4)
+        self.assertGreater(timeout.timeout, 0.4)
+
+
+class TestAdaptiveTimeoutBus(unittest.TestCase):
+
+    def test_exchange(self):
+        bus = BusMock({3: 1})
+        timeout = AdaptiveTimeout()
+        timeout_bus = AdaptiveTimeoutBus(bus, timeout, retries=2)
+
+        response = asyncio.run(timeout_bus.exchange(EltakoDiscoveryRequest(address=3), EltakoDiscoveryReply))
+        self.assertEqual(response.reported_address, 3)
+        self.assertEqual(bus.timeouts, [DEFAULT_FAST_SCAN_TIMEOUT])
+        # latency of the reply is learned
+        self.assertLess(timeout.timeout, DEFAULT_FAST_SCAN_TIMEOUT)
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(timeout_bus.exchange(EltakoDiscoveryRequest(address=4), EltakoDiscoveryReply))
+        self.assertEqual(bus.requests, [3, 4, 4])
+
+
+class TestFastEnumerateBus(unittest.TestCase):
+
+    def test_channels_are_skipped(self):
+        bus = BusMock({1: 4, 5: 1, 8: 2, 255: 4})
+        self.assertEqual(enumerate_addresses(bus), [1, 5, 8, 255])
+
+        for address in [2, 3, 4, 9]:
+            self.assertNotIn(address, bus.requests)
+        # empty addresses are requested twice
+        self.assertEqual(bus.requests.count(6), FAST_SCAN_RETRIES)
+        self.assertEqual(bus.requests.count(5), 1)
+
+    def test_lost_reply(self):
+        bus = BusMock({1: 1, 7: 1}, lost_replies=[7])
+        self.assertEqual(enumerate_addresses(bus), [1, 7])
+        self.assertEqual(bus.requests.count(7), 2)
@@ -0,0 +1,73 @@
+import os
+import time
+import unittest
+from eltakobus.device import SensorInfo, KeyFunction
+from eltakodevice_discovery.ymalRepresentation import HaConfig, EEP_MAPPING
+
+DEVICE_COUNT = 250
+SENSORS_PER_DEVICE = 128
+SENDER_BASE_ADDRESS = 0x0000B000
+
+
+def create_sensors(dev_id: int) -> list[SensorInfo]:
+    """Sensor entries as read from the memory of an actuator, distributed over three function groups."""
+    dev_adr = dev_id.to_bytes(4, 'big')
+    return [SensorInfo(sensor_id=(0xFEDB0000 + dev_id * SENSORS_PER_DEVICE + i).to_bytes(4, 'big'), dev_type='FSR14_4x', dev_id=dev_id, dev_adr=dev_adr,
+                       key=i, key_func=KeyFunction.UNIVERSAL_PUSH_BUTTON, channel=1, in_func_group=1 + i % 3, memory_line=i)
+            for i in range(SENSORS_PER_DEVICE)]
+
+
+def find_sensors_linear(sensors: list[SensorInfo], dev_id: int, in_func_group: int) -> list[SensorInfo]:
+    return [s for s in sensors if int.from_bytes(s.dev_adr, "big") == dev_id and s.in_func_group == in_func_group]
+
+
+class TestDiscoveryHaConfig(unittest.TestCase):
+
+    def test_find_device_info(self):
+        config = HaConfig(SENDER_BASE_ADDRESS)
+        # first mapping of a hardware type is used
+        self.assertIs(config.find_device_info('FTS14EM'), EEP_MAPPING[0])
+        self.assertEqual(config.find_device_info('FSB14')['eep'], 'G5-3F-7F')
+        self.assertIsNone(config.find_device_info('unknown'))
+
+    def test_find_sensors(self):
+        config = HaConfig(SENDER_BASE_ADDRESS)
+        config.add_sensors(create_sensors(1))
+        config.add_sensors(create_sensors(2))
+
+        self.assertEqual(len(config.find_sensors(1, 1)), 43)
+        self.assertEqual(config.find_sensors(2, 3), find_sensors_linear(config.collected_sensor_list, 2, 3))
+        self.assertEqual(config.find_sensor(2, 2).memory_line, 1)
+        self.assertIsNone(config.find_sensor(3, 1))
+
+    def test_250_devices(self):
+        """Indexed lookups return the same sensors as linear scans for 250 devices with 128 sensor entries each."""
+        config = HaConfig(SENDER_BASE_ADDRESS)
+        for dev_id in range(1, DEVICE_COUNT + 1):
+            config.add_sensors(create_sensors(dev_id))
+
+        indexed = [config.find_sensors(dev_id, 1) for dev_id in range(1, DEVICE_COUNT + 1)]
+        linear = [find_sensors_linear(config.collected_sensor_list, dev_id, 1) for dev_id in range(1, DEVICE_COUNT + 1)]
+        self.assertEqual(indexed, linear)
+
+    @unittest.skipUnless(os.environ.get('ELTAKO_BENCHMARK'), "set ELTAKO_BENCHMARK to run benchmarks")
+    def test_benchmark_250_devices(self):
+        """Compare indexed lookups with linear scans for 250 devices with 128 sensor entries each."""
+        config = HaConfig(SENDER_BASE_ADDRESS)
+        start = time.perf_counter()
+        for dev_id in range(1, DEVICE_COUNT + 1):
+            config.add_sensors(create_sensors(dev_id))
+        add_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = [config.find_sensors(dev_id, 1) for dev_id in range(1, DEVICE_COUNT + 1)]
+        indexed_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        linear = [find_sensors_linear(config.collected_sensor_list, dev_id, 1) for dev_id in range(1, DEVICE_COUNT + 1)]
+        linear_duration = time.perf_counter() - start
+
+        print(f"\n{DEVICE_COUNT} devices x {SENSORS_PER_DEVICE} sensors: add {add_duration * 1000:.1f} ms, "
+              f"lookups indexed {indexed_duration * 1000:.2f} ms, linear {linear_duration * 1000:.1f} ms")
+        self.assertEqual(indexed, linear)
+        self.assertLess(indexed_duration, linear_duration)
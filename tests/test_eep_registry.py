@@ -0,0 +1,48 @@
+import unittest
+import inspect
+from unittest import mock
+from eltakobus.eep import *
+from custom_components.eltako.eep_registry import EEPRegistry, get_eep_registry
+
+
+class TestEEPRegistry(unittest.TestCase):
+
+    def test_find(self):
+        registry = get_eep_registry()
+        self.assertIs(registry, get_eep_registry())
+
+        entry = registry.find('H5-3F-7F')
+        self.assertEqual(entry.eep, H5_3F_7F)
+        self.assertIs(registry.find('h5_3f_7f'), entry)
+        self.assertIsNone(registry.find('XX-XX-XX'))
+        self.assertIsNone(registry.find(None))
+
+    def test_init_args_match_signature(self):
+        registry = EEPRegistry()
+        self.assertGreater(len(registry), 0)
+
+        for eep_string in ['A5-10-06', 'A5-38-08', 'F6-02-01', 'H5-3F-7F', 'A5-12-01']:
+            entry = registry.find(eep_string)
+            sig = inspect.signature(entry.eep.__init__)
+            expected = [p.name for p in sig.parameters.values() if p.kind == p.POSITIONAL_OR_KEYWORD and p.name != 'self']
+            self.assertEqual(list(entry.init_args), expected)
+
+        provided, missing = registry.find('H5-3F-7F').get_init_args({'time': 10, 'id': 'FF-00-00-01'})
+        self.assertEqual(provided, {'time': 10})
+        self.assertNotIn('time', missing)
+        self.assertTrue(all(v == 0 for v in missing.values()))
+
+    def test_signature_is_inspected_once(self):
+        """The constructor arguments of an EEP are only analysed on the first lookup."""
+        data = {'id': 'FF-DD-CC-BB', 'eep': 'A5-10-06', 'current_temp': 21, 'target_temp': 22}
+        registry = EEPRegistry()
+
+        with mock.patch('custom_components.eltako.eep_registry.inspect.signature', wraps=inspect.signature) as signature_mock, \
+             mock.patch('custom_components.eltako.eep_registry.EEP.find', wraps=EEP.find) as find_mock:
+            for _ in range(0, 100):
+                entry = registry.find(data['eep'])
+                provided, missing = entry.get_init_args(data)
+
+        self.assertEqual(signature_mock.call_count, 1)
+        find_mock.assert_not_called()
+        self.assertEqual(provided, {'current_temp': 21, 'target_temp': 22})
@@ -0,0 +1,121 @@
+import unittest
+import asyncio
+import threading
+import time
+from unittest import mock, IsolatedAsyncioTestCase
+from tests.mocks import *
+from custom_components.eltako.backoff import ExponentialBackoff
+from custom_components.eltako.gateway_statistics import STATISTIC_RECONNECT_COUNT, STATISTIC_RECONNECT_DURATION
+
+
+class ThreadBusMock(EltakoBusMock):
+    """Bus whose thread needs some time to exit after it was stopped."""
+
+    def __init__(self, stop_duration: float):
+        super().__init__()
+        self.stop_duration = stop_duration
+        self.started = False
+        self._stopped = threading.Event()
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self._is_active = False
+
+    def is_alive(self):
+        return self.started and not self._stopped.is_set()
+
+    def join(self, timeout=None):
+        # blocks like Thread.join()
+        if self.stop_duration <= timeout:
+            time.sleep(self.stop_duration)
+            self._stopped.set()
+        else:
+            time.sleep(timeout)
+
+
+class TestGatewayReconnect(IsolatedAsyncioTestCase):
+
+    def create_gateway(self, stop_duration: float) -> GatewayMock:
+        gw = GatewayMock()
+        gw.hass.loop = asyncio.get_running_loop()
+        gw._bus = ThreadBusMock(stop_duration)
+        gw._bus.start()
+        gw._init_bus = lambda: setattr(gw, '_bus', ThreadBusMock(stop_duration))
+        return gw
+
+    async def count_ticks(self, ticks: list, stop: asyncio.Event):
+        while not stop.is_set():
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def test_reconnect_does_not_block_event_loop(self):
+        gw = self.create_gateway(stop_duration=0.3)
+        old_bus = gw._bus
+
+        ticks = []
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(self.count_ticks(ticks, stop))
+        await gw.async_reconnect()
+        stop.set()
+        await ticker
+
+        # event loop kept running while the bus thread was stopped
+        self.assertGreater(len(ticks), 10)
+        self.assertFalse(old_bus.is_alive())
+        self.assertIsNot(gw._bus, old_bus)
+        self.assertTrue(gw._bus.started)
+
+        self.assertEqual(gw.statistics.get(STATISTIC_RECONNECT_COUNT), 1)
+        self.assertGreaterEqual(gw.statistics.get(STATISTIC_RECONNECT_DURATION), 300)
+
+    async def test_stuck_bus_thread(self):
+        gw = self.create_gateway(stop_duration=10)
+        old_bus = gw._bus
+
+        with mock.patch('custom_components.eltako.gateway.BUS_STOP_TIMEOUT', 0.1):
+            start = time.monotonic()
+            await gw.async_reconnect()
+            self.assertLess(time.monotonic() - start, 1)
+
+        # the old thread is abandoned
+        self.assertTrue(old_bus.is_alive())
+        self.assertTrue(gw._bus.started)
+
+    async def test_reconnect_backoff(self):
+        gw = self.create_gateway(stop_duration=0)
+        gw._is_running = True
+
+        gw._schedule_reconnect(False)
+        handle = gw._reconnect_handle
+        self.assertIsNotNone(handle)
+        # only one reconnect is scheduled at a time
+        gw._schedule_reconnect(False)
+        self.assertIs(gw._reconnect_handle, handle)
+        self.assertEqual(gw._reconnect_backoff.attempts, 1)
+
+        gw._schedule_reconnect(True)
+        self.assertIsNone(gw._reconnect_handle)
+        self.assertTrue(handle.cancelled())
+        self.assertEqual(gw._reconnect_backoff.attempts, 0)
+
+    async def test_unload(self):
+        gw = self.create_gateway(stop_duration=0.1)
+        gw._is_running = True
+        gw.dispatcher_disconnect_handle = mock.Mock()
+        bus = gw._bus
+
+        await gw.async_unload()
+        self.assertFalse(bus.is_alive())
+        self.assertFalse(gw._is_running)
+        self.assertIsNone(gw.dispatcher_disconnect_handle)
+
+
+class TestExponentialBackoff(unittest.TestCase):
+
+    def test_delays(self):
+        backoff = ExponentialBackoff(10, 300)
+        self.assertEqual([backoff.next_delay() for i in range(7)], [10, 20, 40, 80, 160, 300, 300])
+        backoff.reset()
+        self.assertEqual(backoff.next_delay(), 10)
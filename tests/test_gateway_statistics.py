@@ -0,0 +1,67 @@
+import unittest
+import asyncio
+from datetime import datetime
+from unittest import mock
+from tests.mocks import *
+from homeassistant.helpers.entity import Entity
+from homeassistant.const import Platform, EntityCategory
+from homeassistant.components.sensor import SensorStateClass
+from custom_components.eltako.sensor import GatewayLastReceivedMessage, GatewayReceivedMessagesInActiveSession, GatewayStatisticSensor
+from custom_components.eltako.gateway_statistics import GatewayStatistics, STATISTIC_SEND_QUEUE_DEPTH, STATISTIC_RECONNECT_COUNT
+from eltakobus import *
+
+# mock update of Home Assistant
+Entity.schedule_update_ha_state = mock.Mock(return_value=None)
+
+
+class TestGatewayStatistics(unittest.TestCase):
+
+    def test_only_changed_values_are_flushed(self):
+        stats = GatewayStatistics()
+        received = []
+
+        async def listener(value):
+            received.append(value)
+
+        stats.add_listener('count', listener)
+        for _ in range(0, 10):
+            stats.increment('count')
+
+        self.assertEqual(asyncio.run(stats.async_flush()), 1)
+        self.assertEqual(asyncio.run(stats.async_flush()), 0)
+        stats.increment('count')
+        self.assertEqual(asyncio.run(stats.async_flush()), 1)
+        self.assertEqual(received, [10, 11])
+
+    def test_state_writes_are_bounded_under_burst(self):
+        gateway = GatewayMock()
+        count_sensor = GatewayReceivedMessagesInActiveSession(Platform.SENSOR, gateway)
+        last_msg_sensor = GatewayLastReceivedMessage(Platform.SENSOR, gateway)
+        count_sensor.schedule_update_ha_state = mock.Mock(return_value=None)
+        last_msg_sensor.schedule_update_ha_state = mock.Mock(return_value=None)
+
+        msg = RPSMessage(b'\xfe\xdb\xb6\x40', status=b'\x30', data=b'\x70')
+        gateway.hass.loop = mock.Mock()
+        for _ in range(0, 1000):
+            gateway._callback_receive_message_from_serial_bus(msg)
+
+        # nothing is written before the statistics are flushed
+        self.assertEqual(count_sensor.schedule_update_ha_state.call_count, 0)
+        self.assertEqual(last_msg_sensor.schedule_update_ha_state.call_count, 0)
+
+        asyncio.run(gateway.statistics.async_flush())
+
+        self.assertEqual(count_sensor.native_value, 1000)
+        self.assertIsInstance(last_msg_sensor.native_value, datetime)
+        self.assertEqual(count_sensor.schedule_update_ha_state.call_count, 1)
+        self.assertEqual(last_msg_sensor.schedule_update_ha_state.call_count, 1)
+
+    def test_statistic_sensors(self):
+        gateway = GatewayMock()
+        depth = GatewayStatisticSensor(Platform.SENSOR, gateway, STATISTIC_SEND_QUEUE_DEPTH, "Send Queue Depth")
+        reconnects = GatewayStatisticSensor(Platform.SENSOR, gateway, STATISTIC_RECONNECT_COUNT, "Reconnects", state_class=SensorStateClass.TOTAL_INCREASING)
+
+        self.assertEqual(depth.state_class, SensorStateClass.MEASUREMENT)
+        self.assertEqual(reconnects.state_class, SensorStateClass.TOTAL_INCREASING)
+        self.assertEqual(depth.entity_category, EntityCategory.DIAGNOSTIC)
+        self.assertEqual(reconnects.entity_category, EntityCategory.DIAGNOSTIC)
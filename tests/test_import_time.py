@@ -0,0 +1,67 @@
+import unittest
+import json
+import os
+import subprocess
+import sys
+from custom_components.eltako.const import PLATFORMS
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = 'custom_components.eltako'
+
+# modules of optional features which must not be loaded when the integration is imported
+LAZY_MODULES = [
+    f'{PACKAGE}.simulated_bus',
+    f'{PACKAGE}.telegram_recorder',
+    f'{PACKAGE}.latency',
+    'esp2_gateway_adapter',
+]
+
+# time budget for executing the module code of the integration itself (libraries not included)
+# only checked if ELTAKO_BENCHMARK is set because it depends on the machine
+OWN_MODULES_BUDGET_MS = 150
+
+
+def get_imported_modules(modules: list[str]) -> list[str]:
+    """Import the modules in a new interpreter and return all modules which are loaded afterwards."""
+    code = f"import importlib, json, sys; [importlib.import_module(m) for m in {modules!r}]; print(json.dumps(list(sys.modules)))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=REPO_DIR, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def measure_import(module: str) -> dict[str, tuple[int, int]]:
+    """Import the module in a new interpreter like Home Assistant does and return self and cumulative time in µs per module."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=REPO_DIR, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        times[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_integration_import(self):
+        times = measure_import(PACKAGE)
+        self.assertIn(f'{PACKAGE}.gateway', times)
+
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, times, f"{module} should only be imported when it is used.")
+
+    def test_platform_import(self):
+        platforms = [f'{PACKAGE}.{platform}' for platform in PLATFORMS]
+        modules = get_imported_modules(platforms)
+        self.assertIn(f'{PACKAGE}.sensor', modules)
+
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, modules, f"{module} should only be imported when it is used.")
+
+    @unittest.skipUnless(os.environ.get('ELTAKO_BENCHMARK'), "set ELTAKO_BENCHMARK to run benchmarks")
+    def test_integration_import_time(self):
+        times = measure_import(PACKAGE)
+        own_time_ms = sum(t[0] for m, t in times.items() if m.startswith(PACKAGE)) / 1000.0
+        self.assertLess(own_time_ms, OWN_MODULES_BUDGET_MS)
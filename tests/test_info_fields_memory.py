@@ -0,0 +1,107 @@
+import unittest
+import os
+import tracemalloc
+from unittest import mock
+from tests.mocks import *
+from homeassistant.helpers.entity import Entity
+from homeassistant.const import CONF_ID, CONF_NAME, Platform
+from custom_components.eltako.sensor import *
+from custom_components.eltako.diagnostics import get_gateway_diagnostics
+from custom_components.eltako.device_index import DeviceIndex
+
+# mock update of Home Assistant
+Entity.schedule_update_ha_state = mock.Mock(return_value=None)
+
+DEVICE_COUNT = 600
+
+# memory budget per configured device, only checked if ELTAKO_BENCHMARK is set because it depends on the Python version
+DEVICE_INDEX_BUDGET_BYTES = 8 * 1024
+INFO_FIELDS_BUDGET_BYTES = 16 * 1024
+
+
+def create_device_config(count: int) -> dict:
+    return {
+        Platform.BINARY_SENSOR: [
+            {CONF_ID: f'FE-DB-{i // 256:02X}-{i % 256:02X}', CONF_EEP: 'F6-02-01', CONF_NAME: f'switch {i}'} for i in range(count)
+        ],
+    }
+
+
+def create_info_fields(gateway: GatewayMock) -> list[EltakoSensor]:
+    entities = []
+    for device in gateway.device_index.get_all_entries():
+        dev_conf = device.config
+        event_id = config_helpers.get_bus_event_type(gateway.dev_id, EVENT_BUTTON_PRESSED, dev_conf.id)
+        entities.append(StaticInfoField(Platform.SENSOR, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, "Event Id", event_id, "mdi:form-textbox"))
+        entities.append(StaticInfoField(Platform.SENSOR, gateway, dev_conf.id, dev_conf.name, dev_conf.eep, "Id", b2s(dev_conf.id[0]), "mdi:identifier"))
+    return entities
+
+
+def measure(function):
+    """Return the result of the function and the bytes which are still allocated afterwards."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+class TestInfoFieldsMemory(unittest.TestCase):
+
+    def test_shared_descriptions(self):
+        gateway = GatewayMock()
+        gateway.device_index = DeviceIndex(create_device_config(3))
+        entities = create_info_fields(gateway)
+
+        id_fields = [e for e in entities if e.entity_description.key == "Id"]
+        self.assertEqual(len(id_fields), 3)
+        self.assertTrue(all(e.entity_description is id_fields[0].entity_description for e in id_fields))
+
+        # static values are not registered for telegrams
+        self.assertEqual(len(id_fields[0].listen_to_addresses), 0)
+        self.assertEqual(id_fields[0].native_value, 'FE-DB-00-00')
+
+    @unittest.skipUnless(os.environ.get('ELTAKO_BENCHMARK'), "set ELTAKO_BENCHMARK to run benchmarks")
+    def test_memory_per_device(self):
+        gateway = GatewayMock()
+        config = create_device_config(DEVICE_COUNT)
+
+        gateway.device_index, index_bytes = measure(lambda: DeviceIndex(config))
+        entities, info_fields_bytes = measure(lambda: create_info_fields(gateway))
+        self.assertEqual(len(entities), 2 * DEVICE_COUNT)
+
+        index_per_device = index_bytes / DEVICE_COUNT
+        info_fields_per_device = info_fields_bytes / DEVICE_COUNT
+        self.assertLess(index_per_device, DEVICE_INDEX_BUDGET_BYTES)
+        self.assertLess(info_fields_per_device, INFO_FIELDS_BUDGET_BYTES)
+
+    def test_remove_disabled_info_entities(self):
+        gateway = GatewayMock()
+        gateway.device_index = DeviceIndex(create_device_config(2))
+        entities = create_info_fields(gateway)
+        registered = {e.unique_id: e.entity_id for e in entities[:3]}
+
+        entity_registry = mock.Mock()
+        entity_registry.async_get_entity_id.side_effect = lambda platform, domain, unique_id: registered.get(unique_id)
+        with mock.patch('custom_components.eltako.sensor.er.async_get', return_value=entity_registry):
+            self.assertEqual(remove_device_info_entities(None, gateway), 3)
+
+        removed = [c.args[0] for c in entity_registry.async_remove.call_args_list]
+        self.assertEqual(sorted(removed), sorted(registered.values()))
+
+    def test_diagnostics(self):
+        gateway = GatewayMock()
+        gateway.device_index = DeviceIndex(create_device_config(2))
+
+        diagnostics = get_gateway_diagnostics(gateway)
+        self.assertEqual(diagnostics['gateway']['base_id'], 'FF-AA-80-00')
+        self.assertEqual(len(diagnostics['devices']), 2)
+
+        device = diagnostics['devices'][1]
+        self.assertEqual(device['id'], 'FE-DB-00-01')
+        self.assertEqual(device['eep'], 'F6-02-01')
+        self.assertEqual(device['platform'], Platform.BINARY_SENSOR)
+        self.assertEqual(device['event_id'], 'eltako.gw_123.btn_pressed.sid_FE-DB-00-01')
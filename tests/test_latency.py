@@ -0,0 +1,73 @@
+import unittest
+import time
+from unittest import mock
+from eltakobus.eep import *
+from custom_components.eltako.latency import *
+
+
+class TestLatency(unittest.TestCase):
+
+    def test_histogram(self):
+        histogram = LatencyHistogram()
+        self.assertIsNone(histogram.percentile(50))
+        self.assertEqual(histogram.summary(), {'count': 0, 'p50': None, 'p95': None, 'p99': None})
+
+        # 1ms .. 100ms
+        for i in range(1, 101):
+            histogram.record(i / 1000.0)
+        self.assertEqual(histogram.count, 100)
+
+        for p in PERCENTILES:
+            # reported value is upper bound of the bucket
+            self.assertGreaterEqual(histogram.percentile(p), p / 1000.0)
+            self.assertLessEqual(histogram.percentile(p), p / 1000.0 * 1.26)
+
+        # out of range values
+        histogram.record(0)
+        histogram.record(1000.0)
+        self.assertEqual(histogram.percentile(100), 1000.0)
+        self.assertEqual(len(histogram._counts), LatencyHistogram.BUCKETS_PER_DECADE * LatencyHistogram.DECADES + 2)
+
+    def test_tracker_stages(self):
+        tracker = LatencyTracker()
+
+        with mock.patch('custom_components.eltako.latency.time.perf_counter') as perf_counter:
+            # received at 10.000, dispatched at 10.002, decoded at 10.003, state at 10.005
+            perf_counter.return_value = 10.002
+            tracker.telegram_dispatched(10.0)
+            perf_counter.return_value = 10.003
+            tracker.telegram_decoded()
+            perf_counter.return_value = 10.004
+            # only first decode and state update are recorded
+            tracker.telegram_decoded()
+            perf_counter.return_value = 10.005
+            tracker.state_scheduled(A5_38_08)
+            tracker.state_scheduled(A5_38_08)
+            tracker.telegram_done()
+
+            # state updates outside of telegram processing are ignored
+            tracker.telegram_decoded()
+            tracker.state_scheduled(A5_38_08)
+
+        snapshot = tracker.snapshot()
+        for stage, expected_ms in [(STAGE_BUS_TO_DISPATCH, 2), (STAGE_DISPATCH_TO_DECODE, 1), (STAGE_DECODE_TO_STATE, 2), (STAGE_TOTAL, 5)]:
+            self.assertEqual(snapshot[stage]['count'], 1)
+            self.assertAlmostEqual(snapshot[stage]['p50'], expected_ms, delta=expected_ms * 0.26)
+        self.assertEqual(list(snapshot['eep'].keys()), ['A5-38-08'])
+        self.assertEqual(snapshot['eep']['A5-38-08']['count'], 1)
+
+    def test_tracker_overhead(self):
+        tracker = LatencyTracker()
+        count = 10000
+
+        start = time.perf_counter()
+        for i in range(count):
+            tracker.telegram_dispatched(time.perf_counter())
+            tracker.telegram_decoded()
+            tracker.state_scheduled(F6_02_01)
+            tracker.telegram_done()
+        duration = time.perf_counter() - start
+
+        self.assertEqual(tracker.stages[STAGE_TOTAL].count, count)
+        # a few microseconds per telegram
+        self.assertLess(duration / count, 100e-6)
@@ -0,0 +1,56 @@
+import unittest
+from custom_components.eltako.const import *
+from custom_components.eltako.measurement_filter import MeasurementFilter
+
+
+class TestMeasurementFilter(unittest.TestCase):
+
+    def test_from_config(self):
+        self.assertIsNone(MeasurementFilter.from_config({}))
+        self.assertIsNone(MeasurementFilter.from_config({CONF_AGGREGATION: AGGREGATION_MEAN}))
+
+        f = MeasurementFilter.from_config({CONF_MIN_PUBLISH_INTERVAL: 60, CONF_AGGREGATION: AGGREGATION_MAX})
+        self.assertEqual(f.min_publish_interval, 60)
+        self.assertEqual(f.aggregation, AGGREGATION_MAX)
+
+    def test_min_publish_interval(self):
+        f = MeasurementFilter(min_publish_interval=10)
+
+        # first value is published immediately
+        self.assertEqual(f.add(100, now=0), 100)
+        self.assertIsNone(f.add(200, now=1))
+        self.assertIsNone(f.add(300, now=10))
+        self.assertEqual(f.add(400, now=11), 400)
+        self.assertEqual(f.last_raw_value, 400)
+
+    def test_aggregation(self):
+        values = [(100, 1), (200, 2), (600, 11)]
+        expected = {AGGREGATION_LAST: 600, AGGREGATION_MEAN: 300, AGGREGATION_MIN: 100, AGGREGATION_MAX: 600}
+
+        for aggregation, result in expected.items():
+            f = MeasurementFilter(min_publish_interval=10, aggregation=aggregation)
+            f.add(0, now=0)
+            published = [f.add(v, now=t) for v, t in values]
+            self.assertEqual(published, [None, None, result], aggregation)
+
+    def test_deadband(self):
+        f = MeasurementFilter(deadband=5)
+        self.assertEqual(f.add(100, now=0), 100)
+        self.assertIsNone(f.add(104, now=1))
+        self.assertIsNone(f.add(96, now=2))
+        # deviation is measured against the last published value
+        self.assertEqual(f.add(106, now=3), 106)
+
+        f = MeasurementFilter(deadband_relative=10)
+        self.assertEqual(f.add(1000, now=0), 1000)
+        self.assertIsNone(f.add(1090, now=1))
+        self.assertEqual(f.add(890, now=2), 890)
+
+    def test_constant_memory(self):
+        f = MeasurementFilter(min_publish_interval=3600, aggregation=AGGREGATION_MEAN)
+        f.add(0, now=0)
+        size = len(vars(f))
+        for i in range(10000):
+            f.add(i % 10, now=1 + i * 0.1)
+        self.assertEqual(len(vars(f)), size)
+        self.assertAlmostEqual(f.add(4.5, now=3601), 4.5)
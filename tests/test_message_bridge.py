@@ -0,0 +1,99 @@
+import asyncio
+import os
+import threading
+import time
+import unittest
+from tests.mocks import HassMock
+from custom_components.eltako.message_bridge import MessageBridge
+
+BURST_SIZE = 10000
+
+
+def push_burst(call, count: int) -> None:
+    """Push a burst of frames from a separate thread like the serial bus does."""
+    thread = threading.Thread(target=lambda: [call(i) for i in range(count)])
+    thread.start()
+    thread.join()
+
+
+class TestMessageBridge(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.hass = HassMock()
+        self.hass.loop = asyncio.get_running_loop()
+
+    async def test_calls_are_executed_in_order(self):
+        bridge = MessageBridge(self.hass)
+        received = []
+
+        bridge.call_soon(received.append, 1)
+        bridge.call_soon(lambda: 1 / 0)
+        bridge.call_soon(received.append, 2)
+        self.assertEqual(received, [])
+
+        await asyncio.sleep(0)
+        # a failing call does not stop the others
+        self.assertEqual(received, [1, 2])
+        self.assertEqual(bridge.wakeup_count, 1)
+        self.assertEqual(len(bridge), 0)
+
+        # the next call wakes up the loop again
+        bridge.call_soon(received.append, 3)
+        await asyncio.sleep(0)
+        self.assertEqual(received, [1, 2, 3])
+        self.assertEqual(bridge.wakeup_count, 2)
+
+    async def test_no_frame_is_lost_while_draining(self):
+        bridge = MessageBridge(self.hass)
+        received = []
+
+        def push_slowly():
+            for i in range(BURST_SIZE):
+                bridge.call_soon(received.append, i)
+                # give the loop the chance to drain in between
+                time.sleep(0)
+
+        thread = threading.Thread(target=push_slowly)
+        thread.start()
+        while thread.is_alive() or len(bridge) > 0:
+            await asyncio.sleep(0.001)
+        thread.join()
+
+        self.assertEqual(received, list(range(BURST_SIZE)))
+        self.assertEqual(bridge.call_count, BURST_SIZE)
+
+    async def test_burst_wakes_up_loop_once(self):
+        """A burst pushed from another thread results in one loop wake-up instead of one per frame."""
+        bridge = MessageBridge(self.hass)
+        received = []
+        push_burst(lambda i: bridge.call_soon(received.append, i), BURST_SIZE)
+        while len(received) < BURST_SIZE:
+            await asyncio.sleep(0)
+
+        self.assertEqual(received, list(range(BURST_SIZE)))
+        # the loop does not run while the burst is pushed, so the whole burst is drained at once
+        self.assertEqual(bridge.wakeup_count, 1)
+
+    @unittest.skipUnless(os.environ.get('ELTAKO_BENCHMARK'), "set ELTAKO_BENCHMARK to run benchmarks")
+    async def test_benchmark_burst(self):
+        """Compare loop wake-ups and dispatch throughput of the bridge with one call_soon_threadsafe per frame."""
+        loop = asyncio.get_running_loop()
+
+        received = []
+        start = time.perf_counter()
+        push_burst(lambda i: loop.call_soon_threadsafe(received.append, i), BURST_SIZE)
+        while len(received) < BURST_SIZE:
+            await asyncio.sleep(0)
+        direct_duration = time.perf_counter() - start
+
+        bridge = MessageBridge(self.hass)
+        received = []
+        start = time.perf_counter()
+        push_burst(lambda i: bridge.call_soon(received.append, i), BURST_SIZE)
+        while len(received) < BURST_SIZE:
+            await asyncio.sleep(0)
+        bridge_duration = time.perf_counter() - start
+
+        print(f"\n{BURST_SIZE} frames: call_soon_threadsafe {BURST_SIZE} wake-ups, {BURST_SIZE / direct_duration:.0f} frames/s, "
+              f"bridge {bridge.wakeup_count} wake-ups, {BURST_SIZE / bridge_duration:.0f} frames/s")
+        self.assertEqual(received, list(range(BURST_SIZE)))
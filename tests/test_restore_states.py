@@ -0,0 +1,59 @@
+import asyncio
+import unittest
+from unittest import mock
+from tests.mocks import *
+from homeassistant.helpers.entity import Entity
+from homeassistant.const import Platform
+from custom_components.eltako.device import restore_last_states
+from custom_components.eltako.binary_sensor import EltakoBinarySensor
+from eltakobus import *
+
+
+class StoredStateMock():
+    def __init__(self, state:str):
+        self.state = LatestStateMock(state)
+
+
+class TestRestoreStates(unittest.TestCase):
+
+    def create_binary_sensors(self, count: int) -> list[EltakoBinarySensor]:
+        gateway = GatewayMock()
+        return [EltakoBinarySensor(Platform.BINARY_SENSOR, gateway, AddressExpression.parse(f'FE-34-21-{i:02X}'), "Switch", F6_02_01, None, False)
+                for i in range(count)]
+
+    def restore(self, entities: list[EltakoBinarySensor], last_states: dict) -> int:
+        restore_data = mock.Mock(last_states=last_states)
+        entity_registry = mock.Mock()
+        entity_registry.async_get_entity_id.return_value = None
+        with mock.patch('custom_components.eltako.device.restore_state.async_get', return_value=restore_data), \
+             mock.patch('custom_components.eltako.device.er.async_get', return_value=entity_registry):
+            return restore_last_states(None, entities, Platform.BINARY_SENSOR)
+
+    @mock.patch.object(Entity, 'schedule_update_ha_state')
+    def test_restore_without_state_writes(self, write_mock):
+        entities = self.create_binary_sensors(3)
+        last_states = {
+            entities[0].entity_id: StoredStateMock('on'),
+            entities[1].entity_id: StoredStateMock('off'),
+        }
+
+        self.assertEqual(self.restore(entities, last_states), 2)
+        self.assertEqual([e.is_on for e in entities], [True, False, None])
+        write_mock.assert_not_called()
+
+        # states are written normally after restore
+        entities[0]._attr_is_on = False
+        entities[0].schedule_update_ha_state()
+        self.assertEqual(write_mock.call_count, 1)
+
+    def test_entities_are_not_restored_again(self):
+        entities = self.create_binary_sensors(1)
+        self.restore(entities, {})
+
+        # the entity without stored state must not look up its state again when it is added
+        e = entities[0]
+        e.async_get_last_state = mock.AsyncMock()
+        e.gateway.telegram_router.register = mock.Mock()
+        with mock.patch.object(Entity, 'async_added_to_hass', mock.AsyncMock()):
+            asyncio.run(e.async_added_to_hass())
+        e.async_get_last_state.assert_not_called()
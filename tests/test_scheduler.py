@@ -0,0 +1,67 @@
+import unittest
+import asyncio
+from tests.mocks import HassLoopMock
+from custom_components.eltako.scheduler import PeriodicScheduler
+
+
+class TestPeriodicScheduler(unittest.TestCase):
+
+    def run_jobs(self, job_count:int, interval:float, telegrams_per_second:float, duration:float) -> list[tuple[int, float]]:
+        runs = []
+
+        async def run():
+            hass = HassLoopMock()
+            scheduler = PeriodicScheduler(hass, telegrams_per_second)
+
+            for i in range(0, job_count):
+                async def job(i=i):
+                    runs.append((i, hass.loop.time()))
+                scheduler.register(job, interval)
+
+            await asyncio.sleep(duration)
+            scheduler.cancel()
+
+        asyncio.run(run())
+        return runs
+
+    def test_jobs_are_spread_across_interval(self):
+        job_count = 5
+        interval = 0.5
+        runs = self.run_jobs(job_count, interval, telegrams_per_second=1000, duration=1.2)
+
+        # every job runs in every interval
+        for i in range(0, job_count):
+            self.assertGreaterEqual(len([r for r in runs if r[0] == i]), 2)
+
+        # jobs don't run at once but with an offset of interval / job count
+        gaps = [b[1] - a[1] for a, b in zip(runs, runs[1:])]
+        self.assertGreater(min(gaps), interval / job_count * 0.8)
+
+    def test_telegram_budget_is_respected(self):
+        # 5 jobs per 0.1s would be 50 telegrams/s but budget is 10 telegrams/s
+        runs = self.run_jobs(job_count=5, interval=0.1, telegrams_per_second=10, duration=0.55)
+
+        gaps = [b[1] - a[1] for a, b in zip(runs, runs[1:])]
+        self.assertGreater(min(gaps), 0.1 * 0.9)
+        self.assertLessEqual(len(runs), 6)
+
+    def test_unregister(self):
+        runs = []
+
+        async def run():
+            hass = HassLoopMock()
+            scheduler = PeriodicScheduler(hass, 1000)
+
+            async def job():
+                runs.append(1)
+            unregister = scheduler.register(job, 0.05)
+            await asyncio.sleep(0.12)
+            unregister()
+            self.assertEqual(scheduler.job_count, 0)
+            count = len(runs)
+            await asyncio.sleep(0.12)
+            self.assertEqual(len(runs), count)
+            scheduler.cancel()
+
+        asyncio.run(run())
+        self.assertGreaterEqual(len(runs), 1)
@@ -51,6 +51,45 @@ class TestSendMessageService(unittest.IsolatedAsyncioTestCase):
             await g.async_service_send_message(event, True)
 
 
+    async def test_send_messages(self):
+        g = self.create_gateway()
+        sent = []
+        g.send_messages = lambda msgs, priority: sent.extend(msgs)
+
+        event = EventMock('service_name', {
+            'messages': [
+                {'id': 'FF-DD-CC-01', 'eep': 'F6-02-01', 'rocker_first_action': 1, 'energy_bow': 1},
+                {'id': 'no id', 'eep': 'F6-02-01'},
+                {'id': 'FF-DD-CC-02', 'eep': 'XX-XX-XX'},
+                {'id': 'FF-DD-CC-03', 'eep': 'H5-3F-7F', 'time': 10, 'command': 1},
+            ]
+        })
+        response = await g.async_service_send_messages(event)
+
+        self.assertEqual([r['success'] for r in response['results']], [True, False, False, True])
+        self.assertIn('error', response['results'][1])
+        self.assertEqual(len(sent), 2)
+        self.assertEqual(sent[0].address, b'\xff\xdd\xcc\x01')
+        self.assertEqual(sent[1].address, b'\xff\xdd\xcc\x03')
+
+    async def test_send_messages_atomic(self):
+        g = self.create_gateway()
+        sent = []
+        g.send_messages = lambda msgs, priority: sent.extend(msgs)
+
+        event = EventMock('service_name', {
+            'atomic': True,
+            'messages': [
+                {'id': 'FF-DD-CC-01', 'eep': 'H5-3F-7F', 'time': 10, 'command': 1},
+                {'id': 'FF-DD-CC-02', 'eep': 'XX-XX-XX'},
+            ]
+        })
+        response = await g.async_service_send_messages(event)
+
+        self.assertEqual([r['success'] for r in response['results']], [False, False])
+        self.assertEqual(len(sent), 0)
+
+
     async def test_write_eep_params_to_docs_file(self):
         text  = '# Paramters for EEPs in Send Message Events \n'
         
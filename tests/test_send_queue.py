@@ -0,0 +1,81 @@
+import unittest
+import asyncio
+from tests.mocks import *
+from eltakobus import *
+from custom_components.eltako.send_queue import SendQueue, SendPriority
+from custom_components.eltako.gateway_statistics import GatewayStatistics, STATISTIC_SEND_QUEUE_DEPTH, STATISTIC_SEND_QUEUE_WAIT_TIME
+
+
+class TestSendQueue(unittest.TestCase):
+
+    def create_msg(self, i:int) -> RPSMessage:
+        return RPSMessage(i.to_bytes(4, 'big'), status=b'\x30', data=b'\x70')
+
+    def test_interactive_messages_overtake_bulk_traffic(self):
+        sent = []
+        stats = GatewayStatistics()
+
+        async def run():
+            async def send(msg):
+                sent.append(msg)
+
+            queue = SendQueue(HassLoopMock(), send, 1000, stats)
+            # scene switching 40 lights
+            for i in range(0, 40):
+                queue.put(self.create_msg(i), SendPriority.AUTOMATION)
+            queue.put(self.create_msg(1000), SendPriority.PERIODIC)
+            queue.put(self.create_msg(2000), SendPriority.INTERACTIVE)
+            self.assertEqual(queue.depth, 42)
+
+            await asyncio.sleep(0.2)
+            queue.cancel()
+
+        asyncio.run(run())
+        self.assertEqual(len(sent), 42)
+        self.assertEqual(sent[0].address, (2000).to_bytes(4, 'big'))
+        # same priority keeps order
+        self.assertEqual([m.address for m in sent[1:41]], [i.to_bytes(4, 'big') for i in range(0, 40)])
+        self.assertEqual(sent[-1].address, (1000).to_bytes(4, 'big'))
+        self.assertEqual(stats.get(STATISTIC_SEND_QUEUE_DEPTH), 0)
+        self.assertIsNotNone(stats.get(STATISTIC_SEND_QUEUE_WAIT_TIME))
+
+    def test_interactive_message_queued_while_rate_limited(self):
+        sent = []
+
+        async def run():
+            async def send(msg):
+                sent.append(msg)
+
+            queue = SendQueue(HassLoopMock(), send, 10, GatewayStatistics())
+            queue.put(self.create_msg(1), SendPriority.AUTOMATION)
+            await asyncio.sleep(0.01)
+            # first telegram is sent, the next one has to wait for the rate limit
+            queue.put(self.create_msg(2), SendPriority.PERIODIC)
+            await asyncio.sleep(0.01)
+            queue.put(self.create_msg(3), SendPriority.INTERACTIVE)
+
+            await asyncio.sleep(0.3)
+            queue.cancel()
+
+        asyncio.run(run())
+        self.assertEqual([m.address for m in sent], [i.to_bytes(4, 'big') for i in [1, 3, 2]])
+
+    def test_rate_limit(self):
+        sent_times = []
+
+        async def run():
+            hass = HassLoopMock()
+            async def send(msg):
+                sent_times.append(hass.loop.time())
+
+            queue = SendQueue(hass, send, 20, GatewayStatistics())
+            for i in range(0, 5):
+                queue.put(self.create_msg(i))
+
+            await asyncio.sleep(0.35)
+            queue.cancel()
+
+        asyncio.run(run())
+        self.assertEqual(len(sent_times), 5)
+        gaps = [b - a for a, b in zip(sent_times, sent_times[1:])]
+        self.assertGreaterEqual(min(gaps), 0.05 * 0.9)
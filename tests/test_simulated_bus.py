@@ -0,0 +1,190 @@
+import unittest
+import asyncio
+import os
+import statistics
+import time
+from unittest import IsolatedAsyncioTestCase
+from eltakobus.eep import *
+from eltakobus.message import ESP2Message
+from homeassistant.const import CONF_ID, CONF_NAME, Platform
+from custom_components.eltako.const import *
+from custom_components.eltako.decode_cache import MessageDecodeCache
+from custom_components.eltako.device_index import DeviceIndex
+from custom_components.eltako.simulated_bus import SimulatedBus, SimulatedDevice
+from custom_components.eltako.telegram_router import TelegramRouter
+
+
+def create_device_config(device_count: int) -> dict:
+    """Create a configuration with an equal mix of all simulated device types."""
+    config = {p: [] for p in [Platform.BINARY_SENSOR, Platform.SENSOR, Platform.COVER, Platform.CLIMATE, Platform.LIGHT, Platform.SWITCH]}
+    for i in range(device_count):
+        dev_id = f"00-00-{(i >> 8) & 0xFF:02X}-{i & 0xFF:02X}"
+        sender_id = f"00-00-B{(i >> 8) & 0xF:01X}-{i & 0xFF:02X}"
+        kind = i % 7
+        if kind == 0:
+            config[Platform.BINARY_SENSOR].append({CONF_ID: dev_id, CONF_EEP: 'F6-02-01', CONF_NAME: f"rocker {i}"})
+        elif kind == 1:
+            config[Platform.SENSOR].append({CONF_ID: dev_id, CONF_EEP: 'A5-12-01', CONF_NAME: f"meter {i}"})
+        elif kind == 2:
+            config[Platform.SENSOR].append({CONF_ID: dev_id, CONF_EEP: 'A5-13-01', CONF_NAME: f"weather {i}"})
+        elif kind == 3:
+            config[Platform.COVER].append({CONF_ID: dev_id, CONF_EEP: 'G5-3F-7F', CONF_NAME: f"cover {i}",
+                                           CONF_SENDER: {CONF_ID: sender_id, CONF_EEP: 'H5-3F-7F'}})
+        elif kind == 4:
+            config[Platform.CLIMATE].append({CONF_ID: dev_id, CONF_EEP: 'A5-10-06', CONF_NAME: f"climate {i}",
+                                             CONF_SENDER: {CONF_ID: sender_id, CONF_EEP: 'A5-10-06'}})
+        elif kind == 5:
+            config[Platform.LIGHT].append({CONF_ID: dev_id, CONF_EEP: 'A5-38-08', CONF_NAME: f"dimmer {i}",
+                                           CONF_SENDER: {CONF_ID: sender_id, CONF_EEP: 'A5-38-08'}})
+        else:
+            config[Platform.SWITCH].append({CONF_ID: dev_id, CONF_EEP: 'M5-38-08', CONF_NAME: f"switch {i}",
+                                            CONF_SENDER: {CONF_ID: sender_id, CONF_EEP: 'F6-02-01'}})
+    return config
+
+
+class EntityMock():
+    """Decodes telegrams like an entity does and measures the latency."""
+
+    def __init__(self, eep, decode_cache: MessageDecodeCache, sent_at: dict):
+        self.eep = eep
+        self.decode_cache = decode_cache
+        self.sent_at = sent_at
+        self.latencies = []
+
+    def _message_received_callback(self, msg):
+        self.decode_cache.decode(self.eep, msg)
+        self.latencies.append(time.perf_counter() - self.sent_at[id(msg)][0])
+
+
+class TestSimulatedBus(IsolatedAsyncioTestCase):
+
+    def test_generated_telegrams(self):
+        for eep in [F6_02_01, A5_12_01, A5_13_01, G5_3F_7F, A5_10_06, A5_38_08, M5_38_08]:
+            device = SimulatedDevice(b'\x00\x00\x00\x01', eep)
+            msgs = device.generate()
+            self.assertGreater(len(msgs), 0)
+            for msg in msgs:
+                self.assertEqual(msg.address, b'\x00\x00\x00\x01')
+                eep.decode_message(msg)
+
+        meter = SimulatedDevice(b'\x00\x00\x00\x01', A5_12_01).generate()
+        self.assertEqual(A5_12_01.decode_message(meter[0]).data_type, 0)
+        self.assertEqual(A5_12_01.decode_message(meter[1]).data_type, 1)
+
+        self.assertEqual(SimulatedDevice(b'\x00\x00\x00\x01', A5_04_02).generate(), [])
+
+    def test_actuator_responses(self):
+        # switch
+        device = SimulatedDevice(b'\x00\x00\x00\x01', M5_38_08, b'\x00\x00\xB0\x01', F6_02_01)
+        answers = device.respond(F6_02_01(1, 1, 0, 0).encode_message(b'\x00\x00\xB0\x01'), 0)
+        self.assertEqual(M5_38_08.decode_message(answers[0][1]).state, 1)
+        self.assertEqual(device.respond(F6_02_01(1, 0, 0, 0).encode_message(b'\x00\x00\xB0\x01'), 0), [])
+
+        # dimmer
+        device = SimulatedDevice(b'\x00\x00\x00\x02', A5_38_08, b'\x00\x00\xB0\x02', A5_38_08)
+        cmd = A5_38_08(command=0x02, dimming=CentralCommandDimming(40, 0, 1, 0, 0, 1)).encode_message(b'\x00\x00\xB0\x02')
+        decoded = A5_38_08.decode_message(device.respond(cmd, 0)[0][1])
+        self.assertEqual(decoded.dimming.dimming_value, 40)
+        self.assertEqual(decoded.dimming.learn_button, 1)
+
+        # cover moves up and reports end position after the requested time
+        device = SimulatedDevice(b'\x00\x00\x00\x03', G5_3F_7F, b'\x00\x00\xB0\x03', H5_3F_7F)
+        answers = device.respond(H5_3F_7F(20, 0x01, 1).encode_message(b'\x00\x00\xB0\x03'), 100.0)
+        self.assertEqual([(d, G5_3F_7F.decode_message(m).state) for d, m in answers], [(0, 0x01), (20.0, 0x70)])
+        generation = device.command_generation
+
+        # stop reports driven time in 100ms
+        answers = device.respond(H5_3F_7F(0, 0x00, 1).encode_message(b'\x00\x00\xB0\x03'), 105.0)
+        decoded = G5_3F_7F.decode_message(answers[0][1])
+        self.assertEqual((decoded.time, decoded.direction), (50, 0x01))
+        self.assertGreater(device.command_generation, generation)
+
+        # climate
+        device = SimulatedDevice(b'\x00\x00\x00\x04', A5_10_06, b'\x00\x00\xB0\x04', A5_10_06)
+        cmd = A5_10_06(A5_10_06.Heater_Mode.NORMAL, 24.0, 20.0, False).encode_message(b'\x00\x00\xB0\x04')
+        decoded = A5_10_06.decode_message(device.respond(cmd, 0)[0][1])
+        self.assertAlmostEqual(decoded.target_temperature, 24.0, delta=0.2)
+
+    async def test_bus(self):
+        loop = asyncio.get_running_loop()
+        index = DeviceIndex(create_device_config(14))
+        received: list[ESP2Message] = []
+        status = []
+
+        bus = SimulatedBus(lambda msg: loop.call_soon_threadsafe(received.append, msg), index.get_all_entries, speed=1000, seed=1)
+        bus.set_status_changed_handler(status.append)
+        self.assertFalse(bus.is_active())
+        bus.start()
+
+        while not bus.is_active():
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(bus.devices), 14)
+
+        # cover 3 gets command to go down
+        cover_address = index.get_platform_entries(Platform.COVER)[0].config.id[0]
+        await bus.send(H5_3F_7F(1, 0x02, 1).encode_message(b'\x00\x00\xB0\x03'))
+        await asyncio.sleep(0.2)
+
+        bus.stop()
+        bus.join()
+        # process telegrams still queued in the event loop
+        await asyncio.sleep(0.05)
+        self.assertFalse(bus.is_active())
+        self.assertEqual(status, [False, True, False])
+        self.assertEqual(bus.received_command_count, 1)
+
+        cover_states = [G5_3F_7F.decode_message(m).state for m in received if m.address == cover_address and m.org == 0x05]
+        self.assertIn(0x02, cover_states)
+        self.assertIn(0x50, cover_states)
+        self.assertEqual(len(received), bus.sent_telegram_count)
+
+    async def simulate_devices(self, device_count: int, duration: float) -> tuple[list[float], int, float, float]:
+        """Route and decode telegrams of virtual devices. Returns latencies, telegram count, duration and CPU time."""
+        loop = asyncio.get_running_loop()
+        index = DeviceIndex(create_device_config(device_count))
+        router = TelegramRouter()
+        decode_cache = MessageDecodeCache()
+        sent_at = {}
+
+        entities = []
+        for entry in index.get_all_entries():
+            entity = EntityMock(entry.config.eep, decode_cache, sent_at)
+            router.register(entry.config.id, entity)
+            entities.append(entity)
+
+        def receive(msg):
+            # keep a reference so that the id is not reused
+            sent_at[id(msg)] = (time.perf_counter(), msg)
+            loop.call_soon_threadsafe(router.dispatch, msg)
+
+        bus = SimulatedBus(receive, index.get_all_entries, speed=200, seed=1)
+
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        bus.start()
+        await asyncio.sleep(duration)
+        bus.stop()
+        bus.join()
+        await asyncio.sleep(0.1)
+        duration = time.perf_counter() - start
+        cpu_time = time.process_time() - cpu_start
+
+        latencies = sorted(l for e in entities for l in e.latencies)
+        return latencies, bus.sent_telegram_count, duration, cpu_time
+
+    async def test_1000_devices(self):
+        """Route and decode telegrams of 1000 virtual devices."""
+        latencies, telegram_count, _, _ = await self.simulate_devices(1000, 0.2)
+        self.assertGreater(telegram_count, 0)
+        self.assertEqual(len(latencies), telegram_count)
+
+    @unittest.skipUnless(os.environ.get('ELTAKO_BENCHMARK'), "set ELTAKO_BENCHMARK to run benchmarks")
+    async def test_benchmark_1000_devices(self):
+        """Measure throughput, latency and CPU time of routing and decoding telegrams of 1000 virtual devices."""
+        latencies, telegram_count, duration, cpu_time = await self.simulate_devices(1000, 1.0)
+        self.assertEqual(len(latencies), telegram_count)
+
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(f"\n1000 devices: {telegram_count / duration:.0f} telegrams/s, "
+              f"latency p50 {quantiles[49] * 1000:.2f} ms, p95 {quantiles[94] * 1000:.2f} ms, p99 {quantiles[98] * 1000:.2f} ms, "
+              f"CPU {cpu_time / telegram_count * 1e6:.1f} µs/telegram")
@@ -0,0 +1,86 @@
+import unittest
+from unittest import mock
+from tests.mocks import *
+from homeassistant.helpers.entity import Entity
+from homeassistant.const import Platform
+from custom_components.eltako.device import EltakoEntity
+from custom_components.eltako.gateway_statistics import STATISTIC_SUPPRESSED_STATE_WRITES
+from custom_components.eltako.sensor import EltakoWeatherStation, SENSOR_DESC_WEATHER_STATION_TEMPERATURE
+from eltakobus import *
+
+
+class TestStateWriteSuppression(unittest.TestCase):
+
+    def create_entity(self, general_settings: dict = DEFAULT_GENERAL_SETTINGS) -> EltakoEntity:
+        gw = GatewayMock(general_settings)
+        return EltakoEntity(Platform.BINARY_SENSOR, gw, AddressExpression.parse('FE-34-21-01'), "Switch", F6_02_01)
+
+    @mock.patch.object(Entity, 'schedule_update_ha_state')
+    def test_unchanged_state_is_not_written(self, write_mock):
+        ee = self.create_entity()
+
+        ee._attr_is_on = True
+        ee.schedule_update_ha_state()
+        ee.schedule_update_ha_state()
+        self.assertEqual(write_mock.call_count, 1)
+
+        ee._attr_is_on = False
+        ee.schedule_update_ha_state()
+        self.assertEqual(write_mock.call_count, 2)
+
+        # attributes changed in place are detected as well
+        ee._attr_extra_state_attributes = {'a': 1}
+        ee.schedule_update_ha_state()
+        ee._attr_extra_state_attributes['a'] = 2
+        ee.schedule_update_ha_state()
+        self.assertEqual(write_mock.call_count, 4)
+
+        # forced refreshs are always written
+        ee.schedule_update_ha_state(force_refresh=True)
+        self.assertEqual(write_mock.call_count, 5)
+
+        self.assertEqual(ee.gateway.statistics.get(STATISTIC_SUPPRESSED_STATE_WRITES), 1)
+
+    @mock.patch.object(Entity, 'schedule_update_ha_state')
+    def test_keep_alive_interval(self, write_mock):
+        settings = dict(DEFAULT_GENERAL_SETTINGS)
+        settings[CONF_STATE_KEEP_ALIVE_INTERVAL] = 60
+        ee = self.create_entity(settings)
+        ee._attr_is_on = True
+
+        with mock.patch('custom_components.eltako.device.time.monotonic') as monotonic:
+            monotonic.return_value = 1000.0
+            ee.schedule_update_ha_state()
+            monotonic.return_value = 1059.0
+            ee.schedule_update_ha_state()
+            self.assertEqual(write_mock.call_count, 1)
+
+            monotonic.return_value = 1060.0
+            ee.schedule_update_ha_state()
+            self.assertEqual(write_mock.call_count, 2)
+
+    @mock.patch.object(Entity, 'schedule_update_ha_state')
+    def test_suppression_disabled(self, write_mock):
+        settings = dict(DEFAULT_GENERAL_SETTINGS)
+        settings[CONF_SUPPRESS_UNCHANGED_STATES] = False
+        ee = self.create_entity(settings)
+
+        for i in range(3):
+            ee.schedule_update_ha_state()
+        self.assertEqual(write_mock.call_count, 3)
+        self.assertIsNone(ee.gateway.statistics.get(STATISTIC_SUPPRESSED_STATE_WRITES))
+
+    @mock.patch.object(Entity, 'schedule_update_ha_state')
+    def test_repeated_weather_station_telegrams(self, write_mock):
+        ews = EltakoWeatherStation(Platform.SENSOR, GatewayMock(), AddressExpression.parse("51-E8-00-01"), "dev name",
+                                   EEP.find("A5-13-01"), SENSOR_DESC_WEATHER_STATION_TEMPERATURE)
+        msg = Regular4BSMessage(address=b'\x05\x1e\x83\x15', status=b'\x00', data=b'\x0f\x7d\x07\x1a', outgoing=False)
+        other_msg = Regular4BSMessage(address=b'\x05\x1e\x83\x15', status=b'\x00', data=b'\x0f\x80\x07\x1a', outgoing=False)
+
+        for i in range(10):
+            ews.value_changed(msg)
+        self.assertEqual(write_mock.call_count, 1)
+
+        ews.value_changed(other_msg)
+        self.assertEqual(write_mock.call_count, 2)
+        self.assertEqual(ews.gateway.statistics.get(STATISTIC_SUPPRESSED_STATE_WRITES), 9)
@@ -0,0 +1,112 @@
+import unittest
+import threading
+from unittest import mock
+from tests.mocks import GatewayMock
+from eltakobus.message import Regular4BSMessage, RPSMessage
+from custom_components.eltako.telegram_deduplicator import TelegramDeduplicator
+
+
+class TestTelegramDeduplicator(unittest.TestCase):
+
+    def test_window(self):
+        dedup = TelegramDeduplicator(window=0.5)
+        gw1, gw2 = object(), object()
+        msg = RPSMessage(b'\xFE\xDB\xB6\x40', 0x30, b'\x70')
+
+        self.assertFalse(dedup.is_duplicate(msg, gw1, now=100.0))
+        # same telegram received by a second gateway via a repeater
+        self.assertTrue(dedup.is_duplicate(RPSMessage(b'\xFE\xDB\xB6\x40', 0x31, b'\x70'), gw2, now=100.1))
+        # button released
+        self.assertFalse(dedup.is_duplicate(RPSMessage(b'\xFE\xDB\xB6\x40', 0x20, b'\x00'), gw2, now=100.2))
+        # other sender
+        self.assertFalse(dedup.is_duplicate(RPSMessage(b'\xFE\xDB\xB6\x41', 0x30, b'\x70'), gw2, now=100.2))
+        # button pressed again after the window
+        self.assertFalse(dedup.is_duplicate(msg, gw2, now=100.6))
+        self.assertTrue(dedup.is_duplicate(msg, gw1, now=101.0))
+
+        self.assertEqual(dedup.dropped_count, 2)
+
+    def test_repeat_on_same_gateway(self):
+        dedup = TelegramDeduplicator(window=0.5)
+        gw1, gw2 = object(), object()
+        msg = RPSMessage(b'\xFE\xDB\xB6\x40', 0x30, b'\x70')
+
+        # rocker pressed twice within the window
+        self.assertFalse(dedup.is_duplicate(msg, gw1, now=100.0))
+        self.assertFalse(dedup.is_duplicate(msg, gw1, now=100.2))
+        # copy of the second press received by another gateway
+        self.assertTrue(dedup.is_duplicate(msg, gw2, now=100.3))
+        self.assertEqual(dedup.dropped_count, 1)
+
+    def test_first_gateway_without_entities(self):
+        dedup = TelegramDeduplicator(window=0.5)
+        gw1, gw2, gw3 = object(), object(), object()
+        msg = RPSMessage(b'\xFE\xDB\xB6\x40', 0x30, b'\x70')
+
+        # first gateway has no entities for the sender, so the second one gets the telegram as well
+        self.assertFalse(dedup.is_duplicate(msg, gw1, handled=False, now=100.0))
+        self.assertFalse(dedup.is_duplicate(msg, gw2, handled=True, now=100.1))
+        self.assertTrue(dedup.is_duplicate(msg, gw3, handled=True, now=100.2))
+        self.assertEqual(dedup.dropped_count, 1)
+
+    def test_capacity(self):
+        dedup = TelegramDeduplicator(window=10, capacity=100)
+        for i in range(1000):
+            msg = Regular4BSMessage(b'\x00\x00\x00\x01', 0x00, i.to_bytes(4, 'big'))
+            self.assertFalse(dedup.is_duplicate(msg, 'gw1', now=float(i) / 1000))
+        self.assertEqual(len(dedup), 100)
+
+        # oldest telegrams were forgotten, latest ones are still known
+        self.assertFalse(dedup.is_duplicate(Regular4BSMessage(b'\x00\x00\x00\x01', 0x00, (0).to_bytes(4, 'big')), 'gw2', now=1.0))
+        self.assertTrue(dedup.is_duplicate(Regular4BSMessage(b'\x00\x00\x00\x01', 0x00, (999).to_bytes(4, 'big')), 'gw2', now=1.0))
+
+    def test_several_gateway_threads(self):
+        dedup = TelegramDeduplicator(window=60)
+        msgs = [Regular4BSMessage(b'\x00\x00\x00\x01', 0x00, i.to_bytes(4, 'big')) for i in range(500)]
+        forwarded = []
+
+        def gateway_thread(gateway_id: int):
+            for msg in msgs:
+                if not dedup.is_duplicate(msg, gateway_id):
+                    forwarded.append(msg)
+
+        threads = [threading.Thread(target=gateway_thread, args=(i,)) for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # every telegram is forwarded by exactly one gateway
+        self.assertEqual(len(forwarded), 500)
+        self.assertEqual(dedup.dropped_count, 1000)
+
+
+class TestGatewayDeduplication(unittest.TestCase):
+
+    def create_gateway(self, dedup: TelegramDeduplicator, dev_id: int) -> GatewayMock:
+        gw = GatewayMock(dev_id=dev_id)
+        gw._telegram_deduplicator = dedup
+        # dispatch directly instead of via the event loop
+        gw._message_bridge.call_soon = lambda function, *args: function(*args)
+        return gw
+
+    def test_device_configured_on_second_gateway_only(self):
+        dedup = TelegramDeduplicator(window=10)
+        gw1 = self.create_gateway(dedup, 1)
+        gw2 = self.create_gateway(dedup, 2)
+        entity = mock.Mock()
+        gw2.telegram_router.register(b'\xFE\xDB\xB6\x40', entity)
+
+        msg = RPSMessage(b'\xFE\xDB\xB6\x40', 0x30, b'\x70')
+        gw1._process_received_message(msg)
+        gw2._process_received_message(RPSMessage(b'\xFE\xDB\xB6\x40', 0x31, b'\x70'))
+        self.assertEqual(entity._message_received_callback.call_count, 1)
+
+        # second press received by the same gateway is passed on
+        gw2._process_received_message(msg)
+        self.assertEqual(entity._message_received_callback.call_count, 2)
+        self.assertEqual(dedup.dropped_count, 0)
+
+        # copy of a telegram handled by the second gateway is dropped by the first one
+        gw1._process_received_message(msg)
+        self.assertEqual(dedup.dropped_count, 1)
@@ -0,0 +1,111 @@
+import unittest
+import asyncio
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+from eltakobus.message import ESP2Message, Regular4BSMessage, RPSMessage
+from custom_components.eltako.telegram_recorder import *
+
+
+class TestTelegramRecorder(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, 'telegrams.log')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_record_and_read(self):
+        recorder = TelegramRecorder(self.filename, max_bytes=1024)
+        msg1 = Regular4BSMessage(b'\xFF\xFF\x00\x80', 0x00, b'\x99\x02\x12\x09')
+        msg2 = RPSMessage(b'\xFE\xDB\xB6\x40', 0x30, b'\x70', outgoing=True)
+        recorder.record(TelegramDirection.RECEIVED, msg1, timestamp=1000.0)
+        recorder.record(TelegramDirection.SENT, msg2, timestamp=1000.5)
+
+        # nothing written before flush
+        self.assertFalse(os.path.exists(self.filename))
+        recorder.close()
+
+        # header + 2 * (11 bytes record header + 14 bytes frame)
+        self.assertEqual(os.path.getsize(self.filename), len(FILE_HEADER) + 2 * 25)
+
+        records = read_telegram_records(self.filename)
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0].timestamp, 1000.0)
+        self.assertEqual(records[0].direction, TelegramDirection.RECEIVED)
+        self.assertEqual(records[0].frame, msg1.serialize())
+        self.assertEqual(records[1].direction, TelegramDirection.SENT)
+        self.assertEqual(records[1].to_message().serialize(), msg2.serialize())
+        self.assertEqual(type(records[0].to_message()), Regular4BSMessage)
+
+    def test_truncated_and_invalid_file(self):
+        recorder = TelegramRecorder(self.filename, max_bytes=1024)
+        msg = Regular4BSMessage(b'\xFF\xFF\x00\x80', 0x00, b'\x99\x02\x12\x09')
+        recorder.record(TelegramDirection.RECEIVED, msg)
+        recorder.record(TelegramDirection.RECEIVED, msg)
+        recorder.close()
+
+        # e.g. power loss while writing
+        with open(self.filename, 'r+b') as f:
+            f.truncate(os.path.getsize(self.filename) - 3)
+        self.assertEqual(len(read_telegram_records(self.filename)), 1)
+
+        with open(self.filename, 'wb') as f:
+            f.write(b'something else')
+        self.assertRaises(ValueError, read_telegram_records, self.filename)
+
+    def test_rotation(self):
+        # space for 4 telegrams per file
+        recorder = TelegramRecorder(self.filename, max_bytes=len(FILE_HEADER) + 4 * 25, backup_count=2)
+        msg = Regular4BSMessage(b'\xFF\xFF\x00\x80', 0x00, b'\x99\x02\x12\x09')
+
+        for i in range(14):
+            recorder.record(TelegramDirection.RECEIVED, msg, timestamp=float(i))
+            if i % 2 == 1:
+                recorder.flush()
+        recorder.close()
+
+        self.assertTrue(os.path.exists(self.filename + '.1'))
+        self.assertTrue(os.path.exists(self.filename + '.2'))
+        self.assertFalse(os.path.exists(self.filename + '.3'))
+
+        # oldest file was dropped, records are not split across files
+        self.assertEqual([r.timestamp for r in read_telegram_records(self.filename + '.2')], [4.0, 5.0, 6.0, 7.0])
+        self.assertEqual([r.timestamp for r in read_telegram_records(self.filename + '.1')], [8.0, 9.0, 10.0, 11.0])
+        self.assertEqual([r.timestamp for r in read_telegram_records(self.filename)], [12.0, 13.0])
+
+    def test_buffer_limit(self):
+        recorder = TelegramRecorder(self.filename, max_bytes=50)
+        msg = Regular4BSMessage(b'\xFF\xFF\x00\x80', 0x00, b'\x99\x02\x12\x09')
+        for i in range(10):
+            recorder.record(TelegramDirection.RECEIVED, msg)
+        self.assertEqual(recorder.record_count, 3)
+        self.assertEqual(recorder.dropped_count, 7)
+
+    async def test_replay(self):
+        msg = Regular4BSMessage(b'\xFF\xFF\x00\x80', 0x00, b'\x99\x02\x12\x09')
+        records = [TelegramRecord(100.0 + i * 0.1, TelegramDirection.RECEIVED, msg.serialize()) for i in range(5)]
+        records.append(TelegramRecord(100.2, TelegramDirection.SENT, msg.serialize()))
+        records.append(TelegramRecord(100.3, TelegramDirection.RECEIVED, b'\x00\x01'))
+
+        received = []
+        loop = asyncio.get_running_loop()
+
+        # as fast as possible, sent and invalid telegrams are skipped
+        start = loop.time()
+        count = await async_replay_telegrams(records, received.append, speed=None)
+        self.assertEqual(count, 5)
+        self.assertEqual([m.serialize() for m in received], [msg.serialize()] * 5)
+        self.assertLess(loop.time() - start, 0.1)
+
+        # 0.4 seconds recorded with 4x speed
+        received.clear()
+        start = loop.time()
+        count = await async_replay_telegrams(records, received.append, speed=4.0)
+        self.assertEqual(count, 5)
+        self.assertGreaterEqual(loop.time() - start, 0.09)
+
+        received.clear()
+        count = await async_replay_telegrams(records, received.append, speed=None, directions=(TelegramDirection.SENT,))
+        self.assertEqual(count, 1)
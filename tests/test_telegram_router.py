@@ -0,0 +1,89 @@
+import unittest
+import os
+import time
+from tests.mocks import *
+from eltakobus import *
+from custom_components.eltako.telegram_router import TelegramRouter
+
+
+class SubscriberMock():
+
+    def __init__(self):
+        self.received_messages = 0
+
+    def _message_received_callback(self, msg):
+        self.received_messages += 1
+
+
+class TestTelegramRouter(unittest.TestCase):
+
+    def create_router(self, entity_count:int) -> TelegramRouter:
+        router = TelegramRouter()
+        for i in range(0, entity_count):
+            router.register(i.to_bytes(4, 'big'), SubscriberMock())
+        return router
+
+    def test_dispatch_only_to_matching_address(self):
+        router = self.create_router(100)
+        s1 = SubscriberMock()
+        s2 = SubscriberMock()
+        router.register(b'\xfe\xdb\xb6\x40', s1)
+        router.register(AddressExpression.parse('FE-DB-B6-40'), s2)
+
+        msg = RPSMessage(b'\xfe\xdb\xb6\x40', status=b'\x30', data=b'\x70')
+        self.assertEqual(router.dispatch(msg), 2)
+        self.assertEqual(s1.received_messages, 1)
+        self.assertEqual(s2.received_messages, 1)
+
+        msg = RPSMessage(b'\xfe\xdb\xb6\x41', status=b'\x30', data=b'\x70')
+        self.assertEqual(router.dispatch(msg), 0)
+        self.assertEqual(s1.received_messages, 1)
+
+    def test_unregister(self):
+        router = TelegramRouter()
+        s = SubscriberMock()
+        unregister = router.register(b'\x00\x00\x00\x01', s)
+        self.assertEqual(router.address_count, 1)
+
+        unregister()
+        self.assertEqual(router.address_count, 0)
+        self.assertEqual(router.dispatch(RPSMessage(b'\x00\x00\x00\x01', status=b'\x30', data=b'\x70')), 0)
+        self.assertEqual(s.received_messages, 0)
+
+    def test_handlers_per_dispatch(self):
+        """Amount of called entities per telegram must not depend on the total amount of entities."""
+        msg = RPSMessage(b'\xff\xff\xff\xff', status=b'\x30', data=b'\x70')
+
+        for entity_count in [10, 10000]:
+            others = [SubscriberMock() for _ in range(0, entity_count)]
+            router = TelegramRouter()
+            for i, s in enumerate(others):
+                router.register(i.to_bytes(4, 'big'), s)
+            target = SubscriberMock()
+            router.register(msg.address, target)
+
+            for _ in range(0, 100):
+                self.assertEqual(router.dispatch(msg), 1)
+            self.assertEqual(target.received_messages, 100)
+            self.assertEqual(sum(s.received_messages for s in others), 0)
+
+    @unittest.skipUnless(os.environ.get('ELTAKO_BENCHMARK'), "set ELTAKO_BENCHMARK to run benchmarks")
+    def test_dispatch_benchmark(self):
+        """Cost per telegram must not depend on the total amount of entities."""
+        telegram_count = 5000
+        msg = RPSMessage(b'\xff\xff\xff\xff', status=b'\x30', data=b'\x70')
+        durations = {}
+
+        for entity_count in [10, 10000]:
+            router = self.create_router(entity_count)
+            target = SubscriberMock()
+            router.register(msg.address, target)
+
+            start = time.perf_counter()
+            for _ in range(0, telegram_count):
+                router.dispatch(msg)
+            durations[entity_count] = (time.perf_counter() - start) / telegram_count
+            print(f"\n[Telegram Router Benchmark] entities: {entity_count}, time per telegram: {durations[entity_count]*1e6:.2f}µs")
+
+        # generous factor to not fail on noisy machines; a broadcast would be ~1000 times slower
+        self.assertLess(durations[10000], durations[10] * 10)